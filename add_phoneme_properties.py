@@ -7,27 +7,21 @@ to create the phonemes array.
 """
 
 import json
+from collections import defaultdict
 from pathlib import Path
 
+from lexicon import get_lexicon
+from phoneme_segmenter import get_segmenter
+
 
 def load_phonemes():
     """Load all valid vowels and consonants."""
-    repo_root = Path(__file__).parent
-    
-    # Load vowels
-    with open(repo_root / 'language-data' / 'vowels.json', 'r', encoding='utf-8') as f:
-        vowels_data = json.load(f)
+    lexicon = get_lexicon()
     
-    all_vowels = []
-    for group in vowels_data['vowelGroups'].values():
-        for vowel in group['vowels']:
-            all_vowels.append(vowel['letter'])
+    a_group, e_group = lexicon.vowel_groups()
+    all_vowels = a_group + e_group
     
-    # Load consonants
-    with open(repo_root / 'language-data' / 'consonants.json', 'r', encoding='utf-8') as f:
-        consonants_data = json.load(f)
-    
-    all_consonants = [c['letter'] for c in consonants_data['consonants']]
+    all_consonants = [c['letter'] for c in lexicon.consonants()]
     
     # Sort consonants by length (longest first) to handle digraphs correctly
     all_consonants.sort(key=len, reverse=True)
@@ -35,26 +29,21 @@ def load_phonemes():
     return all_consonants, all_vowels
 
 
-def extract_phonemes_from_plain_name(plain_name, syllable_group, consonants):
+def extract_phonemes_from_plain_name(plain_name, syllable_group=None, consonants=None):
     """
     Extract consonant and vowel from plain_name (to preserve tone marks).
     
-    The consonant structure is taken from syllable_group, but the vowel
-    is extracted from plain_name to preserve tone marks.
+    The word is segmented with the shared trie segmenter, which matches
+    digraphs (gb, kp, sh, ...) and dotted vowels with their tone marks in
+    one left-to-right pass. syllable_group and consonants are accepted for
+    backwards compatibility but no longer needed.
     
     Returns: (consonant, vowel_with_tone) tuple
     """
-    # Try to find the consonant by matching longest first in syllable_group
-    for consonant in consonants:
-        if syllable_group.startswith(consonant):
-            # Now extract the vowel from plain_name (which has tone marks)
-            vowel_with_tone = plain_name[len(consonant):]
-            return consonant, vowel_with_tone
-    
-    # Fallback: if no match found, assume first char is consonant
-    # (shouldn't happen with valid data)
-    if len(plain_name) > 1:
-        return plain_name[0], plain_name[1:]
+    phonemes = get_segmenter().segment(plain_name)
+    
+    if len(phonemes) > 1:
+        return phonemes[0], ''.join(phonemes[1:])
     
     return plain_name, ""
 
@@ -79,9 +68,7 @@ def add_new_properties(input_file, output_file):
         plain_name = root['plain_name']
         
         # Extract phonemes from plain_name to preserve tone marks
-        consonant, vowel_with_tone = extract_phonemes_from_plain_name(
-            plain_name, syllable_group, consonants
-        )
+        consonant, vowel_with_tone = extract_phonemes_from_plain_name(plain_name)
         
         # Create updated root with new properties
         updated_root = {
@@ -127,9 +114,13 @@ def main():
     print("-" * 70)
     
     # Show examples
+    by_group = defaultdict(list)
+    for entry in updated:
+        by_group[entry['syllable_group']].append(entry)
+    
     samples = ['ba', 'ma', 'gba', 'kpị', 'shọ', 'gwa']
     for sample in samples:
-        entries = [e for e in updated if e['syllable_group'] == sample]
+        entries = by_group.get(sample, [])
         if entries:
             print(f"\n{sample}:")
             for e in entries[:1]:  # Just show first tone variant
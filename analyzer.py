@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Morphological analysis of surface tokens.
+
+Every surface form the lexicon can produce is precomputed into a reverse
+index (NFC surface -> analyses), so analyzing a token is one dictionary
+probe. The index covers:
+
+- syllables.json (bare roots, with tone),
+- generated-infinitives.json,
+- generated-dialectal-roots.json and generated-dialectal-infinitives.json
+  (combined "x / y" and "x / y / z" forms; dialectal_roots lists the
+  syllables of every member after the first),
+- every prefix + root + suffix combination of the verb-form transducer
+  (see morphology.py), with affixes already in the root's vowel group,
+- the free morphemes (particles and auxiliaries).
+
+A token such as "ịbà" gets one analysis per way it can be built: as the
+infinitive entry ịbà_infinitive and as prefix ị + root bà (syl_ba_003).
+A combined token "ịbà / ịva" that is not itself an entry is analyzed
+side by side.
+
+Usage:
+    from analyzer import get_analyzer
+
+    analyzer = get_analyzer()
+    analyzer.analyze('ịbà')
+    analyzer.analyze_many(tokens)             # one list of analyses per token
+
+    python3 analyzer.py ịbà 'ịbà / ịva'
+    python3 analyzer.py < corpus.txt          # tag every token
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+
+from lexicon import get_lexicon
+from morphology import get_transducer
+
+
+# Separator of the combined forms in the dialectal collections
+VARIANT_SEPARATOR = ' / '
+
+# Corpus tokens: a combined "x / y" or "x / y / z" form or a run of non-space characters
+TOKEN_PATTERN = re.compile(r'\S+(?: / \S+)+|\S+')
+
+
+def normalize_token(token):
+    """Return the index key of a token (NFC, lower case, trimmed)."""
+    return unicodedata.normalize('NFC', token.strip()).lower()
+
+
+def root_analysis(root):
+    """Return the analysis fields shared by every form of a root."""
+    return {
+        'root': root['id'],
+        'root_form': root['plain_name'],
+        'syllable_group': root['syllable_group'],
+        'tone': root['tone'],
+        'vowelGroup': root['vowelGroup'],
+    }
+
+
+class Analyzer:
+    """Reverse index from surface forms to their analyses."""
+
+    def __init__(self, language_data_dir=None):
+        self.lexicon = get_lexicon(language_data_dir)
+        self.transducer = get_transducer(language_data_dir)
+        self.index = {}
+
+        self.roots_by_form = {s['plain_name']: s for s in self.lexicon.syllables}
+
+        self._index_roots()
+        self._index_infinitives()
+        self._index_dialectal()
+        self._index_affixed_forms()
+        self._index_free_morphemes()
+
+    def _add(self, surface, analysis):
+        """Add an analysis under a surface form."""
+        analysis['surface'] = surface
+        self.index.setdefault(normalize_token(surface), []).append(analysis)
+
+    def _root(self, plain_name):
+        """Return the syllable entry of a root form, or None."""
+        return self.roots_by_form.get(plain_name)
+
+    def _index_roots(self):
+        """Index every syllable as a bare root."""
+        for root in self.lexicon.syllables:
+            analysis = {'type': 'root', 'entry': root['id'], 'prefix': None, 'suffixes': []}
+            analysis.update(root_analysis(root))
+            self._add(root['plain_name'], analysis)
+
+    def _index_infinitives(self):
+        """Index the generated infinitives."""
+        for infinitive in self.lexicon.infinitives:
+            root = self._root(infinitive['base_root'])
+            if root is None:
+                continue
+            analysis = {
+                'type': 'infinitive',
+                'entry': infinitive['id'],
+                'prefix': infinitive['prefix'],
+                'suffixes': [],
+            }
+            analysis.update(root_analysis(root))
+            self._add(infinitive['infinitive_form'], analysis)
+
+    def _index_dialectal(self):
+        """Index the combined forms of the dialectal collections."""
+        collections = (
+            ('dialectal_root', self.lexicon.dialectal_roots, 'combined_form', 'variant_forms'),
+            ('dialectal_infinitive', self.lexicon.dialectal_infinitives, 'infinitive_form', 'variant_roots'),
+        )
+        for kind, entries, form_field, variants_field in collections:
+            for entry in entries:
+                root, *variants = (self._root(form) for form in entry[variants_field])
+                if root is None:
+                    continue
+                dialectal_roots = [variant['id'] for variant in variants if variant is not None]
+                analysis = {
+                    'type': kind,
+                    'entry': entry['id'],
+                    'prefix': entry.get('prefix'),
+                    'suffixes': [],
+                    'dialectal_root': dialectal_roots[0] if dialectal_roots else None,
+                    'dialectal_roots': dialectal_roots,
+                }
+                analysis.update(root_analysis(root))
+                self._add(entry[form_field], analysis)
+
+    def _index_affixed_forms(self):
+        """Index every prefix + root + suffix combination with at least one affix."""
+        arcs = self.transducer.arcs
+        for root in self.lexicon.syllables:
+            group = root['vowelGroup']
+            prefixes = [(None, '')] + arcs['prefix'][group]
+            suffixes = [(None, '')] + arcs['suffixes'][group]
+            for prefix_id, prefix in prefixes:
+                for suffix_id, suffix in suffixes:
+                    if prefix_id is None and suffix_id is None:
+                        continue
+                    analysis = {
+                        'type': 'affixed',
+                        'entry': None,
+                        'prefix': prefix or None,
+                        'suffixes': [suffix] if suffix else [],
+                        'morphemes': [m for m in (prefix_id, suffix_id) if m],
+                    }
+                    analysis.update(root_analysis(root))
+                    self._add(prefix + root['plain_name'] + suffix, analysis)
+
+    def _index_free_morphemes(self):
+        """Index particles and auxiliaries, which are words of their own."""
+        for slot, kind in (('particles', 'particle'), ('auxiliary', 'auxiliary')):
+            for group_arcs in self.transducer.arcs[slot].values():
+                for morpheme_id, output in group_arcs:
+                    key = normalize_token(output)
+                    if any(a['entry'] == morpheme_id for a in self.index.get(key, [])):
+                        continue
+                    self._add(output, {
+                        'type': kind,
+                        'entry': morpheme_id,
+                        'prefix': None,
+                        'suffixes': [],
+                        'root': None,
+                        'root_form': output,
+                        'syllable_group': None,
+                        'tone': None,
+                        'vowelGroup': None,
+                    })
+
+    def analyze(self, token):
+        """
+        Return every analysis of a token (an empty list if unknown).
+
+        A combined "x / y" (or "x / y / z") token that has no entry of its
+        own is analyzed side by side; each analysis then records which side
+        it is for.
+        """
+        key = normalize_token(token)
+        analyses = self.index.get(key)
+        if analyses is not None:
+            return list(analyses)
+
+        if VARIANT_SEPARATOR in key:
+            result = []
+            for side, part in enumerate(key.split(VARIANT_SEPARATOR)):
+                for analysis in self.index.get(part.strip(), []):
+                    result.append(dict(analysis, variant=side))
+            return result
+        return []
+
+    def analyze_many(self, tokens):
+        """Analyze a batch of tokens, returning one list of analyses per token."""
+        analyze = self.analyze
+        return [analyze(token) for token in tokens]
+
+    def tag(self, text):
+        """Lazily yield (token, analyses) for every token in a text."""
+        for match in TOKEN_PATTERN.finditer(text):
+            token = match.group()
+            yield token, self.analyze(token)
+
+
+def describe(analysis):
+    """Return a one-line summary of an analysis."""
+    if analysis['root'] is None:
+        return f"{analysis['entry']}: {analysis['type']}"
+    parts = [analysis['prefix'] or '', analysis['root_form'], *analysis['suffixes']]
+    label = analysis['entry'] or analysis['type']
+    return (f"{label}: {' + '.join(p for p in parts if p)} "
+            f"({analysis['root']}, {analysis['tone']}, {analysis['vowelGroup']})")
+
+
+_shared = {}
+
+
+def get_analyzer(language_data_dir=None):
+    """Return a process-wide shared analyzer for a language-data directory."""
+    key = get_lexicon(language_data_dir).language_data_dir
+    if key not in _shared:
+        _shared[key] = Analyzer(key)
+    return _shared[key]
+
+
+def main(argv=None):
+    """Analyze tokens given as arguments, or tag stdin."""
+    parser = argparse.ArgumentParser(description='Analyze Igbo surface forms.')
+    parser.add_argument('tokens', nargs='*', help='tokens to analyze (default: tag stdin)')
+    parser.add_argument('--json', action='store_true', help='print one JSON object per token')
+    args = parser.parse_args(argv)
+
+    analyzer = get_analyzer()
+
+    if args.tokens:
+        tagged = ((token, analyzer.analyze(token)) for token in args.tokens)
+    else:
+        tagged = (pair for line in sys.stdin for pair in analyzer.tag(line))
+
+    out = sys.stdout
+    for token, analyses in tagged:
+        if args.json:
+            out.write(json.dumps({'token': token, 'analyses': analyses}, ensure_ascii=False) + '\n')
+        elif analyses:
+            out.write(f"{token}\t{'; '.join(describe(a) for a in analyses)}\n")
+        else:
+            out.write(f"{token}\t?\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for generation, validation, loading and lookup.
+
+Each stage runs in a fresh Python process inside a temporary copy of the
+repository (scripts and language-data/), so generation and expansion never
+touch the working tree and no stage benefits from another's caches. A stage
+is timed with time.perf_counter() over --repeat runs (best and median are
+kept), then run once more under tracemalloc for its peak traced memory.
+
+Scenarios:
+
+- real: the data as committed (generate_verb_roots.main, validate.main,
+  expand_all_roots over the untoned syllables, JSON/lexicon/snapshot
+  loading, analyzer build, lookups, all dialect views, CVCV and CVCVCV
+  root enumeration, Ndebe transliteration of 8 MB of text and decoding
+  of its transliteration)
+- consonants-10x: consonants.json with every consonant (and its alternation
+  sets) cloned ten times, run through generation, validation, loading and
+  lookup. Validation reports count errors here; that is expected and only
+  its running time matters.
+
+Results are written as JSON to generated/benchmarks/ (one file per run plus
+latest.json), so timings can be compared across commits with --compare.
+
+Usage:
+    python3 benchmark.py                          # all scenarios
+    python3 benchmark.py --scenario real --repeat 5
+    python3 benchmark.py --compare generated/benchmarks/latest.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).parent
+DEFAULT_OUTPUT_DIR = REPO_ROOT / 'generated' / 'benchmarks'
+
+# Lookups per run of the lookup stage
+LOOKUP_COUNT = 20000
+
+# Roots enumerated per run of the polysyllabic stages
+POLYSYLLABIC_LIMIT = 500000
+
+# Approximate UTF-8 size of the text transliterated per run of the ndebe stage
+NDEBE_TEXT_BYTES = 8 << 20
+
+
+def run_generate(workdir):
+    """Regenerate every collection from scratch."""
+    import generate_verb_roots
+    return generate_verb_roots.main(['--force'])
+
+
+def run_validate(workdir):
+    """Validate every JSON file under language-data/."""
+    import validate
+    return validate.main([])
+
+
+def run_expand(workdir):
+    """Expand the untoned roots (see make_workdir) with tone variants."""
+    import expand_tone_variants
+    return len(expand_tone_variants.expand_all_roots(workdir / 'untoned-roots.json', workdir / 'expanded-roots.json'))
+
+
+def run_load_json(workdir):
+    """Parse the collections with json.load, as the test scripts do."""
+    from lexicon import COLLECTION_FILES, load_json
+    return sum(len(load_json(workdir / 'language-data' / rel_path)) for rel_path in COLLECTION_FILES.values())
+
+
+def run_load_lexicon(workdir):
+    """Parse and index the collections."""
+    from lexicon import Lexicon
+    return len(Lexicon(workdir / 'language-data').by_id)
+
+
+def run_load_snapshots(workdir):
+    """Open every snapshot and decode all of its records."""
+    from snapshot import Snapshot
+    count = 0
+    for snap_file in sorted((workdir / 'generated').glob('*.snap')):
+        with Snapshot(snap_file) as snap:
+            count += sum(1 for _ in snap)
+    return count
+
+
+def run_build_analyzer(workdir):
+    """Build the analyzer's reverse index."""
+    from analyzer import Analyzer
+    return len(Analyzer(workdir / 'language-data').index)
+
+
+def run_lookup(workdir):
+    """Answer a random mix of id, field, dialect and folded lookups."""
+    from lexicon import get_lexicon
+    lexicon = get_lexicon(workdir / 'language-data')
+    syllables = lexicon.syllables
+    rng = random.Random(0)
+    for _ in range(LOOKUP_COUNT // 4):
+        entry = rng.choice(syllables)
+        lexicon.get(entry['id'])
+        lexicon.lookup('syllables', 'plain_name', entry['plain_name'])
+        lexicon.lookup_dialect('syllables', entry['plain_name'])
+        lexicon.search('syllables', entry['syllable_group'])
+    return LOOKUP_COUNT
+
+
+def run_dialect_views(workdir):
+    """Project the lexicon onto every dialect."""
+    from dialect_views import build_dialect_view, list_dialects
+    from lexicon import get_lexicon
+    language_data_dir = workdir / 'language-data'
+    dialects = list_dialects(get_lexicon(language_data_dir).consonants())
+    for dialect in dialects:
+        build_dialect_view(dialect, language_data_dir)
+    return len(dialects)
+
+
+def run_polysyllabic(workdir, length):
+    """Generate up to POLYSYLLABIC_LIMIT roots of a given length."""
+    from generate_verb_roots import generate_polysyllabic_roots, load_syllabic_consonants
+    from lexicon import get_lexicon
+    language_data_dir = workdir / 'language-data'
+    roots = generate_polysyllabic_roots(
+        get_lexicon(language_data_dir).syllables, length, load_syllabic_consonants(language_data_dir)
+    )
+    return sum(1 for _ in islice(roots, POLYSYLLABIC_LIMIT))
+
+
+def run_ndebe(workdir):
+    """Stream the random running text (see make_workdir) through the Ndebe transliterator."""
+    from ndebe import Transliterator
+    transliterator = Transliterator.from_file(workdir / 'language-data' / 'ndebe-mapping.json')
+    with open(workdir / 'ndebe-text.txt', 'r', encoding='utf-8') as f:
+        return sum(len(piece) for piece in transliterator.stream(iter(lambda: f.read(1 << 20), '')))
+
+
+def run_ndebe_decode(workdir):
+    """Stream the transliterated running text back to Latin through the Ndebe decoder, as bytes."""
+    from ndebe import NdebeDecoder
+    decoder = NdebeDecoder.from_files(workdir / 'language-data')
+    with open(workdir / 'ndebe-text.ndebe', 'rb') as f:
+        return sum(len(piece) for piece in decoder.stream(iter(lambda: f.read(1 << 20), b'')))
+
+
+STAGES = {
+    'generate': run_generate,
+    'validate': run_validate,
+    'expand': run_expand,
+    'load_json': run_load_json,
+    'load_lexicon': run_load_lexicon,
+    'load_snapshots': run_load_snapshots,
+    'build_analyzer': run_build_analyzer,
+    'lookup': run_lookup,
+    'dialect_views': run_dialect_views,
+    'cvcv': lambda workdir: run_polysyllabic(workdir, 2),
+    'cvcvcv': lambda workdir: run_polysyllabic(workdir, 3),
+    'ndebe': run_ndebe,
+    'ndebe_decode': run_ndebe_decode,
+}
+
+SCENARIOS = {
+    'real': list(STAGES),
+    'consonants-10x': ['generate', 'validate', 'load_lexicon', 'build_analyzer', 'lookup'],
+}
+
+
+def scale_consonants(consonants_data, factor):
+    """
+    Return consonants.json data with every consonant cloned factor times.
+
+    Clone k of a consonant is its letter followed by k (b, b1, b2, ...);
+    alternation sets are cloned alongside, so each copy keeps its own
+    dialectal patterns.
+    """
+    def clone(letter, k):
+        return letter if k == 0 else f"{letter}{k}"
+
+    scaled = []
+    for k in range(factor):
+        for consonant in consonants_data['consonants']:
+            copy = dict(consonant, letter=clone(consonant['letter'], k))
+            if 'uppercase' in copy:
+                copy['uppercase'] = clone(consonant['uppercase'], k)
+            copy['alternation_sets'] = [
+                dict(
+                    alternation,
+                    alternates_with=[clone(a, k) for a in alternation.get('alternates_with', [])],
+                    dialect_distribution={
+                        clone(variant, k): dialects
+                        for variant, dialects in alternation.get('dialect_distribution', {}).items()
+                    },
+                )
+                for alternation in consonant.get('alternation_sets', [])
+            ]
+            scaled.append(copy)
+    return dict(consonants_data, consonants=scaled)
+
+
+def make_workdir(tmp_dir, scenario):
+    """Copy the scripts and language data into tmp_dir and apply a scenario."""
+    workdir = Path(tmp_dir) / scenario
+    workdir.mkdir()
+    for script in REPO_ROOT.glob('*.py'):
+        shutil.copy2(script, workdir / script.name)
+    shutil.copytree(REPO_ROOT / 'language-data', workdir / 'language-data')
+
+    if scenario == 'consonants-10x':
+        consonants_file = workdir / 'language-data' / 'consonants.json'
+        with open(consonants_file, 'r', encoding='utf-8') as f:
+            consonants_data = json.load(f)
+        with open(consonants_file, 'w', encoding='utf-8') as f:
+            json.dump(scale_consonants(consonants_data, 10), f, ensure_ascii=False, indent=2)
+
+    # Later stages read what generation writes, so start from a fresh build
+    run_child(workdir, 'generate', repeat=1, measure_memory=False)
+
+    # prime-verb-roots.json is still a placeholder, so expansion runs over
+    # the mid-tone (unmarked) syllables, which it expands back to all tones
+    with open(workdir / 'language-data' / 'syllables.json', 'r', encoding='utf-8') as f:
+        untoned = [s for s in json.load(f) if s['tone'] == 'mid']
+    with open(workdir / 'untoned-roots.json', 'w', encoding='utf-8') as f:
+        json.dump(untoned, f, ensure_ascii=False)
+
+    # Running text for the ndebe stage: random lines of syllables and infinitives
+    from lexicon import Lexicon
+    lexicon = Lexicon(workdir / 'language-data')
+    words = [s['plain_name'] for s in lexicon.syllables] + [i['infinitive_form'] for i in lexicon.infinitives]
+    rng = random.Random(0)
+    size = 0
+    with open(workdir / 'ndebe-text.txt', 'w', encoding='utf-8') as f:
+        while size < NDEBE_TEXT_BYTES:
+            line = ' '.join(rng.choices(words, k=12)).capitalize() + '.\n'
+            f.write(line)
+            size += len(line.encode('utf-8'))
+
+    # Its transliteration, for the ndebe_decode stage
+    from ndebe import Transliterator
+    transliterator = Transliterator.from_file(workdir / 'language-data' / 'ndebe-mapping.json')
+    with open(workdir / 'ndebe-text.txt', 'r', encoding='utf-8') as src, \
+            open(workdir / 'ndebe-text.ndebe', 'w', encoding='utf-8') as dst:
+        transliterator.transliterate_file(src, dst)
+    return workdir
+
+
+def measure(stage, workdir, repeat, measure_memory):
+    """Run a stage in this process and return its timings and peak memory."""
+    function = STAGES[stage]
+    times = []
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            began = time.perf_counter()
+            result = function(workdir)
+            times.append(time.perf_counter() - began)
+
+    peak = None
+    if measure_memory:
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            function(workdir)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'best_seconds': round(min(times), 6),
+        'median_seconds': round(statistics.median(times), 6),
+        'runs': repeat,
+        'peak_bytes': peak,
+        'result': result,
+    }
+
+
+def run_child(workdir, stage, repeat, measure_memory=True):
+    """Measure one stage in a fresh interpreter inside workdir."""
+    command = [sys.executable, str(workdir / 'benchmark.py'), '--child', stage, '--repeat', str(repeat)]
+    if not measure_memory:
+        command.append('--no-memory')
+    completed = subprocess.run(command, cwd=workdir, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark stage '{stage}' failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def git_commit():
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        completed = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmarks(scenarios, repeat):
+    """Run every stage of the given scenarios and return the results record."""
+    record = {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'scenarios': {},
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scenario in scenarios:
+            print(f"{scenario}:")
+            workdir = make_workdir(tmp_dir, scenario)
+            results = record['scenarios'][scenario] = {}
+            for stage in SCENARIOS[scenario]:
+                results[stage] = run_child(workdir, stage, repeat)
+                print(f"  {format_result(stage, results[stage])}")
+            print()
+    return record
+
+
+def format_result(stage, result, previous=None):
+    """Return a one-line summary of a stage result (with change vs previous)."""
+    line = f"{stage:<16} {result['best_seconds'] * 1000:10.1f} ms"
+    if result['peak_bytes'] is not None:
+        line += f" {result['peak_bytes'] / 1e6:9.1f} MB peak"
+    if previous:
+        change = (result['best_seconds'] - previous['best_seconds']) / previous['best_seconds'] * 100
+        line += f"  ({change:+.0f}% time)"
+    return line
+
+
+def save_results(record, output_dir):
+    """Write a results record as <timestamp>-<commit>.json and latest.json."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stamp = record['timestamp'].replace(':', '').replace('-', '')
+    output_file = output_dir / f"{stamp}-{record['commit'] or 'unknown'}.json"
+    for path in (output_file, output_dir / 'latest.json'):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2)
+            f.write('\n')
+    return output_file
+
+
+def compare(record, baseline):
+    """Print each stage's time against a baseline record."""
+    print("=" * 70)
+    print(f"Compared with {baseline.get('commit')} ({baseline.get('timestamp')})")
+    print("=" * 70)
+    for scenario, results in record['scenarios'].items():
+        print(f"{scenario}:")
+        previous = baseline.get('scenarios', {}).get(scenario, {})
+        for stage, result in results.items():
+            print(f"  {format_result(stage, result, previous.get(stage))}")
+
+
+def main(argv=None):
+    """Run the benchmarks and save the results."""
+    parser = argparse.ArgumentParser(description='Benchmark generation, validation, loading and lookup.')
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help='scenario to run (repeatable, default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per stage (default: 3)')
+    parser.add_argument('--output-dir', default=str(DEFAULT_OUTPUT_DIR),
+                        help=f'results directory (default: {DEFAULT_OUTPUT_DIR})')
+    parser.add_argument('--compare', help='results file to compare against')
+    parser.add_argument('--child', choices=list(STAGES), help=argparse.SUPPRESS)
+    parser.add_argument('--no-memory', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        result = measure(args.child, Path.cwd(), max(1, args.repeat), not args.no_memory)
+        print(json.dumps(result))
+        return 0
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print("=" * 70)
+    print("Igbo Lexicon Benchmarks")
+    print("=" * 70)
+    print()
+
+    record = run_benchmarks(args.scenario or list(SCENARIOS), max(1, args.repeat))
+    output_file = save_results(record, Path(args.output_dir))
+    print(f"✓ Saved {output_file}")
+
+    if baseline is not None:
+        print()
+        compare(record, baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
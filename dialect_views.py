@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Per-dialect projections of the lexicon.
+
+consonants.json records, for the documented alternation sets, which
+dialects use which variant (dialect_distribution). A dialect view rewrites
+syllables.json and the generated verb collections with that dialect's
+preferred consonants:
+
+- syllables and infinitives: each consonant is replaced by the variant the
+  dialect prefers. A consonant the dialect prefers somewhere is kept; one
+  in several alternation sets (b is in B/V and B/W) otherwise follows the
+  first set, in consonants.json order, that mentions the dialect.
+  Consonants whose sets don't mention the dialect are left alone.
+- dialectal variant sets: dialect_form is the member the dialect prefers
+  for the set's pattern (the base form if the pattern doesn't mention it).
+
+Entries keep their ids, so a view answers "what is syl_ba_001 in Owerri?"
+(vá); the standard form is kept in standard_form.
+
+Views are materialized once and cached as JSON under generated/dialects/.
+A cached view records the hashes of consonants.json and the source
+collections, and is rebuilt automatically when any of them change.
+
+Usage:
+    from dialect_views import load_dialect_view
+
+    owerri = load_dialect_view('Owerri')
+    owerri.get('syl_ba_001')['plain_name']            # 'vá'
+    owerri.lookup('syllables', 'plain_name', 'rà')
+
+    python3 dialect_views.py --list
+    python3 dialect_views.py Owerri [--rebuild]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from file_hashes import file_hash
+from lexicon import COLLECTION_FILES, DEFAULT_LANGUAGE_DATA_DIR, Lexicon, get_lexicon, load_json
+from phoneme_segmenter import get_segmenter
+
+
+VIEW_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / 'generated' / 'dialects'
+
+
+def list_dialects(consonants):
+    """Return the dialects named in any dialect_distribution, sorted."""
+    dialects = set()
+    for consonant in consonants:
+        for alternation in consonant.get('alternation_sets', []):
+            for names in alternation.get('dialect_distribution', {}).values():
+                dialects.update(names)
+    return sorted(dialects)
+
+
+def resolve_dialect(consonants, name):
+    """
+    Return the canonical spelling of a dialect name (case-insensitive).
+
+    Raises ValueError if no alternation set mentions the dialect.
+    """
+    for dialect in list_dialects(consonants):
+        if dialect.lower() == name.lower():
+            return dialect
+    raise ValueError(f"Unknown dialect '{name}' (known: {', '.join(list_dialects(consonants))})")
+
+
+def preferred_variant(distribution, dialect):
+    """Return the variant a dialect_distribution assigns to a dialect, or None."""
+    for variant, dialects in distribution.items():
+        if dialect in dialects:
+            return variant
+    return None
+
+
+def pattern_preferences(consonants, dialect):
+    """Return {pattern: preferred consonant} for a dialect."""
+    preferences = {}
+    for consonant in consonants:
+        for alternation in consonant.get('alternation_sets', []):
+            variant = preferred_variant(alternation.get('dialect_distribution', {}), dialect)
+            if variant is not None:
+                preferences.setdefault(alternation['pattern'], variant)
+    return preferences
+
+
+def consonant_mapping(consonants, dialect):
+    """
+    Return {consonant: preferred consonant} for a dialect.
+
+    A consonant the dialect prefers in any alternation set maps to itself
+    (Onitsha keeps w, which it prefers over gh, even though B/W gives b).
+    Otherwise the first of its alternation sets that mentions the dialect
+    decides.
+    """
+    preferred = set(pattern_preferences(consonants, dialect).values())
+
+    mapping = {}
+    for consonant in consonants:
+        letter = consonant['letter']
+        for alternation in consonant.get('alternation_sets', []):
+            variant = preferred_variant(alternation.get('dialect_distribution', {}), dialect)
+            if variant is not None:
+                mapping[letter] = letter if letter in preferred else variant
+                break
+    return mapping
+
+
+def slugify(dialect):
+    """Return the cache file stem for a dialect name."""
+    return re.sub(r'[^a-z0-9]+', '-', dialect.lower()).strip('-')
+
+
+class DialectProjector:
+    """Rewrites lexicon entries into one dialect."""
+
+    def __init__(self, consonants, dialect, segmenter):
+        self.dialect = dialect
+        self.mapping = consonant_mapping(consonants, dialect)
+        self.preferences = pattern_preferences(consonants, dialect)
+        self.segmenter = segmenter
+
+    def word(self, word):
+        """Project a word by replacing each consonant with the preferred one."""
+        mapping = self.mapping
+        return ''.join(mapping.get(p, p) for p in self.segmenter.segment(word))
+
+    def syllable(self, entry):
+        """Project a syllables.json entry."""
+        consonant, vowel = entry['phonemes']
+        preferred = self.mapping.get(consonant, consonant)
+        projected = dict(entry, standard_form=entry['plain_name'])
+        if preferred != consonant:
+            projected['plain_name'] = preferred + vowel
+            projected['syllable_group'] = preferred + entry['syllable_group'][len(consonant):]
+            projected['phonemes'] = [preferred, vowel]
+        return projected
+
+    def infinitive(self, entry):
+        """Project a generated infinitive."""
+        base_root = self.word(entry['base_root'])
+        return dict(
+            entry,
+            standard_form=entry['infinitive_form'],
+            base_root=base_root,
+            infinitive_form=entry['prefix'] + base_root,
+        )
+
+    def variant_set(self, entry, forms, standard_form):
+        """Add dialect_form: the member of a variant set the dialect prefers."""
+        preferred = self.preferences.get(entry.get('pattern'))
+        dialect_form = forms[0]
+        if preferred is not None:
+            for form in forms:
+                if preferred in self.segmenter.segment(form):
+                    dialect_form = form
+                    break
+        return dict(entry, standard_form=standard_form, dialect_form=dialect_form)
+
+    def dialectal_root(self, entry):
+        """Project a dialectal variant set."""
+        forms = entry.get('variant_forms') or [entry['base_form'], entry['dialectal_form']]
+        return self.variant_set(entry, forms, entry['base_form'])
+
+    def dialectal_infinitive(self, entry):
+        """Project a dialectal infinitive."""
+        forms = entry.get('variant_infinitives') or [entry['base_infinitive'], entry['dialectal_infinitive']]
+        return self.variant_set(entry, forms, entry['base_infinitive'])
+
+    def project(self, lexicon):
+        """Return the projected collections of a lexicon (name -> entries)."""
+        project_entry = {
+            'syllables': self.syllable,
+            'infinitives': self.infinitive,
+            'dialectal_roots': self.dialectal_root,
+            'dialectal_infinitives': self.dialectal_infinitive,
+        }
+        return {
+            name: [project_entry[name](entry) for entry in entries]
+            for name, entries in lexicon.collections.items()
+        }
+
+
+def view_inputs(language_data_dir):
+    """Return {file: hash} for everything a dialect view is built from."""
+    files = ['consonants.json'] + list(COLLECTION_FILES.values())
+    return {rel_path: file_hash(language_data_dir / rel_path) for rel_path in files}
+
+
+def build_dialect_view(dialect, language_data_dir=None):
+    """
+    Project the lexicon onto a dialect without touching the cache.
+
+    Returns: the view's cache record (dialect, mapping, inputs, collections)
+    """
+    lexicon = get_lexicon(language_data_dir)
+    consonants = lexicon.consonants()
+    dialect = resolve_dialect(consonants, dialect)
+    projector = DialectProjector(consonants, dialect, get_segmenter(lexicon.language_data_dir))
+
+    return {
+        'version': VIEW_CACHE_VERSION,
+        'dialect': dialect,
+        'mapping': projector.mapping,
+        'inputs': view_inputs(lexicon.language_data_dir),
+        'collections': projector.project(lexicon),
+    }
+
+
+def load_cached_view(cache_file, inputs):
+    """Return a cached view record if it matches the current inputs, else None."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if record.get('version') != VIEW_CACHE_VERSION or record.get('inputs') != inputs:
+        return None
+    return record
+
+
+def save_cached_view(record, cache_file):
+    """Write a view record atomically."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False)
+    os.replace(tmp_file, cache_file)
+
+
+def load_dialect_view(dialect, language_data_dir=None, cache_dir=None, rebuild=False):
+    """
+    Return a Lexicon over a dialect's projected collections.
+
+    The cached view is used when its input hashes match; otherwise (or with
+    rebuild) it is rebuilt and written back. The returned Lexicon has
+    dialect, mapping and from_cache attributes.
+    """
+    language_data_dir = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR)
+    cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+    # Only consonants.json is needed to name the view; a cached view
+    # must not pay for parsing and indexing the whole standard lexicon
+    consonants = load_json(language_data_dir / 'consonants.json')['consonants']
+    dialect = resolve_dialect(consonants, dialect)
+    cache_file = cache_dir / f"{slugify(dialect)}.json"
+
+    record = None
+    if not rebuild:
+        record = load_cached_view(cache_file, view_inputs(language_data_dir))
+    from_cache = record is not None
+    if record is None:
+        record = build_dialect_view(dialect, language_data_dir)
+        save_cached_view(record, cache_file)
+
+    view = Lexicon(language_data_dir, collections=record['collections'])
+    view.dialect = record['dialect']
+    view.mapping = record['mapping']
+    view.from_cache = from_cache
+    view.cache_file = cache_file
+    return view
+
+
+def projected_form(entry):
+    """Return the dialect's form of a projected entry."""
+    for field in ('dialect_form', 'plain_name', 'infinitive_form'):
+        if field in entry:
+            return entry[field]
+    return None
+
+
+def main(argv=None):
+    """List dialects, or build/load a dialect view and print a summary."""
+    parser = argparse.ArgumentParser(description='Project the lexicon onto a dialect.')
+    parser.add_argument('dialect', nargs='?', help='dialect name (e.g. Owerri)')
+    parser.add_argument('--list', action='store_true', help='list the dialects in consonants.json')
+    parser.add_argument('--rebuild', action='store_true', help='ignore the cached view and rebuild it')
+    parser.add_argument('--cache-dir', help=f'cache directory (default: {DEFAULT_CACHE_DIR})')
+    args = parser.parse_args(argv)
+
+    consonants = load_json(DEFAULT_LANGUAGE_DATA_DIR / 'consonants.json')['consonants']
+
+    if args.list or not args.dialect:
+        for dialect in list_dialects(consonants):
+            mapping = consonant_mapping(consonants, dialect)
+            changes = ', '.join(f"{c}→{p}" for c, p in mapping.items() if c != p)
+            print(f"{dialect}: {changes or 'no changes'}")
+        return 0
+
+    try:
+        view = load_dialect_view(args.dialect, cache_dir=args.cache_dir, rebuild=args.rebuild)
+    except ValueError as e:
+        print(e)
+        return 1
+
+    print("=" * 70)
+    print(f"{view.dialect} Lexicon View")
+    print("=" * 70)
+    status = "loaded from cache" if view.from_cache else "rebuilt"
+    print(f"  {status}: {view.cache_file}")
+    changes = ', '.join(f"{c}→{p}" for c, p in view.mapping.items() if c != p)
+    print(f"  consonants: {changes or 'no changes'}")
+    for name, entries in view.collections.items():
+        changed = sum(1 for entry in entries if projected_form(entry) != entry['standard_form'])
+        print(f"  {name}: {len(entries)} entries ({changed} differ from the standard form)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Dialect-equivalence classes over consonants.
+
+The alternation_sets in consonants.json are merged with union-find into
+equivalence classes of consonants (l ~ r, b ~ v ~ g ~ w ~ gh, ...). Each
+class is represented by its first member in inventory order, and a word's
+dialect key is the word with every consonant replaced by its class
+representative (tones and vowels are kept). Forms that differ only by
+dialectal alternation share a key, so Lexicon.lookup_dialect() finds "la"
+entries from a query for "ra" with one hash probe.
+
+By default only the alternation sets that document a dialect_distribution
+are merged. Taken together with the undocumented ones (R/H, R/F, F/H/SH,
+N/L/Y, ...) the sets chain nearly every consonant into a single class,
+which would make the key useless; pass documented_only=False to get that
+closure anyway.
+
+This deliberately differs from the variant sets in
+generated-dialectal-roots.json. The generator closes each pattern of
+MAJOR_DIALECT_PATTERNS separately, documented or not, so it pairs fa, ha
+and sha (F/H/SH) and na, la and ya (N/L/Y), which lookup_dialect() does
+not. The two undocumented patterns are the only disagreement; merging
+them here would chain f, h, l, n, p, r, s, sh, t and y into one class.
+Conversely, a class can join consonants that no single pattern pairs
+(b and gh, through B/W and W/GH).
+
+Usage:
+    from dialects import get_equivalence
+
+    equivalence = get_equivalence()
+    equivalence.key('rà')              # 'là'
+    equivalence.equivalents('v')       # ['b', 'g', 'gh', 'v', 'w']
+
+    python3 dialects.py [word ...]
+"""
+
+import sys
+import unicodedata
+from pathlib import Path
+
+from lexicon import DEFAULT_LANGUAGE_DATA_DIR, load_json
+from phoneme_segmenter import PhonemeSegmenter
+from tone_engine import CACHE_SIZE
+
+
+class UnionFind:
+    """Disjoint sets with path compression and union by size."""
+
+    def __init__(self, items=()):
+        self.parent = {}
+        self.size = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        """Add an item as a singleton set if it isn't present yet."""
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item):
+        """Return the root of an item's set."""
+        self.add(item)
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a, b):
+        """Merge the sets containing a and b."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+    def groups(self):
+        """Return the sets as a dict of root -> members (in insertion order)."""
+        groups = {}
+        for item in self.parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return groups
+
+
+def alternation_sets(consonants, documented_only=True):
+    """
+    Yield (pattern, members) for each alternation set in consonants.json.
+
+    members includes the consonant the set is listed under. With
+    documented_only, sets without a dialect_distribution are skipped.
+    """
+    for consonant in consonants:
+        for alternation in consonant.get('alternation_sets', []):
+            if documented_only and not alternation.get('dialect_distribution'):
+                continue
+            yield alternation['pattern'], [consonant['letter']] + alternation['alternates_with']
+
+
+class DialectEquivalence:
+    """Consonant equivalence classes and dialect keys for one inventory."""
+
+    def __init__(self, consonants, vowels, documented_only=True):
+        self.inventory = [c['letter'] for c in consonants]
+        order = {letter: position for position, letter in enumerate(self.inventory)}
+
+        union_find = UnionFind(self.inventory)
+        self.patterns = []
+        for pattern, members in alternation_sets(consonants, documented_only):
+            if pattern not in self.patterns:
+                self.patterns.append(pattern)
+            for member in members[1:]:
+                union_find.union(members[0], member)
+
+        self.classes = []
+        self.canonical = {}
+        for members in union_find.groups().values():
+            members.sort(key=lambda letter: order.get(letter, len(order)))
+            self.classes.append(members)
+            for member in members:
+                self.canonical[member] = members[0]
+        self.classes.sort(key=lambda members: order.get(members[0], len(order)))
+
+        self.segmenter = PhonemeSegmenter(self.inventory, vowels)
+        self._keys = {}
+
+    @classmethod
+    def from_language_data(cls, language_data_dir=None, documented_only=True):
+        """Build the equivalence from consonants.json and vowels.json."""
+        language_data_dir = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR)
+        consonants = load_json(language_data_dir / 'consonants.json')['consonants']
+        vowels_data = load_json(language_data_dir / 'vowels.json')
+        vowels = [
+            v['letter']
+            for group in vowels_data['vowelGroups'].values()
+            for v in group['vowels']
+        ]
+        return cls(consonants, vowels, documented_only)
+
+    def equivalents(self, consonant):
+        """Return every consonant in the same class (including itself)."""
+        root = self.canonical.get(consonant)
+        if root is None:
+            return [consonant]
+        return next(members for members in self.classes if members[0] == root)
+
+    def key(self, word):
+        """
+        Return the dialect-neutral key of a word (NFC, lower case).
+
+        Keys are cached per word; the cache is cleared when it reaches
+        CACHE_SIZE, since words may come from untrusted input.
+        """
+        key = self._keys.get(word)
+        if key is None:
+            normalized = unicodedata.normalize('NFC', word).lower()
+            canonical = self.canonical
+            key = ''.join(canonical.get(p, p) for p in self.segmenter.segment(normalized))
+            if len(self._keys) >= CACHE_SIZE:
+                self._keys.clear()
+            self._keys[word] = key
+        return key
+
+
+_shared = {}
+
+
+def get_equivalence(language_data_dir=None):
+    """Return a process-wide shared equivalence for a language-data directory."""
+    key = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR).resolve()
+    if key not in _shared:
+        _shared[key] = DialectEquivalence.from_language_data(key)
+    return _shared[key]
+
+
+def main():
+    """Print the equivalence classes, or the dialect keys of the given words."""
+    equivalence = get_equivalence()
+
+    if len(sys.argv) > 1:
+        for word in sys.argv[1:]:
+            print(f"{word}\t{equivalence.key(word)}")
+        return 0
+
+    print("=" * 70)
+    print("Dialect Equivalence Classes")
+    print("=" * 70)
+    print(f"  patterns merged: {', '.join(equivalence.patterns)}")
+    print()
+    for members in equivalence.classes:
+        if len(members) > 1:
+            print(f"  {members[0]}: {' ~ '.join(members)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
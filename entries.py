@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Typed entries of the generated collections.
+
+Each collection's entries are instances of a small class with __slots__
+(Syllable, Infinitive, DialectalPair, DialectalInfinitive) instead of
+dicts, so an entry costs one fixed-size object rather than a hash table.
+Low-cardinality strings (tone, vowelGroup, type, prefix, pattern,
+consonants, ...) are passed through sys.intern, so every entry shares one
+copy of 'high' or 'A' instead of holding its own copy parsed from JSON.
+
+Entries implement the read-only Mapping interface, so existing code that
+reads entry['plain_name'], entry.get('prefix') or dict(entry) keeps
+working. to_json() returns the plain dict, in the field order of the JSON
+files; from_json() builds an entry from one. Fields an entry doesn't have
+are left unset, and unknown fields are kept in `extra`, so hand-edited
+entries keep every field and value. Their key order is not kept: known
+fields come back in FIELDS order, followed by the unknown ones.
+
+Usage:
+    from entries import Syllable, load_collection, to_json
+
+    syllables = load_collection('syllables', 'language-data/syllables.json')
+    syllables[0].tone                                  # 'high'
+    json.dumps(syllables[0], default=to_json)
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+
+
+class Entry(Mapping):
+    """Base class of the typed entries: FIELDS held in slots, in JSON order."""
+
+    __slots__ = ('extra',)
+
+    FIELDS = ()
+    # Fields whose string values (or list items) are interned
+    INTERNED = frozenset()
+    INTERNED_LISTS = frozenset()
+
+    def __init__(self, **fields):
+        self.extra = None
+        for field, value in fields.items():
+            self._set(field, value)
+
+    def _set(self, field, value):
+        if field in self.INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+        elif field in self.INTERNED_LISTS and isinstance(value, list):
+            value = [sys.intern(item) for item in value]
+        if field in self.FIELDS:
+            setattr(self, field, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[field] = value
+
+    @classmethod
+    def from_json(cls, data):
+        """Build an entry from a parsed JSON object."""
+        entry = cls.__new__(cls)
+        entry.extra = None
+        for field, value in data.items():
+            entry._set(field, value)
+        return entry
+
+    def to_json(self):
+        """Return the entry as a plain dict, in JSON field order."""
+        return dict(self.items())
+
+    def __getitem__(self, field):
+        if field in self.FIELDS:
+            try:
+                return getattr(self, field)
+            except AttributeError:
+                raise KeyError(field) from None
+        if self.extra is not None and field in self.extra:
+            return self.extra[field]
+        raise KeyError(field)
+
+    def __iter__(self):
+        for field in self.FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+
+class Syllable(Entry):
+    """A monosyllabic root of syllables.json."""
+
+    FIELDS = ('id', 'plain_name', 'main_vowel', 'tone', 'syllable_group', 'vowelGroup',
+              'phonemes', 'ndebe', 'unicode')
+    __slots__ = FIELDS
+    INTERNED = frozenset({'main_vowel', 'tone', 'syllable_group', 'vowelGroup'})
+    INTERNED_LISTS = frozenset({'phonemes'})
+
+
+class Infinitive(Entry):
+    """A generated infinitive (prefix + root)."""
+
+    FIELDS = ('id', 'infinitive_form', 'base_root', 'prefix', 'vowelGroup', 'syllable_id', 'type')
+    __slots__ = FIELDS
+    INTERNED = frozenset({'prefix', 'vowelGroup', 'type'})
+
+
+class DialectalPair(Entry):
+    """A set of dialectal variant roots (la / ra)."""
+
+    FIELDS = ('id', 'base_form', 'dialectal_form', 'combined_form', 'variant_forms', 'pattern',
+              'base_consonant', 'dialectal_consonant', 'variant_consonants', 'vowel', 'tone',
+              'vowelGroup', 'syllable_id', 'dialectal_syllable_id', 'generated', 'type')
+    __slots__ = FIELDS
+    INTERNED = frozenset({'pattern', 'base_consonant', 'dialectal_consonant', 'vowel', 'tone',
+                          'vowelGroup', 'type'})
+    INTERNED_LISTS = frozenset({'variant_consonants'})
+
+
+class DialectalInfinitive(Entry):
+    """The infinitives of a set of dialectal variant roots (ịla / ịra)."""
+
+    FIELDS = ('id', 'infinitive_form', 'base_infinitive', 'dialectal_infinitive',
+              'variant_infinitives', 'base_root', 'dialectal_root', 'variant_roots', 'pattern',
+              'prefix', 'tone', 'vowelGroup', 'syllable_id', 'dialectal_syllable_id', 'type')
+    __slots__ = FIELDS
+    INTERNED = frozenset({'pattern', 'prefix', 'tone', 'vowelGroup', 'type'})
+
+
+# Collection name -> entry class
+ENTRY_CLASSES = {
+    'syllables': Syllable,
+    'infinitives': Infinitive,
+    'dialectal_roots': DialectalPair,
+    'dialectal_infinitives': DialectalInfinitive,
+}
+
+
+def to_json(value):
+    """
+    Return the plain JSON form of an entry.
+
+    Usable as json.dump(..., default=to_json); raises TypeError for
+    anything that is not an Entry, as json expects.
+    """
+    if isinstance(value, Entry):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def from_json_entries(collection, data):
+    """Convert a collection's parsed JSON array to typed entries."""
+    entry_class = ENTRY_CLASSES[collection]
+    return [entry_class.from_json(item) for item in data]
+
+
+def load_collection(collection, json_file):
+    """Load a collection's JSON array file as typed entries."""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        return data
+    return from_json_entries(collection, data)
+
+
+def main():
+    """Report the number and size of entries per collection."""
+    from lexicon import COLLECTION_FILES, DEFAULT_LANGUAGE_DATA_DIR
+
+    for collection, rel_path in COLLECTION_FILES.items():
+        entries = load_collection(collection, DEFAULT_LANGUAGE_DATA_DIR / rel_path)
+        size = sum(sys.getsizeof(entry) for entry in entries)
+        print(f"  {collection}: {len(entries)} {ENTRY_CLASSES[collection].__name__} entries, "
+              f"{size / 1024:.0f} KiB of entry objects")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,47 +9,24 @@ Apply tone marks to vowels where applicable.
 import json
 from pathlib import Path
 
+import tone_engine
 
-# Tone marking for Igbo vowels
+
+# Tone marking for Igbo vowels (NFC), derived from the tone engine's table
 VOWEL_TONES = {
-    'a': {'high': 'á', 'mid': 'a', 'low': 'à'},
-    'e': {'high': 'é', 'mid': 'e', 'low': 'è'},
-    'i': {'high': 'í', 'mid': 'i', 'low': 'ì'},
-    'o': {'high': 'ó', 'mid': 'o', 'low': 'ò'},
-    'u': {'high': 'ú', 'mid': 'u', 'low': 'ù'},
-    'ẹ': {'high': 'ẹ́', 'mid': 'ẹ', 'low': 'ẹ̀'},
-    'ị': {'high': 'ị́', 'mid': 'ị', 'low': 'ị̀'},
-    'ọ': {'high': 'ọ́', 'mid': 'ọ', 'low': 'ọ̀'},
-    'ụ': {'high': 'ụ́', 'mid': 'ụ', 'low': 'ụ̀'},
+    vowel: {tone: tone_engine.TONE_TABLE[(vowel, tone)] for tone in tone_engine.TONES}
+    for vowel in ['a', 'e', 'i', 'o', 'u', 'ẹ', 'ị', 'ọ', 'ụ']
 }
 
 
 def find_main_vowel(syllable):
     """Find the main vowel in a syllable."""
-    for char in syllable:
-        if char in VOWEL_TONES:
-            return char
-    return None
+    return tone_engine.main_vowel(syllable)
 
 
 def apply_tone_to_syllable(syllable, tone):
     """Apply tone marking to a syllable."""
-    main_vowel = find_main_vowel(syllable)
-    
-    if not main_vowel:
-        # No recognizable vowel, return as-is
-        return syllable
-    
-    if main_vowel not in VOWEL_TONES:
-        # Vowel doesn't have tone variants, return as-is
-        return syllable
-    
-    # Get the toned vowel
-    toned_vowel = VOWEL_TONES[main_vowel][tone]
-    
-    # Replace the vowel in the syllable
-    result = syllable.replace(main_vowel, toned_vowel, 1)
-    return result
+    return tone_engine.apply_tone(syllable, tone)
 
 
 def expand_root_with_tones(root):
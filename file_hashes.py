@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Content hashes of files, for build manifests and cache invalidation.
+
+The generator's build manifest, the shard manifest and the dialect view
+cache all record SHA-256 hashes of the files they were built from. This
+module keeps the helper free of their dependencies, so a reader that only
+checks whether a cache is current does not import the generator.
+
+Usage:
+    from file_hashes import file_hash
+
+    file_hash('language-data/syllables.json')    # hex digest, or None if missing
+"""
+
+import hashlib
+from pathlib import Path
+
+
+def file_hash(file_path):
+    """Return the SHA-256 hex digest of a file, or None if it doesn't exist."""
+    file_path = Path(file_path)
+    if not file_path.exists():
+        return None
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
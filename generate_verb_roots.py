@@ -4,17 +4,87 @@ Generate all possible monosyllabic verb roots and their infinitives in JSON form
 
 This script generates:
 1. All monosyllabic verb roots (consonant + vowel combinations)
-2. Dialectal variations (e.g., L/R alternations like la/ra, le/re)
+2. Dialectal variant sets for the 12 major alternation patterns
+   (e.g., L/R: la/ra; F/H/SH: fa/ha/sha)
 3. Infinitives for all verb roots following vowel harmony rules:
    - A-group vowels (a, ẹ, ị, ọ, ụ) → prefix 'ị'
    - E-group vowels (e, i, o, u) → prefix 'i'
 
+With --shards, each collection is also split into generated/shards/ by
+leading consonant and vowel group, with a manifest for partial loading
+(see shards.py).
+
+With --syllables N (N >= 2) it instead enumerates N-syllable roots built
+from syllables.json (see generate_polysyllabic_roots) and streams them to
+generated/, optionally one shard per leading syllable.
+
 Output format: JSON files following the repository schema conventions.
+
+Usage:
+    python3 generate_verb_roots.py [--force] [--shards]
+    python3 generate_verb_roots.py --syllables 2 [--leading ba] [--shard] [--count] [--no-harmony]
 """
 
+import argparse
+import hashlib
 import json
+import os
+import sys
 from pathlib import Path
 from collections import defaultdict
+from itertools import product
+
+from dialects import UnionFind
+from entries import DialectalInfinitive, DialectalPair, Infinitive, Syllable, load_collection, to_json
+from file_hashes import file_hash
+from ndebe import MAPPING_FILE as NDEBE_MAPPING_FILE, Transliterator, update_mapping
+from snapshot import SnapshotBuilder
+from tone_engine import TONES, fold_diacritics, fold_rank
+
+
+BUILD_MANIFEST_VERSION = 1
+
+# Alternation patterns that generate dialectal variant sets
+MAJOR_DIALECT_PATTERNS = [
+    'L/R', 'B/V', 'G/V', 'F/H/SH', 'S/SH', 'Y/H',
+    'N/L/Y', 'J/Z', 'S/T', 'F/P', 'B/W', 'W/GH'
+]
+
+# Files (relative to the repository root) every generation stage depends on.
+# The generator sources, and the local modules they import, are included so
+# code changes also trigger a rebuild.
+GENERATION_INPUTS = [
+    'language-data/vowels.json',
+    'language-data/consonants.json',
+    'generate_verb_roots.py',
+    'expand_tone_variants.py',
+    'tone_engine.py',
+    'dialects.py',
+    'ndebe.py',
+    'snapshot.py',
+    'entries.py',
+    'file_hashes.py',
+    'lexicon.py',
+    'phoneme_segmenter.py',
+]
+
+# Syllable id ledger, relative to language-data/ (see IdLedger)
+ID_LEDGER_FILE = 'syllable-id-ledger.json'
+ID_LEDGER_VERSION = 1
+
+# Generation stages: (name, JSON output relative to language-data/, snapshot name)
+GENERATION_STAGES = [
+    ('syllables', 'syllables.json', 'syllables.snap'),
+    ('dialectal_roots', 'verbs/generated-dialectal-roots.json', 'generated-dialectal-roots.snap'),
+    ('infinitives', 'verbs/generated-infinitives.json', 'generated-infinitives.snap'),
+    ('dialectal_infinitives', 'verbs/generated-dialectal-infinitives.json', 'generated-dialectal-infinitives.snap'),
+]
+
+# Stages whose snapshots carry a 'folded' search index, and the form it folds
+FOLDED_FORM_FIELDS = {
+    'syllables': 'plain_name',
+    'infinitives': 'infinitive_form',
+}
 
 
 def load_vowels(language_data_dir):
@@ -30,35 +100,39 @@ def load_vowels(language_data_dir):
 
 
 def load_consonants(language_data_dir):
-    """Load consonants and their dialectal alternations from consonants.json."""
+    """
+    Load consonants and their dialectal variant sets from consonants.json.
+    
+    Each major pattern contributes the edges listed under each of its
+    consonants; the closure of those edges (computed with union-find) gives
+    the pattern's variant sets, so a three-way pattern such as F/H/SH yields
+    one set {f, h, sh} even where consonants.json lists it only partially.
+    
+    Returns: (consonants, alternations) where alternations is a list of
+    (pattern, members) tuples with members in inventory order
+    """
     consonants_file = language_data_dir / 'consonants.json'
     with open(consonants_file, 'r', encoding='utf-8') as f:
         consonants_data = json.load(f)
     
-    # Get all consonants
-    consonants = []
-    alternations = defaultdict(list)
+    consonants = [c['letter'] for c in consonants_data['consonants']]
+    order = {letter: position for position, letter in enumerate(consonants)}
     
+    graphs = {pattern: UnionFind() for pattern in MAJOR_DIALECT_PATTERNS}
     for c in consonants_data['consonants']:
-        letter = c['letter']
-        consonants.append(letter)
-        
-        # Track dialectal alternations
-        if c.get('shifting', False) and 'alternation_sets' in c:
-            for alt_set in c['alternation_sets']:
-                pattern = alt_set['pattern']
-                alternates_with = alt_set.get('alternates_with', [])
-                
-                # Create bidirectional mapping for major patterns
-                # We focus on the most common dialectal variations
-                if pattern in ['L/R', 'B/V', 'G/V', 'F/P', 'J/Z', 'S/T', 'Y/H']:
-                    for alt in alternates_with:
-                        if alt in [x['letter'] for x in consonants_data['consonants']]:
-                            # Store the bidirectional relationship
-                            if letter not in alternations[alt]:
-                                alternations[letter].append(alt)
-                            if alt not in alternations[letter]:
-                                alternations[alt].append(letter)
+        for alt_set in c.get('alternation_sets', []):
+            graph = graphs.get(alt_set['pattern'])
+            if graph is None:
+                continue
+            for alt in alt_set.get('alternates_with', []):
+                if alt in order:
+                    graph.union(c['letter'], alt)
+    
+    alternations = []
+    for pattern in MAJOR_DIALECT_PATTERNS:
+        for members in graphs[pattern].groups().values():
+            if len(members) > 1:
+                alternations.append((pattern, sorted(members, key=order.get)))
     
     return consonants, alternations
 
@@ -84,10 +158,12 @@ def get_infinitive_prefix(vowel_group):
 
 
 def generate_verb_roots(consonants, vowels, a_group, e_group):
-    """Generate all monosyllabic verb roots (CV combinations) with tone variants."""
-    from expand_tone_variants import find_main_vowel, apply_tone_to_syllable
+    """
+    Lazily generate all monosyllabic verb roots (CV combinations) with tone variants.
     
-    verb_roots = []
+    Roots are Syllable entries without an id; merge_and_assign_ids numbers them.
+    """
+    from expand_tone_variants import find_main_vowel, apply_tone_to_syllable
     
     for consonant in consonants:
         for vowel in vowels:
@@ -99,112 +175,216 @@ def generate_verb_roots(consonants, vowels, a_group, e_group):
             for idx, tone in enumerate(['high', 'mid', 'low'], start=1):
                 plain_name_with_tone = apply_tone_to_syllable(syllable_group, tone)
                 
-                verb_roots.append({
+                yield Syllable(
+                    plain_name=plain_name_with_tone,
+                    main_vowel=main_vowel if main_vowel else vowel,
+                    tone=tone,
+                    syllable_group=syllable_group,
+                    vowelGroup=vowel_group,
+                    phonemes=[consonant, plain_name_with_tone[len(consonant):]],
+                    ndebe='',
+                    unicode='',
+                )
+
+
+def load_syllabic_consonants(language_data_dir):
+    """Return the consonants marked syllabic in consonants.json (m̩, n̩)."""
+    consonants_file = language_data_dir / 'consonants.json'
+    with open(consonants_file, 'r', encoding='utf-8') as f:
+        consonants_data = json.load(f)
+    return {c['letter'] for c in consonants_data['consonants'] if c.get('syllabic')}
+
+
+def polysyllabic_tables(syllables, syllabic_consonants=(), harmony=True):
+    """
+    Build the candidate tables for polysyllabic enumeration.
+    
+    A syllable may follow another only if both are in the same vowel group
+    (with harmony) and it does not open with a syllabic nasal, which is a
+    syllable of its own and cannot begin a non-initial syllable.
+    
+    Returns: (toned, following) where toned maps each syllable_group to its
+    syllables.json entries in tone order, and following maps each
+    syllable_group to the syllable_groups allowed after it
+    """
+    toned = {}
+    for entry in syllables:
+        toned.setdefault(entry['syllable_group'], {})[entry['tone']] = entry
+    toned = {
+        group: [tones[tone] for tone in TONES if tone in tones]
+        for group, tones in toned.items()
+    }
+    
+    vowel_groups = {group: entries[0]['vowelGroup'] for group, entries in toned.items()}
+    onsets = [
+        group for group, entries in toned.items()
+        if entries[0]['phonemes'][0] not in syllabic_consonants
+    ]
+    following = {
+        group: [
+            onset for onset in onsets
+            if not harmony or vowel_groups[onset] == vowel_groups[group]
+        ]
+        for group in toned
+    }
+    return toned, following
+
+
+def generate_polysyllabic_roots(syllables, length, syllabic_consonants=(), leading=None, harmony=True):
+    """
+    Lazily generate roots of length syllables with every tone pattern.
+    
+    Segmental roots are enumerated depth first from the candidate tables
+    (see polysyllabic_tables), so a syllable ruled out after a prefix
+    prunes every root that would extend it; nothing is materialized beyond
+    the current path. Each segmental root yields one entry per tone
+    pattern (3^length), numbered in TONES order, so kuwa_001 is high-high.
+    
+    leading restricts the enumeration to roots starting with the given
+    syllable_groups, which makes each leading syllable an independent shard.
+    """
+    toned, following = polysyllabic_tables(syllables, syllabic_consonants, harmony)
+    leads = list(toned) if leading is None else [group for group in leading if group in toned]
+    
+    def extend(path):
+        if len(path) == length:
+            yield path
+            return
+        for group in following[path[-1]]:
+            yield from extend(path + (group,))
+    
+    for lead in leads:
+        for path in extend((lead,)):
+            syllable_group = ''.join(path)
+            vowel_group = toned[lead][0]['vowelGroup']
+            for number, parts in enumerate(product(*(toned[group] for group in path)), start=1):
+                yield {
+                    'id': f"{syllable_group}_{number:03d}",
+                    'plain_name': ''.join(part['plain_name'] for part in parts),
                     'syllable_group': syllable_group,
-                    'plain_name': plain_name_with_tone,
-                    'main_vowel': main_vowel if main_vowel else vowel,
-                    'tone': tone,
+                    'syllable_ids': [part['id'] for part in parts],
+                    'tones': [part['tone'] for part in parts],
                     'vowelGroup': vowel_group,
-                    'consonant': consonant,  # Temp field for generation
-                    'vowel': vowel  # Temp field for generation
-                })
+                    'syllable_count': length,
+                    'generated': True,
+                    'type': 'polysyllabic_root'
+                }
+
+
+def count_polysyllabic_roots(syllables, length, syllabic_consonants=(), leading=None, harmony=True):
+    """Return how many entries generate_polysyllabic_roots would yield, without enumerating."""
+    toned, following = polysyllabic_tables(syllables, syllabic_consonants, harmony)
+    leads = list(toned) if leading is None else [group for group in leading if group in toned]
     
-    return verb_roots
+    # paths[group] = weighted number of completions of a path ending in group
+    paths = {group: len(entries) for group, entries in toned.items()}
+    for _ in range(length - 1):
+        paths = {
+            group: sum(paths[onset] for onset in following[group]) * len(toned[group])
+            for group in toned
+        }
+    return sum(paths[lead] for lead in leads)
 
 
 def generate_dialectal_variations(verb_roots, alternations):
-    """Generate dialectal variations for verb roots as JSON objects."""
-    dialectal_roots = []
-    seen = set()  # Track unique pairs to avoid duplicates
+    """
+    Lazily generate dialectal variant sets for verb roots as JSON objects.
+    
+    Each (pattern, members) set is emitted once per vowel and tone, from
+    the root whose consonant is the first member, with every variant in
+    the same tone. Sets that several patterns produce identically are
+    emitted once (keyed by their sorted forms).
+    
+    The pairwise fields (dialectal_form, dialectal_consonant, ...) hold the
+    second member of the set; variant_forms lists all of them.
+    """
+    sets_by_base = defaultdict(list)
+    for pattern, members in alternations:
+        sets_by_base[members[0]].append((pattern, members))
+    
+    seen = set()
     
     for root_info in verb_roots:
-        consonant = root_info['consonant']
-        vowel = root_info['vowel']
-        plain_name = root_info['plain_name']
-        vowel_group = root_info['vowelGroup']
+        consonant, vowel_with_tone = root_info.phonemes
+        if consonant not in sets_by_base:
+            continue
         
-        # Check if this consonant has dialectal alternations
-        if consonant in alternations:
-            for alt_consonant in alternations[consonant]:
-                alt_root = alt_consonant + vowel
-                
-                # Create a unique key for this pair (order-independent)
-                pair_key = tuple(sorted([plain_name, alt_root]))
-                
-                if pair_key not in seen:
-                    seen.add(pair_key)
-                    dialectal_roots.append({
-                        'id': f"{plain_name}_{alt_root}_dialectal",
-                        'base_form': plain_name,
-                        'dialectal_form': alt_root,
-                        'combined_form': f"{plain_name} / {alt_root}",
-                        'base_consonant': consonant,
-                        'dialectal_consonant': alt_consonant,
-                        'vowel': vowel,
-                        'vowelGroup': vowel_group,
-                        'syllable_id': f"{plain_name}_mid",  # Base form syllable
-                        'dialectal_syllable_id': f"{alt_root}_mid",
-                        'generated': True,
-                        'type': 'dialectal_variation'
-                    })
-    
-    return dialectal_roots
+        vowel = root_info.syllable_group[len(consonant):]
+        
+        for pattern, members in sets_by_base[consonant]:
+            forms = [member + vowel_with_tone for member in members]
+            key = tuple(sorted(forms))
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            yield DialectalPair(
+                id=f"{'_'.join(forms)}_dialectal",
+                base_form=forms[0],
+                dialectal_form=forms[1],
+                combined_form=' / '.join(forms),
+                variant_forms=forms,
+                pattern=pattern,
+                base_consonant=members[0],
+                dialectal_consonant=members[1],
+                variant_consonants=members,
+                vowel=vowel,
+                tone=root_info.tone,
+                vowelGroup=root_info.vowelGroup,
+                syllable_id=f"{forms[0]}_mid",  # Base form syllable
+                dialectal_syllable_id=f"{forms[1]}_mid",
+                generated=True,
+                type='dialectal_variation',
+            )
 
 
 def generate_infinitives(verb_roots, a_group, e_group):
-    """Generate infinitives for all verb roots as JSON objects."""
-    infinitives = []
-    
+    """Lazily generate infinitives for all verb roots as JSON objects."""
     for root_info in verb_roots:
-        plain_name = root_info['plain_name']
-        vowel_group = root_info['vowelGroup']
+        plain_name = root_info.plain_name
+        vowel_group = root_info.vowelGroup
         prefix = get_infinitive_prefix(vowel_group)
         
         if prefix:
             infinitive = prefix + plain_name
-            infinitives.append({
-                'id': f"{infinitive}_infinitive",
-                'infinitive_form': infinitive,
-                'base_root': plain_name,
-                'prefix': prefix,
-                'vowelGroup': vowel_group,
-                'syllable_id': f"{infinitive}_mid",  # Infinitive syllable
-                'type': 'infinitive'
-            })
-    
-    return infinitives
+            yield Infinitive(
+                id=f"{infinitive}_infinitive",
+                infinitive_form=infinitive,
+                base_root=plain_name,
+                prefix=prefix,
+                vowelGroup=vowel_group,
+                syllable_id=f"{infinitive}_mid",  # Infinitive syllable
+                type='infinitive',
+            )
 
 
 def generate_dialectal_infinitives(dialectal_roots, a_group, e_group):
-    """Generate infinitives for dialectal variations as JSON objects."""
-    infinitives = []
-    
+    """Lazily generate infinitives for dialectal variant sets as JSON objects."""
     for root_info in dialectal_roots:
-        base_root = root_info['base_form']
-        dialectal_root = root_info['dialectal_form']
-        vowel_group = root_info['vowelGroup']
+        vowel_group = root_info.vowelGroup
         prefix = get_infinitive_prefix(vowel_group)
         
         if prefix:
-            base_infinitive = prefix + base_root
-            dialectal_infinitive = prefix + dialectal_root
-            combined_infinitive = f"{base_infinitive} / {dialectal_infinitive}"
+            roots = root_info.variant_forms
+            infinitives = [prefix + root for root in roots]
             
-            infinitives.append({
-                'id': f"{base_infinitive}_{dialectal_infinitive}_dialectal_inf",
-                'infinitive_form': combined_infinitive,
-                'base_infinitive': base_infinitive,
-                'dialectal_infinitive': dialectal_infinitive,
-                'base_root': base_root,
-                'dialectal_root': dialectal_root,
-                'prefix': prefix,
-                'vowelGroup': vowel_group,
-                'syllable_id': f"{base_infinitive}_mid",
-                'dialectal_syllable_id': f"{dialectal_infinitive}_mid",
-                'type': 'dialectal_infinitive'
-            })
-    
-    return infinitives
+            yield DialectalInfinitive(
+                id=f"{'_'.join(infinitives)}_dialectal_inf",
+                infinitive_form=' / '.join(infinitives),
+                base_infinitive=infinitives[0],
+                dialectal_infinitive=infinitives[1],
+                variant_infinitives=infinitives,
+                base_root=roots[0],
+                dialectal_root=roots[1],
+                variant_roots=roots,
+                pattern=root_info.pattern,
+                prefix=prefix,
+                tone=root_info.tone,
+                vowelGroup=vowel_group,
+                syllable_id=f"{infinitives[0]}_mid",
+                dialectal_syllable_id=f"{infinitives[1]}_mid",
+                type='dialectal_infinitive',
+            )
 
 
 def save_to_json(data, output_file, metadata=None):
@@ -219,81 +399,354 @@ def save_to_json(data, output_file, metadata=None):
 
 
 def save_array_to_json(data, output_file):
-    """Save data as a JSON array (like syllables.json)."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """
+    Save data as a JSON array (like syllables.json).
+    
+    Accepts any iterable and streams it to disk (see stream_array_to_json).
+    
+    Returns: True if the file was written
+    """
+    written, _ = stream_array_to_json(data, output_file)
+    return written
+
+
+class JsonArrayWriter:
+    """
+    Write a JSON array file one entry at a time.
+    
+    Output is byte-identical to json.dump(entries, indent=2). Entries go to
+    a temporary file while being hashed; close() moves it into place unless
+    the existing file already has the same hash, so unchanged outputs keep
+    their mtime.
+    """
+    
+    def __init__(self, output_file):
+        self.output_file = Path(output_file)
+        self.tmp_file = self.output_file.with_name(self.output_file.name + '.tmp')
+        self.digest = hashlib.sha256()
+        self.count = 0
+        self.size = 0
+        self.file = open(self.tmp_file, 'wb')
+    
+    def _emit(self, text):
+        data = text.encode('utf-8')
+        self.digest.update(data)
+        self.size += len(data)
+        self.file.write(data)
+    
+    def write(self, entry):
+        """Append one entry to the array."""
+        # Nested lines get the extra indent level of the enclosing array
+        item = json.dumps(entry, ensure_ascii=False, indent=2, default=to_json).replace('\n', '\n  ')
+        self._emit(('[\n  ' if self.count == 0 else ',\n  ') + item)
+        self.count += 1
+    
+    def close(self):
+        """
+        Finish the array and move it into place if it changed.
+        
+        Returns: True if the file was written
+        """
+        self._emit('\n]' if self.count else '[]')
+        self.file.close()
+        if self.sha256 == file_hash(self.output_file):
+            self.tmp_file.unlink()
+            return False
+        os.replace(self.tmp_file, self.output_file)
+        return True
+    
+    def abort(self):
+        """Discard the partially written array."""
+        self.file.close()
+        self.tmp_file.unlink(missing_ok=True)
+    
+    @property
+    def sha256(self):
+        """SHA-256 hex digest of what has been written so far."""
+        return self.digest.hexdigest()
+
+
+def stream_array_to_json(entries, output_file):
+    """
+    Stream entries to a JSON array file as they are produced.
+    
+    Only one entry is serialized at a time (see JsonArrayWriter).
+    
+    Returns: (written, count) tuple
+    """
+    writer = JsonArrayWriter(output_file)
+    try:
+        for entry in entries:
+            writer.write(entry)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close(), writer.count
+
+
+def write_collection_shards(entries, collection, shard_dir, shard_keys):
+    """
+    Stream a collection into one JSON array file per shard key.
+    
+    Shards are opened as their keys first appear, so entries are never
+    grouped in memory.
+    
+    Returns: the shard records (key, file, count, sha256, bytes) in key order
+    """
+    from shards import shard_file_stem
+    
+    collection_dir = shard_dir / collection
+    collection_dir.mkdir(parents=True, exist_ok=True)
+    writers = {}
+    try:
+        for entry in entries:
+            key = shard_keys.key(collection, entry)
+            writer = writers.get(key)
+            if writer is None:
+                writer = writers[key] = JsonArrayWriter(collection_dir / f"{shard_file_stem(*key)}.json")
+            writer.write(entry)
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+    
+    records = []
+    for (consonant, vowel_group), writer in sorted(writers.items()):
+        writer.close()
+        records.append({
+            'consonant': consonant,
+            'vowelGroup': vowel_group,
+            'file': writer.output_file.relative_to(shard_dir).as_posix(),
+            'count': writer.count,
+            'sha256': writer.sha256,
+            'bytes': writer.size,
+        })
+    return records
+
+
+def folded_index(form_field):
+    """Return a snapshot key function for the 'folded' index of a form field."""
+    def key_function(entry):
+        form = entry[form_field]
+        return fold_diacritics(form), fold_rank(form)
+    return key_function
+
+
+def tee_to_snapshot(entries, builder):
+    """Pass entries through unchanged while adding each to a SnapshotBuilder."""
+    for entry in entries:
+        builder.add(entry)
+        yield entry
+
+
+def capture_head(entries, head, limit):
+    """Pass entries through unchanged, keeping the first `limit` in `head`."""
+    for entry in entries:
+        if len(head) < limit:
+            head.append(entry)
+        yield entry
+
+
+def load_build_manifest(manifest_file):
+    """Load the build manifest, or an empty one if missing or unreadable."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {'version': BUILD_MANIFEST_VERSION, 'stages': {}}
+    
+    if manifest.get('version') != BUILD_MANIFEST_VERSION:
+        return {'version': BUILD_MANIFEST_VERSION, 'stages': {}}
+    return manifest
+
+
+def save_build_manifest(manifest, manifest_file):
+    """Save the build manifest."""
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def stage_is_current(manifest, stage, input_hashes, output_files, repo_root):
+    """
+    Check whether a stage can be skipped.
+    
+    A stage is current when its recorded input hashes match the current
+    inputs and every output still has the hash recorded when it was built
+    (so hand-edited or deleted outputs are regenerated).
+    """
+    record = manifest['stages'].get(stage)
+    if not record or record.get('inputs') != input_hashes:
+        return False
+    
+    for output_file in output_files:
+        rel_path = output_file.relative_to(repo_root).as_posix()
+        recorded = record.get('outputs', {}).get(rel_path)
+        if recorded is None or recorded != file_hash(output_file):
+            return False
+    return True
+
+
+def record_stage(manifest, stage, input_hashes, output_files, repo_root):
+    """Record the input and output hashes of a stage that just ran."""
+    manifest['stages'][stage] = {
+        'inputs': input_hashes,
+        'outputs': {
+            output_file.relative_to(repo_root).as_posix(): file_hash(output_file)
+            for output_file in output_files
+        }
+    }
 
 
 def load_existing_prime_roots(syllables_file):
-    """Load existing prime roots from syllables.json."""
+    """
+    Load existing prime roots from syllables.json as Syllable entries.
+    
+    The file is read directly rather than through lexicon.get_lexicon():
+    the generator rewrites syllables.json, so a shared Lexicon would hold
+    stale entries, and it only needs this one collection in file order,
+    not the indexes over every collection.
+    """
     if not syllables_file.exists():
         return []
     
-    with open(syllables_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        # Handle both array format and object with _comment
-        if isinstance(data, list):
-            return data
-        elif isinstance(data, dict) and '_comment' in data:
-            return []
-        return []
+    data = load_collection('syllables', syllables_file)
+    # Handle both array format and object with _comment
+    if isinstance(data, list):
+        return data
+    return []
 
 
-def merge_and_assign_ids(existing_roots, new_roots):
+class IdLedger:
+    """
+    Persistent record of every syllable id ever assigned.
+    
+    language-data/syllable-id-ledger.json maps each syllable_group to the
+    ids allocated in it and the tone each was allocated for. Ids are never
+    renumbered: an entry that comes back (e.g. after syllables.json was
+    regenerated from scratch) gets its old id again, and a new entry gets
+    the group's next unused number, so adding a homophone never shifts the
+    ids other files refer to.
     """
-    Merge existing and new roots, assigning sequential IDs.
+    
+    def __init__(self, groups=None):
+        self.groups = groups or {}
+        self.changed = False
+    
+    @classmethod
+    def load(cls, ledger_file):
+        """Load a ledger, or start an empty one if the file doesn't exist."""
+        try:
+            with open(ledger_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        if data.get('version') != ID_LEDGER_VERSION:
+            raise ValueError(f"{ledger_file}: unsupported ledger version {data.get('version')}")
+        return cls(data['groups'])
+    
+    def record(self, syllable_group, entry_id, tone):
+        """Record that entry_id belongs to a tone variant of syllable_group."""
+        ids = self.groups.setdefault(syllable_group, {})
+        if ids.get(entry_id) != tone:
+            ids[entry_id] = tone
+            self.changed = True
+    
+    def next_number(self, syllable_group):
+        """Return the lowest number above every id ever allocated in a group."""
+        numbers = [0]
+        for entry_id in self.groups.get(syllable_group, {}):
+            prefix, _, number = entry_id.rpartition('_')
+            if prefix == f"syl_{syllable_group}" and number.isdigit():
+                numbers.append(int(number))
+        return max(numbers) + 1
+    
+    def allocate(self, syllable_group, tone, in_use):
+        """
+        Return the id for a new tone variant of syllable_group.
+        
+        An id previously allocated for the same tone is reused if no entry
+        currently holds it; otherwise a fresh number is allocated.
+        """
+        for entry_id, recorded_tone in self.groups.get(syllable_group, {}).items():
+            if recorded_tone == tone and entry_id not in in_use:
+                return entry_id
+        entry_id = f"syl_{syllable_group}_{self.next_number(syllable_group):03d}"
+        self.record(syllable_group, entry_id, tone)
+        return entry_id
+    
+    def save(self, ledger_file):
+        """
+        Write the ledger if it changed since it was loaded.
+        
+        Returns: True if the file was written
+        """
+        if not self.changed and Path(ledger_file).exists():
+            return False
+        data = {
+            '_comment': "Every syllable id ever assigned, per syllable_group; maintained by generate_verb_roots.py",
+            'version': ID_LEDGER_VERSION,
+            'groups': {
+                group: dict(sorted(ids.items()))
+                for group, ids in sorted(self.groups.items())
+            },
+        }
+        with open(ledger_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        self.changed = False
+        return True
+
+
+def merge_and_assign_ids(existing_roots, new_roots, ledger=None):
+    """
+    Merge existing and new roots, assigning IDs from the ledger.
     
     - Existing roots keep their IDs and data
     - New roots only added if syllable_group + tone doesn't exist
-    - All roots get sequential IDs per syllable_group
+      (checked against a set of (syllable_group, tone) pairs)
+    - Roots without an ID get one from the ledger (see IdLedger), so IDs
+      stay stable across runs instead of being renumbered
+    - Roots are returned per syllable_group, ordered by tone
+    
+    New roots are kept as generated (they already are clean Syllable
+    entries) and just numbered. Without a ledger, an empty in-memory one
+    is used.
     """
-    from collections import defaultdict
+    if ledger is None:
+        ledger = IdLedger()
     
     roots_by_group = defaultdict(list)
+    present = set()
+    in_use = set()
     
     # Add existing roots first (they have priority)
     for root in existing_roots:
         syllable_group = root.get('syllable_group', root.get('plain_name', ''))
         roots_by_group[syllable_group].append(root)
+        present.add((syllable_group, root.get('tone')))
+        if root.get('id'):
+            in_use.add(root['id'])
+            ledger.record(syllable_group, root['id'], root.get('tone'))
     
     # Add new generated roots only if syllable_group + tone doesn't exist
     for root in new_roots:
-        syllable_group = root['syllable_group']
-        tone = root['tone']
-        consonant = root['consonant']
-        plain_name = root['plain_name']
-        
-        # Extract vowel with tone marks from plain_name
-        vowel_with_tone = plain_name[len(consonant):]
-        
-        # Check if this tone variant already exists for this syllable_group
-        existing_tones = [r.get('tone') for r in roots_by_group[syllable_group]]
-        
-        if tone not in existing_tones:
-            # Create clean root without temp fields
-            clean_root = {
-                'plain_name': root['plain_name'],
-                'main_vowel': root['main_vowel'],
-                'tone': root['tone'],
-                'syllable_group': root['syllable_group'],
-                'vowelGroup': root['vowelGroup'],
-                'phonemes': [consonant, vowel_with_tone],
-                'ndebe': '',
-                'unicode': ''
-            }
-            roots_by_group[syllable_group].append(clean_root)
-    
-    # Assign sequential IDs per syllable_group, ordered by tone
+        key = (root.syllable_group, root.tone)
+        if key not in present:
+            present.add(key)
+            roots_by_group[root.syllable_group].append(root)
+    
+    # Order by tone (homophones by ID), numbering roots that have no ID yet
     all_roots = []
     tone_order = {'high': 1, 'mid': 2, 'low': 3}
     
     for syllable_group in sorted(roots_by_group.keys()):
         entries = roots_by_group[syllable_group]
-        # Sort by tone
-        entries.sort(key=lambda x: tone_order.get(x.get('tone', 'mid'), 2))
+        entries.sort(key=lambda x: (tone_order.get(x.get('tone', 'mid'), 2), not x.get('id'), x.get('id') or ''))
         
-        for idx, root in enumerate(entries, start=1):
-            root['id'] = f"syl_{syllable_group}_{idx:03d}"
+        for root in entries:
+            if not root.get('id'):
+                root.id = ledger.allocate(syllable_group, root.get('tone'), in_use)
+                in_use.add(root.id)
             all_roots.append(root)
     
     return all_roots
@@ -320,19 +773,206 @@ def save_prime_root_to_file(root_data, prime_roots_dir):
     return filepath
 
 
-def main():
+def fill_ndebe_fields(roots, language_data_dir):
+    """
+    Set the ndebe and unicode fields of syllable roots (see ndebe.py).
+    
+    Syllable groups without a glyph are first given one in the mapping.
+    """
+    update_mapping(language_data_dir, [root['syllable_group'] for root in roots])
+    transliterator = Transliterator.from_file(language_data_dir / NDEBE_MAPPING_FILE)
+    for root in roots:
+        root.ndebe, root.unicode = transliterator.entry_fields(root['plain_name'])
+
+
+def stage_entries(stage, language_data_dir, consonants, vowels, a_group, e_group, alternations):
+    """
+    Build the lazy generator pipeline for one generation stage.
+    
+    Every stage starts from a fresh generate_verb_roots() stream, so no
+    stage holds another stage's output in memory. Only the syllables stage
+    materializes its entries, because merge_and_assign_ids has to group
+    them with the existing syllables before numbering.
+    """
+    verb_roots = generate_verb_roots(consonants, vowels, a_group, e_group)
+    
+    if stage == 'syllables':
+        existing_roots = load_existing_prime_roots(language_data_dir / 'syllables.json')
+        ledger = IdLedger.load(language_data_dir / ID_LEDGER_FILE)
+        roots = merge_and_assign_ids(existing_roots, verb_roots, ledger)
+        ledger.save(language_data_dir / ID_LEDGER_FILE)
+        fill_ndebe_fields(roots, language_data_dir)
+        return iter(roots)
+    if stage == 'dialectal_roots':
+        return generate_dialectal_variations(verb_roots, alternations)
+    if stage == 'infinitives':
+        return generate_infinitives(verb_roots, a_group, e_group)
+    if stage == 'dialectal_infinitives':
+        dialectal_roots = generate_dialectal_variations(verb_roots, alternations)
+        return generate_dialectal_infinitives(dialectal_roots, a_group, e_group)
+    raise ValueError(f"Unknown generation stage: {stage}")
+
+
+def update_shards(language_data_dir, shard_dir):
+    """
+    Re-cut the shards of every collection whose JSON file changed.
+    
+    A collection is current when the shard manifest records the hash of its
+    JSON file and all of its shard files exist. Stale collections are cut
+    from that JSON file as it is, so hand edits are kept and nothing else
+    (the id ledger, the Ndebe mapping) is touched. Shard files for keys
+    that no longer occur are removed.
+    """
+    from shards import ShardKeys, load_manifest, save_manifest
+    
+    manifest = load_manifest(shard_dir)
+    shard_keys = ShardKeys(language_data_dir)
+    
+    print("Sharding collections...")
+    for stage, json_name, _ in GENERATION_STAGES:
+        source_hash = file_hash(language_data_dir / json_name)
+        previous = manifest['collections'].get(stage)
+        if (previous and previous['source_sha256'] == source_hash
+                and all((shard_dir / shard['file']).exists() for shard in previous['shards'])):
+            print(f"  = shards/{stage} unchanged ({len(previous['shards'])} shards)")
+            continue
+        
+        entries = load_collection(stage, language_data_dir / json_name)
+        shards = write_collection_shards(entries, stage, shard_dir, shard_keys)
+        
+        current_files = {shard['file'] for shard in shards}
+        for shard in (previous or {}).get('shards', []):
+            if shard['file'] not in current_files:
+                (shard_dir / shard['file']).unlink(missing_ok=True)
+        
+        manifest['collections'][stage] = {
+            'source': f"language-data/{json_name}",
+            'source_sha256': source_hash,
+            'count': sum(shard['count'] for shard in shards),
+            'bytes': sum(shard['bytes'] for shard in shards),
+            'shards': shards,
+        }
+        print(f"  ✓ Saved shards/{stage} ({len(shards)} shards)")
+    
+    save_manifest(manifest, shard_dir)
+
+
+def generate_polysyllabic(args, language_data_dir, output_dir):
+    """
+    Stream N-syllable roots to generated/polysyllabic-roots-N.json.
+    
+    With --shard, each leading syllable goes to its own file under
+    generated/polysyllabic-roots-N/, so shards can be produced (or
+    regenerated) independently and no file holds the whole inventory.
+    """
+    length = args.syllables
+    syllables = load_existing_prime_roots(language_data_dir / 'syllables.json')
+    if not syllables:
+        print("✗ syllables.json is empty; run generate_verb_roots.py first")
+        return 1
+    syllabic_consonants = load_syllabic_consonants(language_data_dir)
+    
+    leads = args.leading or list(dict.fromkeys(s['syllable_group'] for s in syllables))
+    harmony = not args.no_harmony
+    total = count_polysyllabic_roots(syllables, length, syllabic_consonants, leads, harmony)
+    print(f"{length}-syllable roots: {total} entries from {len(leads)} leading syllables")
+    if args.count:
+        return 0
+    
+    output_dir.mkdir(exist_ok=True)
+    if args.shard:
+        shard_dir = output_dir / f"polysyllabic-roots-{length}"
+        shard_dir.mkdir(exist_ok=True)
+        jobs = [(shard_dir / f"{lead}.json", [lead]) for lead in leads]
+    else:
+        jobs = [(output_dir / f"polysyllabic-roots-{length}.json", leads)]
+    
+    for output_file, shard_leads in jobs:
+        entries = generate_polysyllabic_roots(syllables, length, syllabic_consonants, shard_leads, harmony)
+        written, count = stream_array_to_json(entries, output_file)
+        status = "✓ Saved" if written else "= Unchanged"
+        print(f"  {status} {output_file.relative_to(output_dir.parent)} ({count} entries)")
+    return 0
+
+
+def main(argv=None):
     """Main generation function."""
+    parser = argparse.ArgumentParser(description="Generate Igbo verb roots and infinitives.")
+    parser.add_argument(
+        '--force', action='store_true',
+        help="rerun every stage even if the build manifest says it is up to date"
+    )
+    parser.add_argument(
+        '--shards', action='store_true',
+        help="also split each collection into generated/shards/ by leading consonant and vowel group"
+    )
+    parser.add_argument(
+        '--syllables', type=int, default=1,
+        help="generate roots of this many syllables from syllables.json instead (default: 1)"
+    )
+    parser.add_argument(
+        '--leading', action='append',
+        help="with --syllables: only roots starting with this syllable group (repeatable)"
+    )
+    parser.add_argument(
+        '--shard', action='store_true',
+        help="with --syllables: write one file per leading syllable"
+    )
+    parser.add_argument(
+        '--no-harmony', action='store_true',
+        help="with --syllables: allow mixed vowel groups, as in compounds such as kuwa"
+    )
+    parser.add_argument(
+        '--count', action='store_true',
+        help="with --syllables: print how many roots would be generated and exit"
+    )
+    args = parser.parse_args(argv)
+    if args.syllables < 1:
+        parser.error("--syllables must be at least 1")
+    
     # Setup paths
     repo_root = Path(__file__).parent
     language_data_dir = repo_root / 'language-data'
     output_dir = repo_root / 'generated'
+    
+    if args.syllables > 1:
+        return generate_polysyllabic(args, language_data_dir, output_dir)
     output_dir.mkdir(exist_ok=True)
+    manifest_file = output_dir / 'build-manifest.json'
     
     print("=" * 70)
     print("Igbo Monosyllabic Verb Root and Infinitive Generator")
     print("=" * 70)
     print()
     
+    # Decide which stages need to run
+    manifest = load_build_manifest(manifest_file)
+    input_hashes = {rel_path: file_hash(repo_root / rel_path) for rel_path in GENERATION_INPUTS}
+    
+    stage_outputs = {
+        stage: [language_data_dir / json_name, output_dir / snapshot_name]
+        for stage, json_name, snapshot_name in GENERATION_STAGES
+    }
+    # The syllables stage also maintains the id ledger and the Ndebe mapping
+    stage_outputs['syllables'] += [language_data_dir / ID_LEDGER_FILE, language_data_dir / NDEBE_MAPPING_FILE]
+    stale = [
+        stage for stage, _, _ in GENERATION_STAGES
+        if args.force or not stage_is_current(manifest, stage, input_hashes, stage_outputs[stage], repo_root)
+    ]
+    
+    if not stale:
+        print("All outputs are up to date (inputs unchanged since last build).")
+        print(f"Use --force to regenerate. Manifest: {manifest_file}")
+        if args.shards:
+            print()
+            update_shards(language_data_dir, output_dir / 'shards')
+        return 0
+    
+    for stage, _, _ in GENERATION_STAGES:
+        status = "rebuild" if stage in stale else "up to date"
+        print(f"  {stage}: {status}")
+    print()
+    
     # Load vowels and consonants
     print("Loading vowels and consonants...")
     a_group, e_group = load_vowels(language_data_dir)
@@ -343,110 +983,100 @@ def main():
     print(f"  E-group vowels: {', '.join(e_group)}")
     print(f"  Total vowels: {len(all_vowels)}")
     print(f"  Total consonants: {len(consonants)}")
+    print(f"  Dialectal patterns: {', '.join(pattern for pattern, _ in alternations)}")
     print()
     
-    # Generate all monosyllabic verb roots
-    print("Generating monosyllabic verb roots...")
-    verb_roots = generate_verb_roots(consonants, all_vowels, a_group, e_group)
-    print(f"  Generated {len(verb_roots)} base verb roots")
-    
-    # Generate dialectal variations
-    print("Generating dialectal variations...")
-    dialectal_roots = generate_dialectal_variations(verb_roots, alternations)
-    print(f"  Generated {len(dialectal_roots)} dialectal variations")
-    
-    # Generate infinitives
-    print("Generating infinitives for base roots...")
-    base_infinitives = generate_infinitives(verb_roots, a_group, e_group)
-    print(f"  Generated {len(base_infinitives)} base infinitives")
-    
-    print("Generating infinitives for dialectal variations...")
-    dialectal_infinitives = generate_dialectal_infinitives(dialectal_roots, a_group, e_group)
-    print(f"  Generated {len(dialectal_infinitives)} dialectal infinitives")
-    print()
-    
-    # Save outputs to JSON
-    print("Saving generated data to JSON...")
-    
-    # Create output directories
-    verbs_dir = language_data_dir / 'verbs'
-    prime_roots_dir = verbs_dir / 'prime-roots'
-    
-    # Load existing prime roots from syllables.json and merge with new ones
-    syllables_file = language_data_dir / 'syllables.json'
-    print(f"Loading existing syllables from {syllables_file.name}...")
-    existing_roots = load_existing_prime_roots(syllables_file)
-    print(f"  Found {len(existing_roots)} existing syllables")
-    
-    print("Merging and assigning sequential IDs...")
-    all_prime_roots = merge_and_assign_ids(existing_roots, verb_roots)
-    print(f"  Total syllables after merge: {len(all_prime_roots)}")
-    
-    # Save consolidated syllables
-    save_array_to_json(all_prime_roots, syllables_file)
-    print(f"  ✓ Saved syllables.json ({len(all_prime_roots)} syllables)")
-    
-    # Save dialectal verb roots as a collection (they reference prime roots)
-    save_array_to_json(
-        dialectal_roots,
-        verbs_dir / 'generated-dialectal-roots.json'
-    )
-    print(f"  ✓ Saved generated-dialectal-roots.json ({len(dialectal_roots)} entries)")
-    
-    # Save base infinitives as a collection (they are derived forms, not prime roots)
-    save_array_to_json(
-        base_infinitives,
-        verbs_dir / 'generated-infinitives.json'
-    )
-    print(f"  ✓ Saved generated-infinitives.json ({len(base_infinitives)} entries)")
+    # Each stale stage streams from the root generator straight to disk
+    print("Generating and saving data...")
+    counts = {}
+    samples = {}
+    for stage, json_name, snapshot_name in GENERATION_STAGES:
+        if stage not in stale:
+            continue
+        json_file, snapshot_file = stage_outputs[stage][:2]
+        
+        derived_indexes = None
+        if stage in FOLDED_FORM_FIELDS:
+            derived_indexes = {'folded': folded_index(FOLDED_FORM_FIELDS[stage])}
+        builder = SnapshotBuilder(derived_indexes=derived_indexes)
+        samples[stage] = []
+        entries = stage_entries(
+            stage, language_data_dir, consonants, all_vowels, a_group, e_group, alternations
+        )
+        entries = capture_head(tee_to_snapshot(entries, builder), samples[stage], 10)
+        written, counts[stage] = stream_array_to_json(entries, json_file)
+        
+        if written:
+            print(f"  ✓ Saved {json_file.name} ({counts[stage]} entries)")
+        else:
+            print(f"  = {json_file.name} unchanged ({counts[stage]} entries)")
+        
+        if builder.write(snapshot_file):
+            print(f"  ✓ Saved {output_dir.name}/{snapshot_name} ({builder.count} records)")
+        else:
+            print(f"  = {output_dir.name}/{snapshot_name} unchanged ({builder.count} records)")
+        
+        record_stage(manifest, stage, input_hashes, stage_outputs[stage], repo_root)
+        save_build_manifest(manifest, manifest_file)
     
-    # Save dialectal infinitives
-    save_array_to_json(
-        dialectal_infinitives,
-        verbs_dir / 'generated-dialectal-infinitives.json'
-    )
-    print(f"  ✓ Saved generated-dialectal-infinitives.json ({len(dialectal_infinitives)} entries)")
+    if args.shards:
+        print()
+        update_shards(language_data_dir, output_dir / 'shards')
     
     # Print summary
     print()
     print("=" * 70)
     print("Generation Summary")
     print("=" * 70)
-    print(f"Syllables (monosyllabic): {len(all_prime_roots)} in syllables.json")
-    print(f"Dialectal variations: {len(dialectal_roots)} (collection file)")
-    print(f"Base infinitives: {len(base_infinitives)} (collection file)")
-    print(f"Dialectal infinitives: {len(dialectal_infinitives)} (collection file)")
+    summary_labels = {
+        'syllables': "Syllables (monosyllabic)",
+        'dialectal_roots': "Dialectal variations",
+        'infinitives': "Base infinitives",
+        'dialectal_infinitives': "Dialectal infinitives",
+    }
+    for stage, json_name, _ in GENERATION_STAGES:
+        if stage in counts:
+            print(f"{summary_labels[stage]}: {counts[stage]} in {json_name}")
+        else:
+            print(f"{summary_labels[stage]}: unchanged ({json_name})")
     print()
     print(f"Files saved in:")
-    print(f"  - Syllables: {syllables_file}")
-    print(f"  - Collections: {verbs_dir}/generated-*.json")
+    print(f"  - Syllables: {language_data_dir / 'syllables.json'}")
+    print(f"  - Collections: {language_data_dir / 'verbs'}/generated-*.json")
+    print(f"  - Snapshots: {output_dir}/*.snap")
+    print(f"  - Build manifest: {manifest_file}")
     print()
     
     # Show some examples
     print("Examples:")
     print("-" * 70)
-    print("\nSyllables (first 10 from syllables.json):")
-    for root in all_prime_roots[:10]:
-        print(f"  {root['plain_name']} → ID: {root['id']}, vowel group: {root['vowelGroup']}")
+    if 'syllables' in samples:
+        print("\nSyllables (first 10 from syllables.json):")
+        for root in samples['syllables'][:10]:
+            print(f"  {root['plain_name']} → ID: {root['id']}, vowel group: {root['vowelGroup']}")
     
-    print("\nDialectal Variations (first 5):")
-    for root in dialectal_roots[:5]:
-        print(f"  {root['combined_form']} (vowel group: {root['vowelGroup']})")
+    if 'dialectal_roots' in samples:
+        print("\nDialectal Variations (first 5):")
+        for root in samples['dialectal_roots'][:5]:
+            print(f"  {root['combined_form']} (vowel group: {root['vowelGroup']})")
     
-    print("\nBase Infinitives (first 10):")
-    for inf in base_infinitives[:10]:
-        print(f"  {inf['infinitive_form']} (from {inf['base_root']}, vowel group: {inf['vowelGroup']})")
+    if 'infinitives' in samples:
+        print("\nBase Infinitives (first 10):")
+        for inf in samples['infinitives'][:10]:
+            print(f"  {inf['infinitive_form']} (from {inf['base_root']}, vowel group: {inf['vowelGroup']})")
     
-    print("\nDialectal Infinitives (first 5):")
-    for inf in dialectal_infinitives[:5]:
-        print(f"  {inf['infinitive_form']} (vowel group: {inf['vowelGroup']})")
+    if 'dialectal_infinitives' in samples:
+        print("\nDialectal Infinitives (first 5):")
+        for inf in samples['dialectal_infinitives'][:5]:
+            print(f"  {inf['infinitive_form']} (vowel group: {inf['vowelGroup']})")
     
     print()
     print("✓ Generation complete!")
     print()
     print("Note: All syllables saved in syllables.json with sequential IDs.")
     print("Infinitives and dialectal variations saved as separate collection files.")
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
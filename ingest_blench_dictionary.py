@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Extract verb roots and their glosses from the Onitsha Igbo dictionary PDF.
+
+resources/blench-onitsha-igbo-dictionary.pdf is Kay Williamson's Igbo
+dictionary (Onitsha dialect, draft of edition II, edited by Roger Blench).
+Its entries are one line each at the start of the text column:
+
+    -gba 1.   v.   move:
+    àlùlù 2.   n.   used in:
+
+that is, the headword (verb stems are written with a leading hyphen), an
+optional homonym number, the part of speech and the gloss. Indented
+sub-entries and examples have no part of speech and are skipped.
+
+Williamson marks tone differently from this repository: an unmarked vowel
+is high, a grave is low and a macron is downstep, which becomes mid here.
+So -gba is gbá and -wè is wè.
+
+The PDF is split into pages and each page is extracted and parsed in a
+process pool (--jobs). Results are cached per page in
+generated/blench-dictionary/page-cache.json, keyed by the SHA-256 of the
+page's content stream, so a rerun only parses pages that changed. The
+cache is dropped when this script or tone_engine.py (whose tone marks
+williamson_tones reads) changes, since the parser may have changed with
+them.
+
+Verb entries whose stem is a syllable of syllables.json (a monosyllabic
+prime root) are written to generated/blench-dictionary/prime-roots.json
+as prime-root entries (see HANDLING_HOMOPHONES.md). Each homophone gets
+its own id: gba_001, gba_002, ... in dictionary order.
+
+Reading the PDF needs pypdf (pip install pypdf); parsing and the tests
+do not.
+
+Usage:
+    python3 ingest_blench_dictionary.py [--jobs N] [--pages 80-130] [--force]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+from file_hashes import file_hash
+from generate_verb_roots import save_array_to_json
+from lexicon import get_lexicon
+from tone_engine import MARK_TONES, VOWEL_CLUSTER, apply_tone, nfd, strip_tone
+
+
+REPO_ROOT = Path(__file__).parent
+# Source files whose changes can change parsed records
+PARSER_SOURCES = (Path(__file__), REPO_ROOT / 'tone_engine.py')
+DEFAULT_PDF = REPO_ROOT / 'resources' / 'blench-onitsha-igbo-dictionary.pdf'
+OUTPUT_DIR = REPO_ROOT / 'generated' / 'blench-dictionary'
+PAGE_CACHE_FILE = 'page-cache.json'
+PRIME_ROOTS_FILE = 'prime-roots.json'
+PAGE_CACHE_VERSION = 1
+
+# Part-of-speech abbreviations used in the dictionary
+PARTS_OF_SPEECH = ('v', 'n', 'adj', 'adv', 'aux', 'conj', 'ideo', 'interj', 'num', 'part', 'prep', 'pron', 'q')
+
+# A word: Latin letters with any combining marks (NFC leaves some, e.g. a tone on ị)
+WORD = r"[A-Za-z\u00c0-\u024f\u1e00-\u1eff][A-Za-z\u00c0-\u024f\u1e00-\u1eff\u0300-\u036f'\u2019]*"
+
+# An entry line: headword, homonym number, part of speech and gloss
+ENTRY_LINE = re.compile(
+    rf"^\s*(?P<headword>-?{WORD})\s+(?:(?P<homonym>\d+)\.\s+)?"
+    rf"(?P<pos>{'|'.join(PARTS_OF_SPEECH)})\.(?:\s+(?P<gloss>.*?))?\s*$"
+)
+
+# Running header and page number lines
+PAGE_FURNITURE = re.compile(r'^\s*(?:Igbo Dictionary:.*|[ivxlc]+|\d+)\s*$')
+
+
+def williamson_tones(headword):
+    """Return the tone of each vowel of a headword, read with Williamson's conventions."""
+    tones = []
+    for match in VOWEL_CLUSTER.finditer(nfd(headword)):
+        marks = [MARK_TONES[mark] for mark in match.group()[1:] if mark in MARK_TONES]
+        tones.append(marks[0] if marks else 'high')
+    return tones
+
+
+def parse_page_text(text):
+    """
+    Parse the text of one page into entry records.
+
+    Returns: a list of dicts with headword (NFC, without the hyphen), verb
+    (True for hyphenated stems), homonym (int or None), pos, tones and gloss.
+    An entry whose gloss starts on the next line takes that line.
+    """
+    lines = [unicodedata.normalize('NFC', line) for line in text.splitlines()]
+    lines = [line for line in lines if line.strip() and not PAGE_FURNITURE.match(line)]
+    records = []
+    for index, line in enumerate(lines):
+        match = ENTRY_LINE.match(line)
+        if not match:
+            continue
+        gloss = match.group('gloss') or ''
+        if not gloss and index + 1 < len(lines) and not ENTRY_LINE.match(lines[index + 1]):
+            gloss = lines[index + 1].strip()
+        headword = match.group('headword')
+        records.append({
+            'headword': headword.lstrip('-'),
+            'verb': headword.startswith('-'),
+            'homonym': int(match.group('homonym')) if match.group('homonym') else None,
+            'pos': match.group('pos'),
+            'tones': williamson_tones(headword),
+            'gloss': gloss.rstrip(':;, ').strip(),
+        })
+    return records
+
+
+def build_prime_roots(pages, lexicon):
+    """
+    Turn the verb records of parsed pages into prime-root entries.
+
+    pages is a list of (page number, records) in page order. A verb is a
+    prime root if its stem, with its tone, is a syllable of the lexicon.
+
+    Returns: (prime roots, number of verb records skipped)
+    """
+    prime_roots = []
+    numbers = {}
+    skipped = 0
+    for page_number, records in pages:
+        for record in records:
+            if record['pos'] != 'v':
+                continue
+            plain_name = strip_tone(record['headword']).lower()
+            syllables = lexicon.lookup('syllables', 'plain_name', apply_tone(plain_name, record['tones']))
+            if len(record['tones']) != 1 or not syllables or not record['gloss']:
+                skipped += 1
+                continue
+            numbers[plain_name] = numbers.get(plain_name, 0) + 1
+            prime_roots.append({
+                'id': f"{plain_name}_{numbers[plain_name]:03d}",
+                'plain_name': plain_name,
+                'syllable_id': syllables[0]['id'],
+                'vowelGroup': syllables[0]['vowelGroup'],
+                'gloss': record['gloss'],
+                'source': 'blench-onitsha-igbo-dictionary',
+                'source_page': page_number,
+                'homonym': record['homonym'],
+            })
+    return prime_roots, skipped
+
+
+def parser_version():
+    """Return a hash of the parser sources, so cached pages are reparsed when they change."""
+    digest = hashlib.sha256()
+    for source in PARSER_SOURCES:
+        digest.update(file_hash(source).encode('ascii'))
+    return digest.hexdigest()
+
+
+def load_page_cache(cache_file):
+    """Load the page cache as {page hash: records}, or {} if missing or stale."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get('version') != PAGE_CACHE_VERSION or cache.get('parser') != parser_version():
+        return {}
+    return cache.get('pages', {})
+
+
+def save_page_cache(pages, cache_file):
+    """Save the page cache."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache = {'version': PAGE_CACHE_VERSION, 'parser': parser_version(), 'pages': pages}
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+
+
+def page_hash(page):
+    """Return the SHA-256 of a page's content stream (cheap next to text extraction)."""
+    contents = page.get_contents()
+    return hashlib.sha256(contents.get_data() if contents is not None else b'').hexdigest()
+
+
+_reader = None
+
+
+def open_reader(pdf_path):
+    """Open the PDF once per worker process."""
+    global _reader
+    _reader = PdfReader(pdf_path)
+
+
+def extract_page(page_index):
+    """Extract and parse one page (0-based) of the PDF opened by open_reader."""
+    return parse_page_text(_reader.pages[page_index].extract_text() or '')
+
+
+def parse_page_range(text, page_count):
+    """Parse --pages ('80-130', '12' or '1-5,9'; 1-based) into 0-based page indexes."""
+    indexes = set()
+    for part in text.split(','):
+        first, _, last = part.partition('-')
+        first = int(first)
+        last = int(last) if last else first
+        if not 1 <= first <= last <= page_count:
+            raise ValueError(f"page range {part} outside 1-{page_count}")
+        indexes.update(range(first - 1, last))
+    return sorted(indexes)
+
+
+def main(argv=None):
+    """Extract prime roots from the dictionary PDF."""
+    parser = argparse.ArgumentParser(description="Extract prime verb roots from the Onitsha Igbo dictionary PDF.")
+    parser.add_argument('--pdf', type=Path, default=DEFAULT_PDF, help="dictionary PDF (default: %(default)s)")
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=0,
+        help="number of worker processes (0 = one per CPU, default: 0)"
+    )
+    parser.add_argument('--pages', help="only these pages, e.g. 80-130 or 1-5,9 (1-based)")
+    parser.add_argument('--force', action='store_true', help="ignore the page cache and reparse every page")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if PdfReader is None:
+        print("pypdf is required to read the dictionary PDF: pip install pypdf")
+        return 1
+    if not args.pdf.exists():
+        print(f"Dictionary PDF not found: {args.pdf}")
+        return 1
+
+    print("=" * 70)
+    print("Onitsha Igbo Dictionary Ingestion")
+    print("=" * 70)
+    print()
+
+    reader = PdfReader(args.pdf)
+    page_count = len(reader.pages)
+    try:
+        indexes = parse_page_range(args.pages, page_count) if args.pages else list(range(page_count))
+    except ValueError as e:
+        print(f"Invalid --pages: {e}")
+        return 1
+
+    cache_file = OUTPUT_DIR / PAGE_CACHE_FILE
+    cache = {} if args.force else load_page_cache(cache_file)
+    hashes = {index: page_hash(reader.pages[index]) for index in indexes}
+    todo = [index for index in indexes if hashes[index] not in cache]
+    print(f"{args.pdf.name}: {page_count} pages, {len(indexes)} selected, {len(indexes) - len(todo)} cached")
+
+    # Pages are independent, so they are parsed in parallel; map() keeps page order
+    if todo:
+        print(f"Parsing {len(todo)} pages with {min(jobs, len(todo))} worker(s)...")
+        if jobs > 1 and len(todo) > 1:
+            chunksize = max(1, len(todo) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=open_reader, initargs=(args.pdf,)) as executor:
+                results = list(executor.map(extract_page, todo, chunksize=chunksize))
+        else:
+            open_reader(args.pdf)
+            results = [extract_page(index) for index in todo]
+        for index, records in zip(todo, results):
+            cache[hashes[index]] = records
+        if not args.pages:
+            # A full run drops pages that are no longer in the PDF
+            cache = {page: cache[page] for page in set(hashes.values())}
+        save_page_cache(cache, cache_file)
+
+    pages = [(index + 1, cache[hashes[index]]) for index in indexes]
+    records = [record for _, page_records in pages for record in page_records]
+    verbs = sum(record['pos'] == 'v' for record in records)
+    prime_roots, skipped = build_prime_roots(pages, get_lexicon())
+    output_file = OUTPUT_DIR / PRIME_ROOTS_FILE
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    save_array_to_json(prime_roots, output_file)
+
+    print(f"  {len(records)} entries, {verbs} verbs")
+    print(f"  {len(prime_roots)} prime roots ({len({r['plain_name'] for r in prime_roots})} distinct),"
+          f" {skipped} verbs skipped (not monosyllabic or not in syllables.json)")
+    print(f"  ✓ Saved to {output_file}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
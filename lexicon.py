@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Shared in-memory lexicon over the language-data tree.
+
+Parses syllables.json and the generated verb collections once and builds
+hash indexes over them, so lookups by id, syllable_group, plain_name, tone,
+vowelGroup, consonant or base_root are dictionary probes instead of linear
+scans over the whole inventory. Syllables and infinitives are also indexed
+by their dialect key (see dialects.py), so dialectal variants of a form are
+found with one probe as well, and by their folded form (no tone marks or
+dots), so unmarked input such as "ibe" finds ịbẹ́, ịbẹ, ibè, ... in one probe.
+
+Usage:
+    from lexicon import get_lexicon
+
+    lexicon = get_lexicon()
+    lexicon.get('syl_ma_001')
+    lexicon.lookup('syllables', 'syllable_group', 'ma')
+    lexicon.lookup('infinitives', 'base_root', 'má')
+    lexicon.lookup_dialect('syllables', 'ra')     # la, ra
+    lexicon.search('infinitives', 'ibe')          # ibé, ibe, ibè, ịbẹ́, ...
+"""
+
+import json
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+
+from entries import load_collection
+from tone_engine import fold_diacritics, fold_rank, strip_tone
+
+
+DEFAULT_LANGUAGE_DATA_DIR = Path(__file__).parent / 'language-data'
+
+# Collection name -> file path relative to language-data/
+COLLECTION_FILES = {
+    'syllables': 'syllables.json',
+    'infinitives': 'verbs/generated-infinitives.json',
+    'dialectal_roots': 'verbs/generated-dialectal-roots.json',
+    'dialectal_infinitives': 'verbs/generated-dialectal-infinitives.json',
+}
+
+# Collection name -> fields that get a hash index
+INDEXED_FIELDS = {
+    'syllables': ['syllable_group', 'plain_name', 'tone', 'vowelGroup', 'consonant', 'dialect_key', 'folded'],
+    'infinitives': ['infinitive_form', 'base_root', 'vowelGroup', 'prefix', 'dialect_key', 'folded'],
+    'dialectal_roots': ['base_form', 'dialectal_form', 'combined_form', 'vowelGroup'],
+    'dialectal_infinitives': ['infinitive_form', 'base_root', 'dialectal_root', 'vowelGroup'],
+}
+
+# Collection name -> field holding the written form, from which the derived
+# 'dialect_key' and 'folded' indexes are computed
+FORM_FIELDS = {
+    'syllables': 'plain_name',
+    'infinitives': 'infinitive_form',
+}
+
+
+def load_json(file_path):
+    """Load a JSON file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def index_key(entry, field):
+    """
+    Return the value an entry is indexed under for a field.
+
+    'consonant' is derived from the first phoneme, since syllables.json
+    does not store it as a field of its own.
+    """
+    if field == 'consonant':
+        phonemes = entry.get('phonemes')
+        return phonemes[0] if phonemes else None
+    return entry.get(field)
+
+
+class Lexicon:
+    """
+    Parsed language data with hash indexes.
+
+    Each data file is parsed at most once per Lexicon; collections are
+    loaded eagerly as typed entries (see entries.py), other files
+    (vowels.json, consonants.json, ...) on first access through data().
+    Passing collections (name -> entries) indexes those instead of the
+    collection files, e.g. for a dialect view.
+    """
+
+    def __init__(self, language_data_dir=None, collections=None):
+        self.language_data_dir = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR)
+        self._files = {}
+        self._equivalence = None
+        self.collections = {}
+        self.by_id = {}
+        self.indexes = {}
+
+        for name, rel_path in COLLECTION_FILES.items():
+            if collections is not None:
+                entries = collections.get(name, [])
+            elif (self.language_data_dir / rel_path).exists():
+                entries = load_collection(name, self.language_data_dir / rel_path)
+            else:
+                entries = []
+            if not isinstance(entries, list):
+                entries = []
+            self.collections[name] = entries
+            self._index_collection(name, entries)
+
+    def _index_collection(self, name, entries):
+        """Build the id index and field indexes for one collection."""
+        fields = INDEXED_FIELDS.get(name, [])
+        indexes = {field: defaultdict(list) for field in fields}
+
+        for entry in entries:
+            entry_id = entry.get('id')
+            if entry_id is not None:
+                self.by_id[entry_id] = entry
+            for field in fields:
+                if field == 'dialect_key':
+                    key = self.dialect_key(entry[FORM_FIELDS[name]])
+                elif field == 'folded':
+                    key = fold_diacritics(entry[FORM_FIELDS[name]])
+                else:
+                    key = index_key(entry, field)
+                if key is not None:
+                    indexes[field][key].append(entry)
+
+        # Rank folded candidates once, so search() is a single probe
+        if 'folded' in indexes:
+            form_field = FORM_FIELDS[name]
+            for candidates in indexes['folded'].values():
+                candidates.sort(key=lambda entry: fold_rank(entry[form_field]))
+
+        # Freeze into plain dicts so missing keys don't grow the index
+        self.indexes[name] = {field: dict(index) for field, index in indexes.items()}
+
+    def data(self, rel_path):
+        """Return the parsed contents of a file under language-data/, parsing it once."""
+        if rel_path not in self._files:
+            self._files[rel_path] = load_json(self.language_data_dir / rel_path)
+        return self._files[rel_path]
+
+    def get(self, entry_id, default=None):
+        """Look up an entry by id in any collection."""
+        return self.by_id.get(entry_id, default)
+
+    def lookup(self, collection, field, value):
+        """
+        Return all entries in a collection whose field equals value.
+
+        Raises KeyError if the field is not indexed for that collection.
+        """
+        return self.indexes[collection][field].get(value, [])
+
+    def dialect_key(self, word):
+        """Return the dialect-neutral key of a word (see dialects.py)."""
+        if self._equivalence is None:
+            from dialects import get_equivalence
+            self._equivalence = get_equivalence(self.language_data_dir)
+        return self._equivalence.key(word)
+
+    def lookup_dialect(self, collection, word):
+        """Return all entries in a collection that are dialectal variants of word."""
+        return self.lookup(collection, 'dialect_key', self.dialect_key(word))
+
+    def search(self, collection, text):
+        """
+        Return the entries whose form matches text, ignoring tone marks and dots.
+
+        Candidates are ranked undotted before dotted, then by tone pattern
+        (high, mid, low). Marks present in text move exact matches to the
+        front: first the exact form, then forms with the same dots.
+        """
+        candidates = self.lookup(collection, 'folded', fold_diacritics(text))
+        if text.isascii() or not candidates:
+            return candidates
+
+        form_field = FORM_FIELDS[collection]
+        text = unicodedata.normalize('NFC', text).lower()
+        undotted = strip_tone(text)
+        return sorted(candidates, key=lambda entry: (
+            entry[form_field] != text, strip_tone(entry[form_field]) != undotted
+        ))
+
+    def keys(self, collection, field):
+        """Return the distinct indexed values of a field."""
+        return self.indexes[collection][field].keys()
+
+    @property
+    def syllables(self):
+        return self.collections['syllables']
+
+    @property
+    def infinitives(self):
+        return self.collections['infinitives']
+
+    @property
+    def dialectal_roots(self):
+        return self.collections['dialectal_roots']
+
+    @property
+    def dialectal_infinitives(self):
+        return self.collections['dialectal_infinitives']
+
+    def vowel_groups(self):
+        """Return (a_group, e_group) vowel letter lists from vowels.json."""
+        groups = self.data('vowels.json')['vowelGroups']
+        a_group = [v['letter'] for v in groups['A']['vowels']]
+        e_group = [v['letter'] for v in groups['E']['vowels']]
+        return a_group, e_group
+
+    def consonants(self):
+        """Return the consonant entries from consonants.json."""
+        return self.data('consonants.json')['consonants']
+
+
+_shared = {}
+
+
+def get_lexicon(language_data_dir=None):
+    """Return a process-wide shared Lexicon for a language-data directory."""
+    key = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR).resolve()
+    if key not in _shared:
+        _shared[key] = Lexicon(key)
+    return _shared[key]
+
+
+def main():
+    """Print a summary of the loaded lexicon."""
+    lexicon = get_lexicon()
+
+    print("=" * 70)
+    print("Igbo Lexicon")
+    print("=" * 70)
+    for name, entries in lexicon.collections.items():
+        print(f"  {name}: {len(entries)} entries")
+    print(f"  ids indexed: {len(lexicon.by_id)}")
+    print()
+
+    for field in INDEXED_FIELDS['syllables']:
+        print(f"  syllables by {field}: {len(lexicon.keys('syllables', field))} keys")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Load test for the lexicon lookup service.
+
+Sends a random mix of lookups (ids, syllables, infinitives, dialect
+variants, folded searches and analyses drawn from the lexicon) from several
+concurrent connections and reports throughput and p50/p90/p99 latency.
+Each connection keeps one request in flight; with --batch-size each request
+is a batch of that many lookups.
+
+Without --socket or --port a server is started in a subprocess on a
+temporary Unix socket and stopped afterwards, so the test runs fully locally.
+
+Usage:
+    python3 lexicon_loadtest.py [--clients 16] [--requests 20000]
+    python3 lexicon_loadtest.py --socket generated/lexicon.sock --batch-size 50
+    python3 lexicon_loadtest.py --host 127.0.0.1 --port 8765 --json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from lexicon import get_lexicon
+from lexicon_server import LexiconClient, RequestError
+
+
+def request_pool(lexicon):
+    """Return lookup requests covering every operation and collection."""
+    requests = []
+    for entry in lexicon.syllables:
+        requests.append({'op': 'get', 'key': entry['id']})
+        requests.append({'op': 'syllable', 'form': entry['plain_name']})
+        requests.append({'op': 'dialect', 'word': entry['plain_name']})
+        requests.append({'op': 'search', 'text': entry['syllable_group']})
+    for entry in lexicon.infinitives:
+        requests.append({'op': 'infinitive', 'form': entry['infinitive_form']})
+        requests.append({'op': 'analyze', 'token': entry['infinitive_form']})
+    for entry in lexicon.dialectal_roots:
+        requests.append({'op': 'analyze', 'token': entry['combined_form']})
+    return requests
+
+
+def percentile(sorted_values, fraction):
+    """Return the nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_client(address, requests, batch_size, latencies, errors):
+    """Send requests one (batch) at a time, recording each latency."""
+    client = await LexiconClient.connect(**address)
+    try:
+        for start in range(0, len(requests), batch_size):
+            chunk = requests[start:start + batch_size]
+            began = time.perf_counter()
+            try:
+                if batch_size == 1:
+                    await client.request(**chunk[0])
+                else:
+                    responses = await client.batch(chunk)
+                    errors[0] += sum(1 for r in responses if not r['ok'])
+            except RequestError:
+                errors[0] += 1
+            latencies.append(time.perf_counter() - began)
+    finally:
+        await client.close()
+
+
+async def load_test(address, pool, total, clients, batch_size, seed=0):
+    """
+    Run total lookups, drawn at random from pool, over clients connections.
+
+    Returns: a results dict (counts, seconds, latency percentiles in ms,
+    server stats)
+    """
+    requests = random.Random(seed).choices(pool, k=total)
+    per_client = [requests[i::clients] for i in range(clients)]
+    latencies = []
+    errors = [0]
+
+    began = time.perf_counter()
+    await asyncio.gather(*(
+        run_client(address, chunk, batch_size, latencies, errors) for chunk in per_client if chunk
+    ))
+    elapsed = time.perf_counter() - began
+
+    client = await LexiconClient.connect(**address)
+    try:
+        stats = await client.request('stats')
+    finally:
+        await client.close()
+
+    latencies.sort()
+    return {
+        'lookups': total,
+        'requests': len(latencies),
+        'clients': clients,
+        'batch_size': batch_size,
+        'errors': errors[0],
+        'seconds': round(elapsed, 4),
+        'lookups_per_second': round(total / elapsed) if elapsed else None,
+        'latency_ms': {
+            name: round(percentile(latencies, fraction) * 1000, 3)
+            for name, fraction in (('p50', 0.50), ('p90', 0.90), ('p99', 0.99), ('max', 1.0))
+        },
+        'server': stats,
+    }
+
+
+def start_local_server(socket_path):
+    """Start lexicon_server.py in a subprocess and wait until it listens."""
+    server = subprocess.Popen(
+        [sys.executable, str(Path(__file__).parent / 'lexicon_server.py'), '--socket', str(socket_path)],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = server.stdout.readline()
+    if not line.startswith('Listening'):
+        server.kill()
+        raise RuntimeError('Lexicon server failed to start')
+    return server
+
+
+def main(argv=None):
+    """Run the load test and print a latency report."""
+    parser = argparse.ArgumentParser(description='Load-test the lexicon lookup service.')
+    parser.add_argument('--socket', help='Unix socket of a running server')
+    parser.add_argument('--host', help='TCP host of a running server')
+    parser.add_argument('--port', type=int, help='TCP port of a running server')
+    parser.add_argument('--clients', type=int, default=16, help='concurrent connections (default: 16)')
+    parser.add_argument('--requests', type=int, default=20000, help='total lookups (default: 20000)')
+    parser.add_argument('--batch-size', type=int, default=1, help='lookups per request (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the request mix')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args(argv)
+
+    pool = request_pool(get_lexicon())
+
+    server = None
+    tmp_dir = None
+    if args.host is not None or args.port is not None:
+        address = {'host': args.host, 'port': args.port}
+    elif args.socket:
+        address = {'socket_path': args.socket}
+    else:
+        tmp_dir = tempfile.TemporaryDirectory()
+        socket_path = Path(tmp_dir.name) / 'lexicon.sock'
+        server = start_local_server(socket_path)
+        address = {'socket_path': socket_path}
+
+    try:
+        results = asyncio.run(load_test(
+            address, pool, args.requests, args.clients, max(1, args.batch_size), args.seed
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+            tmp_dir.cleanup()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    latency = results['latency_ms']
+    cache = results['server']['cache']
+    print("=" * 70)
+    print("Lexicon Server Load Test")
+    print("=" * 70)
+    print(f"  {results['lookups']} lookups in {results['requests']} requests "
+          f"over {results['clients']} connections (batch size {results['batch_size']})")
+    print(f"  {results['seconds']:.2f}s, {results['lookups_per_second']} lookups/s, {results['errors']} errors")
+    print(f"  latency: p50 {latency['p50']:.3f} ms, p90 {latency['p90']:.3f} ms, "
+          f"p99 {latency['p99']:.3f} ms, max {latency['max']:.3f} ms")
+    print(f"  cache: {cache['hits']} hits, {cache['misses']} misses, {cache['size']}/{cache['maxsize']} entries")
+    return 0 if results['errors'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Local lookup service over the shared lexicon.
+
+Loads syllables.json, the generated verb collections and the analyzer once
+and answers lookups over a line protocol: each request is one JSON object
+on its own line, each response one JSON line, in request order. Requests
+can be pipelined on one connection.
+
+    {"id": 1, "op": "get", "key": "syl_ma_001"}
+    {"id": 1, "ok": true, "result": {"id": "syl_ma_001", ...}}
+
+Operations:
+
+    get        key                         entry by id (null if unknown)
+    lookup     collection, field, value    Lexicon.lookup()
+    syllable   form                        syllables by plain_name
+    infinitive form                        infinitives by infinitive_form
+    dialect    word [, collection]         Lexicon.lookup_dialect()
+    search     text [, collection]         Lexicon.search()
+    analyze    token                       Analyzer.analyze()
+    batch      requests                    a list of the above (not batches), answered in order
+    stats                                  cache and concurrency counters
+
+Results are kept in a bounded LRU cache keyed by the operation and its
+normalized arguments, stored already encoded, so repeated lookups skip both
+the lookup and JSON encoding. Other request fields are not part of the key,
+and lookups with arguments longer than MAX_CACHED_ARGUMENTS characters are
+answered without being cached, so a full cache stays small whatever clients
+send. At most max_concurrency requests are answered at once across
+all connections; the rest wait on a semaphore.
+
+Usage:
+    python3 lexicon_server.py                            # generated/lexicon.sock
+    python3 lexicon_server.py --host 127.0.0.1 --port 8765
+
+    from lexicon_server import LexiconClient
+
+    client = await LexiconClient.connect(socket_path='generated/lexicon.sock')
+    await client.request('analyze', token='ịbà')
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+from analyzer import get_analyzer
+from entries import to_json
+from lexicon import get_lexicon
+
+
+DEFAULT_SOCKET = Path(__file__).parent / 'generated' / 'lexicon.sock'
+
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Largest accepted batch and request line
+MAX_BATCH = 1000
+MAX_LINE = 1 << 20
+
+# Request fields that carry text and are normalized to NFC
+TEXT_FIELDS = ('key', 'value', 'form', 'word', 'text', 'token')
+
+# Arguments of each operation as (name, default), in call order
+OPERATION_ARGUMENTS = {
+    'get': (('key', None),),
+    'lookup': (('collection', None), ('field', None), ('value', None)),
+    'syllable': (('form', None),),
+    'infinitive': (('form', None),),
+    'dialect': (('collection', 'syllables'), ('word', None)),
+    'search': (('collection', 'syllables'), ('text', None)),
+    'analyze': (('token', None),),
+}
+
+# Longest total argument length whose result is cached (no lexicon form comes close)
+MAX_CACHED_ARGUMENTS = 256
+
+
+class RequestError(Exception):
+    """A request that cannot be answered (reported to the client, not raised)."""
+
+
+class ResponseCache:
+    """Bounded LRU cache from request keys to encoded results."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached value for key (refreshing it), or None."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Cache a value, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        """Return the cache counters."""
+        return {
+            'size': len(self.entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def argument(request, name, default=None):
+    """Return a string argument of a request, NFC-normalized if it is text."""
+    value = request.get(name, default)
+    if value is None:
+        raise RequestError(f"'{request.get('op')}' needs '{name}'")
+    if not isinstance(value, str):
+        raise RequestError(f"'{name}' must be a string")
+    if name in TEXT_FIELDS:
+        value = unicodedata.normalize('NFC', value)
+    return value
+
+
+def encode(value):
+    """Encode a result or response as compact JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=to_json)
+
+
+class LexiconService:
+    """Answers lookup requests against one lexicon, independent of transport."""
+
+    def __init__(self, language_data_dir=None, cache_size=DEFAULT_CACHE_SIZE,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        self.lexicon = get_lexicon(language_data_dir)
+        self.analyzer = get_analyzer(language_data_dir)
+        self.cache = ResponseCache(cache_size)
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.active = 0
+        self.peak_active = 0
+        self.requests = 0
+
+        # Called with the arguments listed in OPERATION_ARGUMENTS
+        self.operations = {
+            'get': self.lexicon.get,
+            'lookup': self.lookup,
+            'syllable': lambda form: self.lookup('syllables', 'plain_name', form),
+            'infinitive': lambda form: self.lookup('infinitives', 'infinitive_form', form),
+            'dialect': lambda collection, word: self.lexicon.lookup_dialect(
+                self.collection(collection, 'dialect_key'), word
+            ),
+            'search': lambda collection, text: self.lexicon.search(self.collection(collection, 'folded'), text),
+            'analyze': self.analyzer.analyze,
+        }
+
+    def collection(self, name, field):
+        """Return a collection name after checking that it has an index on field."""
+        indexes = self.lexicon.indexes.get(name)
+        if not indexes:
+            raise RequestError(f"Unknown collection '{name}'")
+        if field not in indexes:
+            raise RequestError(f"Collection '{name}' has no '{field}' index")
+        return name
+
+    def lookup(self, collection, field, value):
+        """Lexicon.lookup() with request errors for unknown indexes."""
+        return self.lexicon.lookup(self.collection(collection, field), field, value)
+
+    def result(self, request):
+        """
+        Return the encoded result of a single (non-batch) request.
+
+        Results are served from and added to the response cache, keyed by
+        (op, *arguments); stats requests and overlong arguments bypass it.
+        """
+        op = request.get('op')
+        if op == 'stats':
+            return encode(self.stats())
+        operation = self.operations.get(op) if isinstance(op, str) else None
+        if operation is None:
+            raise RequestError(f"Unknown op '{op}'")
+
+        args = tuple(argument(request, name, default) for name, default in OPERATION_ARGUMENTS[op])
+        if sum(map(len, args)) > MAX_CACHED_ARGUMENTS:
+            return encode(operation(*args))
+        key = (op,) + args
+        result = self.cache.get(key)
+        if result is None:
+            result = encode(operation(*args))
+            self.cache.put(key, result)
+        return result
+
+    def response(self, request, in_batch=False):
+        """
+        Return the encoded response line (without newline) for a request.
+
+        Batches cannot be nested, so one line is at most MAX_BATCH lookups.
+        """
+        self.requests += 1
+        if not isinstance(request, dict):
+            return encode({'id': None, 'ok': False, 'error': 'Request must be a JSON object'})
+
+        request_id = request.get('id')
+        try:
+            if request.get('op') == 'batch':
+                if in_batch:
+                    raise RequestError("Batches cannot be nested")
+                requests = request.get('requests')
+                if not isinstance(requests, list):
+                    raise RequestError("'batch' needs a 'requests' list")
+                if len(requests) > MAX_BATCH:
+                    raise RequestError(f"Batches are limited to {MAX_BATCH} requests")
+                result = '[' + ','.join(self.response(r, in_batch=True) for r in requests) + ']'
+            else:
+                result = self.result(request)
+        except RequestError as e:
+            return encode({'id': request_id, 'ok': False, 'error': str(e)})
+        return f'{{"id":{encode(request_id)},"ok":true,"result":{result}}}'
+
+    def answer(self, line):
+        """Return the encoded response line for a raw request line."""
+        try:
+            request = json.loads(line)
+        except (ValueError, RecursionError):
+            # RecursionError: nested too deeply for the JSON parser
+            self.requests += 1
+            return encode({'id': None, 'ok': False, 'error': 'Invalid JSON'})
+        return self.response(request)
+
+    async def serve_client(self, reader, writer):
+        """
+        Answer request lines from one connection until it closes.
+
+        A concurrency slot is held until the response has been flushed, so
+        slow readers hold back new work instead of buffering responses.
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(encode({'id': None, 'ok': False, 'error': 'Request line too long'}).encode() + b'\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                async with self.semaphore:
+                    self.active += 1
+                    self.peak_active = max(self.peak_active, self.active)
+                    try:
+                        writer.write(self.answer(line).encode('utf-8') + b'\n')
+                        await writer.drain()
+                    finally:
+                        self.active -= 1
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def stats(self):
+        """Return the service counters."""
+        return {
+            'requests': self.requests,
+            'cache': self.cache.stats(),
+            'max_concurrency': self.max_concurrency,
+            'peak_active': self.peak_active,
+            'collections': {name: len(entries) for name, entries in self.lexicon.collections.items()},
+        }
+
+
+async def start_server(service, socket_path=None, host=None, port=None):
+    """
+    Start serving on a Unix socket or, if host/port is given, over TCP.
+
+    Returns: the asyncio server
+    """
+    if host is not None or port is not None:
+        return await asyncio.start_server(
+            service.serve_client, host or '127.0.0.1', port or 0, limit=MAX_LINE
+        )
+
+    socket_path = Path(socket_path or DEFAULT_SOCKET)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+    return await asyncio.start_unix_server(service.serve_client, str(socket_path), limit=MAX_LINE)
+
+
+def server_address(server):
+    """Return a printable address of a started server."""
+    address = server.sockets[0].getsockname()
+    if isinstance(address, tuple):
+        return f"{address[0]}:{address[1]}"
+    return address
+
+
+class LexiconClient:
+    """Line-protocol client for the lookup service (one request in flight)."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+
+    @classmethod
+    async def connect(cls, socket_path=None, host=None, port=None):
+        """Connect to a Unix socket or, if host/port is given, over TCP."""
+        if host is not None or port is not None:
+            reader, writer = await asyncio.open_connection(host or '127.0.0.1', port, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_unix_connection(str(socket_path or DEFAULT_SOCKET), limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def send(self, request):
+        """Send a raw request object and return the decoded response."""
+        self.writer.write(encode(request).encode('utf-8') + b'\n')
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError('Lexicon server closed the connection')
+        return json.loads(line)
+
+    async def request(self, op, **args):
+        """
+        Send one request and return its result.
+
+        Raises RequestError if the server reports an error.
+        """
+        self.next_id += 1
+        response = await self.send(dict(args, id=self.next_id, op=op))
+        if not response['ok']:
+            raise RequestError(response['error'])
+        return response['result']
+
+    async def batch(self, requests):
+        """Send a list of request objects as one batch; return their responses."""
+        self.next_id += 1
+        response = await self.send({'id': self.next_id, 'op': 'batch', 'requests': requests})
+        if not response['ok']:
+            raise RequestError(response['error'])
+        return response['result']
+
+    async def close(self):
+        """Close the connection."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve(args):
+    """Run the server until interrupted."""
+    service = LexiconService(cache_size=args.cache_size, max_concurrency=args.max_concurrency)
+    server = await start_server(service, args.socket, args.host, args.port)
+    print(f"Listening on {server_address(server)}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Parse arguments and run the server."""
+    parser = argparse.ArgumentParser(description='Serve lexicon lookups over a JSON line protocol.')
+    parser.add_argument('--socket', help=f'Unix socket path (default: {DEFAULT_SOCKET})')
+    parser.add_argument('--host', help='serve over TCP on this host instead')
+    parser.add_argument('--port', type=int, help='TCP port (with --host; 0 picks a free port)')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'response cache entries (default: {DEFAULT_CACHE_SIZE})')
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f'requests answered at once (default: {DEFAULT_MAX_CONCURRENCY})')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Finite-state generation of surface verb forms.
+
+A verb form is composed from the components referenced by the verb-form
+files (see SCHEMA.md): particles, an auxiliary, a prefix, the prime root and
+suffixes. The components are compiled into a transducer of slots, in
+surface order:
+
+    particle?  auxiliary?  prefix? + ROOT + suffix?
+
+Each slot holds its arcs (morpheme id -> output string) once per harmony
+state. Harmonizing morphemes (prefixes and suffixes) are realized in the
+vowel group of the root when the transducer is compiled, so a root in the
+E group only ever sees arcs such as 'e', 'i', 'o' and 'ro', and no
+disharmonic form is produced and then filtered out. Particles and the
+auxiliary are free words and do not harmonize.
+
+Enumeration is lazy: roots and tenses are walked one at a time and only
+the (small) set of affix choices for the current root is expanded, so a
+full paradigm can be streamed without building the cross product.
+
+tenses.json only names the tenses; tense does not change the surface form
+by itself, so every tense uses the same slots.
+
+Usage:
+    from morphology import get_transducer
+
+    transducer = get_transducer()
+    transducer.realize(verb_form)              # surface form of a verb-form entry
+    for form in transducer.forms(roots=['syl_ma_001']):
+        print(form['surface'])
+
+    python3 morphology.py --root ma --tense simplePresent
+"""
+
+import argparse
+import json
+import sys
+from itertools import product
+
+from lexicon import get_lexicon
+from tone_engine import apply_tone, tone_pattern, strip_tone
+
+
+# Vowel harmony counterparts (NFC, without tone)
+HARMONY_PAIRS = {
+    'A': {'e': 'a', 'i': 'ị', 'o': 'ọ', 'u': 'ụ'},
+    'E': {'a': 'e', 'ẹ': 'e', 'ị': 'i', 'ọ': 'o', 'ụ': 'u'},
+}
+
+# Component directories under verbs/, in surface slot order
+COMPONENT_DIRS = {
+    'particles': 'particles',
+    'auxiliary': 'auxiliaries',
+    'prefix': 'prefixes',
+    'suffixes': 'suffixes',
+}
+
+# Slots that harmonize with the root
+HARMONIZING_SLOTS = ('prefix', 'suffixes')
+
+def harmonize(form, vowel_group):
+    """
+    Realize a morpheme in a vowel group, keeping its tones.
+
+    Each vowel is swapped for its counterpart in the other group; vowels
+    already in the group (and consonants) are left alone.
+    """
+    pairs = HARMONY_PAIRS.get(vowel_group)
+    if not pairs:
+        return form
+
+    tones = tone_pattern(form)
+    bare = strip_tone(form)
+    swapped = ''.join(pairs.get(char, char) for char in bare)
+    if swapped == bare:
+        return form
+    return apply_tone(swapped, tones)
+
+
+def morpheme_form(morpheme):
+    """
+    Return the written form of a morpheme.
+
+    Morphemes listing their syllables (auxiliaries) get those tones marked.
+    """
+    name = morpheme['name']
+    syllables = morpheme.get('syllables')
+    if syllables:
+        return apply_tone(name, [s.get('tone', 'mid') for s in syllables])
+    return name
+
+
+def load_components(verbs_dir, subdir):
+    """Load all morphemes in a verbs/ subdirectory, sorted by id."""
+    morphemes = []
+    for path in sorted((verbs_dir / subdir).glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        morphemes.extend(data if isinstance(data, list) else [data])
+    return sorted((m for m in morphemes if 'id' in m and 'name' in m), key=lambda m: m['id'])
+
+
+class VerbFormTransducer:
+    """
+    Slot transducer over the verb components of a language-data tree.
+
+    arcs[slot][vowel_group] is the list of (morpheme id, output) pairs a
+    root of that vowel group can take in that slot.
+    """
+
+    def __init__(self, language_data_dir=None):
+        self.lexicon = get_lexicon(language_data_dir)
+        verbs_dir = self.lexicon.language_data_dir / 'verbs'
+
+        self.components = {}
+        self.morphemes = {}
+        for slot, subdir in COMPONENT_DIRS.items():
+            self.components[slot] = load_components(verbs_dir, subdir)
+            for morpheme in self.components[slot]:
+                self.morphemes[morpheme['id']] = morpheme
+
+        tenses_file = verbs_dir / 'tenses.json'
+        self.tenses = list(self.lexicon.data('verbs/tenses.json')) if tenses_file.exists() else []
+
+        self.arcs = {slot: self.compile_slot(slot) for slot in COMPONENT_DIRS}
+
+    def compile_slot(self, slot):
+        """
+        Compile the arcs of one slot for each vowel group.
+
+        Allomorphs that harmonize to the same output (prefix_a and prefix_e
+        for an A-group root) collapse into one arc, keeping the morpheme
+        whose own form is the realized one.
+        """
+        arcs = {}
+        for group in HARMONY_PAIRS:
+            realized = {}
+            for morpheme in self.components[slot]:
+                form = morpheme_form(morpheme)
+                output = harmonize(form, group) if slot in HARMONIZING_SLOTS else form
+                if output not in realized or form == output:
+                    realized[output] = morpheme['id']
+            arcs[group] = [(morpheme_id, output) for output, morpheme_id in realized.items()]
+        return arcs
+
+    def resolve_root(self, root_id):
+        """
+        Look up a root entry by id.
+
+        Verb forms refer to roots as e.g. 'ma_001'; these resolve to the
+        syllable with the same group and number ('syl_ma_001').
+        """
+        root = self.lexicon.get(root_id) or self.lexicon.get(f"syl_{root_id}")
+        if root is None:
+            raise KeyError(f"Unknown root '{root_id}'")
+        return root
+
+    def realize_output(self, vowel_group, root_form, particles=(), auxiliary=None,
+                       prefix=None, suffixes=()):
+        """Compose the surface string for a root and chosen morpheme ids."""
+        words = []
+        for slot, morpheme_ids in (('particles', particles), ('auxiliary', [auxiliary] if auxiliary else [])):
+            for morpheme_id in morpheme_ids:
+                words.append(self.output(slot, vowel_group, morpheme_id))
+
+        verb = root_form
+        if prefix:
+            verb = self.output('prefix', vowel_group, prefix) + verb
+        for suffix in suffixes:
+            verb += self.output('suffixes', vowel_group, suffix)
+        words.append(verb)
+        return ' '.join(words)
+
+    def output(self, slot, vowel_group, morpheme_id):
+        """Return the output of a morpheme in a slot for a vowel group."""
+        morpheme = self.morphemes.get(morpheme_id)
+        if morpheme is None:
+            raise KeyError(f"Unknown {slot} '{morpheme_id}'")
+        form = morpheme_form(morpheme)
+        return harmonize(form, vowel_group) if slot in HARMONIZING_SLOTS else form
+
+    def realize(self, verb_form):
+        """Return the surface form of a verb-form entry (as in verb-forms/*.json)."""
+        root = self.resolve_root(verb_form['primeRoot'])
+        return self.realize_output(
+            root['vowelGroup'], root['plain_name'],
+            particles=verb_form.get('particles', []),
+            auxiliary=verb_form.get('auxiliary'),
+            prefix=verb_form.get('prefix'),
+            suffixes=verb_form.get('suffixes', []),
+        )
+
+    def forms(self, roots=None, tenses=None):
+        """
+        Lazily enumerate verb forms.
+
+        roots is an iterable of root ids or root entries (default: every
+        syllable); tenses a list of tense names (default: tenses.json).
+        Each slot is optional; a form takes at most one morpheme per slot.
+        """
+        if roots is None:
+            roots = self.lexicon.syllables
+        tenses = list(self.tenses if tenses is None else tenses)
+
+        for root in roots:
+            if isinstance(root, str):
+                root = self.resolve_root(root)
+            group = root['vowelGroup']
+            root_form = root['plain_name']
+
+            # Arcs for this root's harmony state; None is the empty arc
+            choices = [[(None, '')] + self.arcs[slot][group] for slot in COMPONENT_DIRS]
+
+            for tense in tenses:
+                for (particle, particle_out), (aux, aux_out), (prefix, prefix_out), (suffix, suffix_out) \
+                        in product(*choices):
+                    words = [w for w in (particle_out, aux_out) if w]
+                    words.append(prefix_out + root_form + suffix_out)
+
+                    morpheme_ids = [m for m in (particle, aux, prefix, suffix) if m]
+                    yield {
+                        'id': '_'.join([root['id'], *morpheme_ids, tense]),
+                        'surface': ' '.join(words),
+                        'primeRoot': root['id'],
+                        'auxiliary': aux,
+                        'prefix': prefix,
+                        'suffixes': [suffix] if suffix else [],
+                        'particles': [particle] if particle else [],
+                        'tense': tense,
+                        'vowelGroup': group,
+                    }
+
+    def paradigm_size(self, roots=None, tenses=None):
+        """Return how many forms forms() yields, without enumerating them."""
+        if roots is None:
+            roots = self.lexicon.syllables
+        tenses = self.tenses if tenses is None else tenses
+
+        per_group = {}
+        for group in HARMONY_PAIRS:
+            size = 1
+            for slot in COMPONENT_DIRS:
+                size *= len(self.arcs[slot][group]) + 1
+            per_group[group] = size
+
+        total = 0
+        for root in roots:
+            if isinstance(root, str):
+                root = self.resolve_root(root)
+            total += per_group[root['vowelGroup']]
+        return total * len(tenses)
+
+
+_shared = {}
+
+
+def get_transducer(language_data_dir=None):
+    """Return a process-wide shared transducer for a language-data directory."""
+    key = get_lexicon(language_data_dir).language_data_dir
+    if key not in _shared:
+        _shared[key] = VerbFormTransducer(key)
+    return _shared[key]
+
+
+def main(argv=None):
+    """Print generated verb forms."""
+    parser = argparse.ArgumentParser(description='Generate surface verb forms.')
+    parser.add_argument('--root', action='append',
+                        help='syllable group or root id to generate (repeatable; default: all)')
+    parser.add_argument('--tense', action='append', help='tense to generate (repeatable; default: all)')
+    parser.add_argument('--limit', type=int, default=0, help='stop after this many forms')
+    parser.add_argument('--json', action='store_true', help='print one JSON entry per line')
+    parser.add_argument('--count', action='store_true', help='only print the paradigm size')
+    args = parser.parse_args(argv)
+
+    transducer = get_transducer()
+
+    roots = None
+    if args.root:
+        lexicon = transducer.lexicon
+        roots = []
+        try:
+            for name in args.root:
+                roots.extend(lexicon.lookup('syllables', 'syllable_group', name) or [transducer.resolve_root(name)])
+        except KeyError as e:
+            print(e.args[0])
+            return 1
+
+    if args.count:
+        print(transducer.paradigm_size(roots, args.tense))
+        return 0
+
+    out = sys.stdout
+    for count, form in enumerate(transducer.forms(roots, args.tense), start=1):
+        if args.json:
+            out.write(json.dumps(form, ensure_ascii=False) + '\n')
+        else:
+            out.write(f"{form['surface']}\t{form['id']}\n")
+        if count == args.limit:
+            break
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
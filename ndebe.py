@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Transliteration of Latin-script Igbo into the Ndebe script.
+
+Ndebe has no Unicode block, so language-data/ndebe-mapping.json assigns
+each unit of the script a Private Use Area code point (from U+E000): every
+vowel, every syllabic nasal and every syllable group of syllables.json
+('ba', 'gbẹ', 'm̩a', ...). Code points are allocated once and never
+reassigned, so text transliterated today still reads the same after new
+syllables are added. A font (or a real glyph assignment, edited into the
+mapping) gives them their shapes. Tones are written as in Latin, with the
+combining acute (high) and grave (low) after the glyph; mid is unmarked.
+
+The Transliterator compiles the mapping into a trie-shaped regular
+expression over the decomposed (NFD) syllables and translates each word
+(split at spaces and newlines) in one longest-match pass, so 'gba' is one
+glyph, not g + ba. Tone marks are not part of any syllable, so they pass
+through unchanged. Syllabic nasals written as in running text (m̀, ń, a
+bare m or n before a consonant) are read as m̩ and n̩ (see
+mark_syllabic_nasals). Words are cached, so on running text, where most
+words repeat, the cost is one dictionary probe per word (about 15 MB/s
+of UTF-8 per process; see the ndebe stage of benchmark.py). Characters that are not
+part of a syllable (digits, punctuation, other scripts) are copied
+through, lowercased and NFC-normalized.
+
+With generate_verb_roots.py the mapping is extended with any new syllable
+group, and the ndebe (glyphs) and unicode (code point notation, e.g.
+"U+E02A U+0301") fields of syllables.json are filled in.
+
+NdebeDecoder goes the other way. Its table inverts the mapping (one key
+per glyph and tone mark) and takes the exact forms of the syllable table
+from the ndebe fields of syllables.json. It decodes chunk by chunk, holding
+back a glyph at the end of a chunk until its tone mark (or the absence of
+one) is known, and decodes bytes incrementally, so a glyph may be split
+anywhere. Words are cached as in the Transliterator (about 20 MB/s of
+Ndebe UTF-8; see the ndebe_decode stage of benchmark.py).
+
+Usage:
+    from ndebe import get_transliterator
+
+    ndebe = get_transliterator()
+    ndebe.transliterate('ịbá')                     # '\\ue002\\ue00b\\u0301'
+    for piece in ndebe.stream(open('archive.txt', encoding='utf-8')): ...
+
+    python3 ndebe.py ịbá gbá                       # one line per word
+    python3 ndebe.py < text.txt > text.ndebe       # stream stdin
+    python3 ndebe.py --update-mapping              # add new syllable groups
+
+    from ndebe import get_decoder
+
+    decoder = get_decoder()
+    for piece in decoder.stream(open('text.ndebe', 'rb')): ...
+    python3 ndebe.py --decode < text.ndebe > text.txt
+"""
+
+import argparse
+import codecs
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+from lexicon import DEFAULT_LANGUAGE_DATA_DIR, load_json
+from tone_engine import TONE_MARKS, TONES, apply_tone
+
+
+MAPPING_FILE = 'ndebe-mapping.json'
+MAPPING_VERSION = 1
+
+# Private Use Area of the Basic Multilingual Plane
+PUA_START = 0xE000
+PUA_END = 0xF8FF
+
+# Characters read per chunk when streaming a file
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Longest run without whitespace kept back between stream chunks
+MAX_PENDING = 1 << 16
+
+# Base letters of the vowels (dots and tone marks decompose off them)
+VOWEL_LETTERS = 'aeiou'
+
+# Most distinct words kept in a Transliterator's word cache
+WORD_CACHE_SIZE = 1 << 18
+
+
+def code_point(notation):
+    """Return the character of a 'U+E000' notation."""
+    return chr(int(notation[2:], 16))
+
+
+def code_point_notation(text):
+    """Return the 'U+E000 U+0301' notation of every character of text."""
+    return ' '.join(f"U+{ord(c):04X}" for c in text)
+
+
+def load_mapping(mapping_file):
+    """Return {latin unit: glyph} from a mapping file, or {} if there is none."""
+    try:
+        data = load_json(mapping_file)
+    except FileNotFoundError:
+        return {}
+    if data.get('version') != MAPPING_VERSION:
+        raise ValueError(f"{mapping_file}: unsupported mapping version {data.get('version')}")
+    return {unit: code_point(notation) for unit, notation in data['glyphs'].items()}
+
+
+def save_mapping(glyphs, mapping_file):
+    """Write {latin unit: glyph}, in allocation order."""
+    data = {
+        '_comment': "Latin syllable -> Ndebe glyph (Private Use Area code point); "
+                    "tones are written after the glyph as combining acute (high) and grave (low). "
+                    "Maintained by generate_verb_roots.py / ndebe.py --update-mapping; never reassign a code point.",
+        'version': MAPPING_VERSION,
+        'glyphs': {unit: code_point_notation(glyph) for unit, glyph in glyphs.items()},
+    }
+    with open(mapping_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def script_units(language_data_dir, syllable_groups=None):
+    """
+    Return the Latin units that get a glyph, in allocation order.
+
+    Vowels (A group, then E group), then syllabic nasals, then syllable
+    groups (by default those of syllables.json, in file order).
+    """
+    language_data_dir = Path(language_data_dir)
+    vowel_groups = load_json(language_data_dir / 'vowels.json')['vowelGroups']
+    units = [v['letter'] for group in ('A', 'E') for v in vowel_groups[group]['vowels']]
+    consonants = load_json(language_data_dir / 'consonants.json')['consonants']
+    units.extend(c['letter'] for c in consonants if c.get('syllabic'))
+    if syllable_groups is None:
+        syllables = load_json(language_data_dir / 'syllables.json')
+        syllable_groups = [s['syllable_group'] for s in syllables] if isinstance(syllables, list) else []
+    units.extend(syllable_groups)
+    return [unicodedata.normalize('NFC', unit) for unit in dict.fromkeys(units)]
+
+
+def update_mapping(language_data_dir=None, syllable_groups=None):
+    """
+    Give every unit of script_units() without a glyph the next free code point.
+
+    Existing assignments are never changed. The mapping file is only
+    written when something was added (or it doesn't exist yet).
+
+    Returns: the number of glyphs added
+    """
+    language_data_dir = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR)
+    mapping_file = language_data_dir / MAPPING_FILE
+    glyphs = load_mapping(mapping_file)
+    next_code = max((ord(g) for g in glyphs.values()), default=PUA_START - 1) + 1
+
+    added = 0
+    for unit in script_units(language_data_dir, syllable_groups):
+        if unit in glyphs:
+            continue
+        if next_code > PUA_END:
+            raise ValueError("The Private Use Area is full")
+        glyphs[unit] = chr(next_code)
+        next_code += 1
+        added += 1
+
+    if added or not mapping_file.exists():
+        save_mapping(glyphs, mapping_file)
+    return added
+
+
+def trie_pattern(keys):
+    """
+    Return a regular expression matching the longest of keys at a position.
+
+    Keys sharing a prefix share a branch, and a shorter key is an optional
+    end of a longer one's branch, so the greedy match backtracks only as
+    far as the longest key that fits.
+    """
+    trie = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = []
+        leaves = []
+        for char, child in sorted(node.items()):
+            if char == '':
+                continue
+            if list(child) == ['']:
+                leaves.append(re.escape(char))
+            else:
+                branches.append(re.escape(char) + build(child))
+        if leaves:
+            branches.append(leaves[0] if len(leaves) == 1 else f"[{''.join(leaves)}]")
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if '' in node:
+            return f"(?:{pattern})?"
+        return pattern
+
+    return build(trie)
+
+
+def syllable_boundary(text):
+    """
+    Return the last position in text after a vowel and its marks.
+
+    Igbo syllables end in a vowel (or are a syllabic nasal), so text can be
+    cut there without splitting a syllable. Without any vowel, the cut is
+    before the last base character, keeping its marks with it.
+    """
+    for cut in range(len(text) - 1, 0, -1):
+        if unicodedata.combining(text[cut]):
+            continue
+        base = cut - 1
+        while base > 0 and unicodedata.combining(text[base]):
+            base -= 1
+        if unicodedata.normalize('NFD', text[base])[0].lower() in VOWEL_LETTERS:
+            return cut
+    cut = len(text) - 1
+    while cut > 0 and unicodedata.combining(text[cut]):
+        cut -= 1
+    return cut
+
+
+class _WordCache(dict):
+    """Word -> transliteration, computed on first use."""
+
+    def __init__(self, translate_word):
+        super().__init__()
+        self.translate_word = translate_word
+
+    def __missing__(self, word):
+        result = self.translate_word(word)
+        if len(self) < WORD_CACHE_SIZE:
+            self[word] = result
+        return result
+
+
+# Syllabic nasal mark (consonants.json spells the syllabic nasals m̩ and n̩)
+SYLLABIC_MARK = '\u0329'
+
+# A bare m or n in NFD text, with its tone marks, that is not followed by a
+# vowel or another combining mark (so not an onset, ṅ, or already m̩/n̩);
+# the last group is the character after it, if any
+BARE_NASAL = re.compile('([mn])([\u0300\u0301\u0304]*)(?![\u0300-\u036f]|[aeiou])(?=(.?))', re.S)
+
+
+def mark_syllabic_nasals(decomposed, nasals='mn'):
+    """
+    Spell the syllabic nasals of an NFD word as m̩ and n̩.
+
+    Running text writes them m, ḿ, m̀, n, ń, ǹ: a nasal before a consonant
+    or at the end of a word, as in m̀ma and ńne. An unmarked n before w or y
+    is taken as the consonant nw or ny. Syllabic ṅ has no unit of its own
+    in consonants.json, so it is left as the consonant ṅ.
+    """
+    if 'm' not in decomposed and 'n' not in decomposed:
+        return decomposed
+
+    def replace(match):
+        nasal, marks, following = match.groups()
+        if nasal not in nasals or (nasal == 'n' and not marks and following in ('w', 'y')):
+            return match.group(1) + marks
+        return nasal + SYLLABIC_MARK + marks
+
+    return BARE_NASAL.sub(replace, decomposed)
+
+
+class Transliterator:
+    """Latin -> Ndebe transliteration compiled from a glyph mapping."""
+
+    def __init__(self, glyphs):
+        self.glyphs = dict(glyphs)
+        # Keys are matched decomposed, so tone marks split off from the letters
+        self.table = {unicodedata.normalize('NFD', unit): glyph for unit, glyph in self.glyphs.items()}
+        self.pattern = re.compile(f"({trie_pattern(self.table)})")
+        # Nasals that have a syllabic glyph (see mark_syllabic_nasals)
+        self.syllabic_nasals = ''.join(n for n in 'mn' if n + SYLLABIC_MARK in self.table)
+        self._words = _WordCache(self._translate_word)
+
+    @classmethod
+    def from_file(cls, mapping_file):
+        """Build a transliterator from a mapping file."""
+        return cls(load_mapping(mapping_file))
+
+    def _translate_word(self, word):
+        """Transliterate one word (no whitespace) in a single longest-match pass."""
+        decomposed = mark_syllabic_nasals(unicodedata.normalize('NFD', word).lower(), self.syllabic_nasals)
+        parts = self.pattern.split(decomposed)
+        # split() alternates unmatched text and matched keys; only keys are in the table
+        table = self.table
+        return unicodedata.normalize('NFC', ''.join(map(table.get, parts, parts)))
+
+    def transliterate(self, text):
+        """Transliterate a text, keeping its whitespace."""
+        words = self._words.__getitem__
+        return '\n'.join([' '.join(map(words, line.split(' '))) for line in text.split('\n')])
+
+    def stream(self, chunks):
+        """
+        Transliterate text arriving in chunks (e.g. a file read in blocks).
+
+        Each chunk is cut after its last space or newline and the rest is
+        held back for the next one, so no word is split. A run of more
+        than MAX_PENDING characters without whitespace is cut at its last
+        syllable boundary (see syllable_boundary).
+        """
+        pending = ''
+        for chunk in chunks:
+            text = pending + chunk
+            cut = max(text.rfind(' '), text.rfind('\n')) + 1
+            if cut == 0:
+                if len(text) < MAX_PENDING:
+                    pending = text
+                    continue
+                cut = syllable_boundary(text)
+            pending = text[cut:]
+            if cut:
+                yield self.transliterate(text[:cut])
+        if pending:
+            yield self.transliterate(pending)
+
+    def transliterate_file(self, src, dst, chunk_size=STREAM_CHUNK_SIZE):
+        """Transliterate one text file object into another, chunk by chunk."""
+        for piece in self.stream(iter(lambda: src.read(chunk_size), '')):
+            dst.write(piece)
+
+    def entry_fields(self, plain_name):
+        """Return the (ndebe, unicode) fields of a syllables.json entry."""
+        ndebe = self.transliterate(plain_name)
+        return ndebe, code_point_notation(ndebe)
+
+
+def toned_unit(unit, tone):
+    """Return a Latin unit with a tone marked (on its vowel, or on a syllabic nasal)."""
+    toned = apply_tone(unit, tone)
+    if toned == unicodedata.normalize('NFC', unit) and TONE_MARKS[tone]:
+        toned = unicodedata.normalize('NFC', unicodedata.normalize('NFD', unit) + TONE_MARKS[tone])
+    return toned
+
+
+def inverse_table(glyphs, syllables=()):
+    """
+    Return {glyph + tone mark: toned Latin} for decoding.
+
+    Every glyph gets an entry per tone. Entries of syllables.json (whose
+    ndebe field is set) override these with their plain_name, so decoding
+    gives back exactly the forms of the syllable table.
+    """
+    table = {}
+    for unit, glyph in glyphs.items():
+        for tone in TONES:
+            table[glyph + TONE_MARKS[tone]] = toned_unit(unit, tone)
+    for entry in syllables:
+        if entry.get('ndebe'):
+            table[entry['ndebe']] = entry['plain_name']
+    return table
+
+
+class NdebeDecoder:
+    """
+    Incremental Ndebe -> Latin decoder (the inverse of Transliterator).
+
+    decode() takes text chunk by chunk. A glyph at the very end of a chunk
+    is held back, since its tone mark may arrive with the next chunk; a
+    glyph and its mark are always decoded together. stream() also accepts
+    bytes, decoding UTF-8 incrementally, so a glyph's three bytes may be
+    split across chunks too. Characters that are not glyphs pass through.
+    """
+
+    def __init__(self, table):
+        self.table = dict(table)
+        self.glyph_chars = frozenset(key[0] for key in self.table)
+        glyph_class = ''.join(re.escape(c) for c in sorted(self.glyph_chars))
+        marks = ''.join(mark for mark in TONE_MARKS.values() if mark)
+        self.pattern = re.compile(f"([{glyph_class}][{marks}]?)")
+        self.pending = ''
+        self._words = _WordCache(self._decode_word)
+
+    @classmethod
+    def from_files(cls, language_data_dir=None):
+        """Build a decoder from the mapping and syllables.json of a language-data directory."""
+        language_data_dir = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR)
+        syllables = load_json(language_data_dir / 'syllables.json')
+        if not isinstance(syllables, list):
+            syllables = []
+        return cls(inverse_table(load_mapping(language_data_dir / MAPPING_FILE), syllables))
+
+    def decode(self, chunk, final=False):
+        """Decode the next chunk of text; pass final=True with (or after) the last one."""
+        text = self.pending + chunk
+        if not final and text and text[-1] in self.glyph_chars:
+            text, self.pending = text[:-1], text[-1]
+        else:
+            self.pending = ''
+        words = self._words.__getitem__
+        return '\n'.join([' '.join(map(words, line.split(' '))) for line in text.split('\n')])
+
+    def _decode_word(self, word):
+        parts = self.pattern.split(word)
+        table = self.table
+        return ''.join(map(table.get, parts, parts))
+
+    def reset(self):
+        """Forget any held-back glyph."""
+        self.pending = ''
+
+    def stream(self, chunks):
+        """Decode text or UTF-8 bytes arriving in chunks, yielding decoded text."""
+        utf8 = codecs.getincrementaldecoder('utf-8')()
+        for chunk in chunks:
+            if isinstance(chunk, bytes):
+                chunk = utf8.decode(chunk)
+            decoded = self.decode(chunk)
+            if decoded:
+                yield decoded
+        decoded = self.decode(utf8.decode(b'', final=True), final=True)
+        if decoded:
+            yield decoded
+
+    def decode_file(self, src, dst, chunk_size=STREAM_CHUNK_SIZE):
+        """Decode a text or binary (UTF-8) file object into a text file object, chunk by chunk."""
+        empty = b'' if 'b' in getattr(src, 'mode', '') else ''
+        for piece in self.stream(iter(lambda: src.read(chunk_size), empty)):
+            dst.write(piece)
+
+
+_shared = {}
+
+
+def get_transliterator(language_data_dir=None):
+    """Return a process-wide shared Transliterator for a language-data directory."""
+    key = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR).resolve()
+    if key not in _shared:
+        _shared[key] = Transliterator.from_file(key / MAPPING_FILE)
+    return _shared[key]
+
+
+def get_decoder(language_data_dir=None):
+    """Return a new NdebeDecoder over a shared inverse table (decoders hold stream state)."""
+    key = ('inverse', Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR).resolve())
+    if key not in _shared:
+        _shared[key] = NdebeDecoder.from_files(key[1]).table
+    return NdebeDecoder(_shared[key])
+
+
+def main(argv=None):
+    """Transliterate (or decode) words given as arguments, or stream stdin to stdout."""
+    parser = argparse.ArgumentParser(description='Transliterate Latin-script Igbo into the Ndebe script.')
+    parser.add_argument('words', nargs='*', help='words to transliterate (default: stream stdin)')
+    parser.add_argument('--update-mapping', action='store_true',
+                        help='allocate glyphs for vowels and syllable groups that have none')
+    parser.add_argument('--code-points', action='store_true', help='print U+XXXX notation instead of glyphs')
+    parser.add_argument('--decode', action='store_true', help='decode Ndebe back to Latin (words or stdin)')
+    args = parser.parse_args(argv)
+
+    if args.update_mapping:
+        added = update_mapping()
+        print(f"{added} glyphs added to {DEFAULT_LANGUAGE_DATA_DIR / MAPPING_FILE}")
+        return 0
+
+    if args.decode:
+        decoder = get_decoder()
+        if args.words:
+            for word in args.words:
+                print(f"{word}\t{decoder.decode(word, final=True)}")
+        else:
+            decoder.decode_file(sys.stdin.buffer, sys.stdout)
+        return 0
+
+    transliterator = get_transliterator()
+    if args.words:
+        for word in args.words:
+            ndebe = transliterator.transliterate(word)
+            print(f"{word}\t{code_point_notation(ndebe) if args.code_points else ndebe}")
+        return 0
+
+    transliterator.transliterate_file(sys.stdin, sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
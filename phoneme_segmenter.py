@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Segment Igbo words into phonemes with a compiled trie.
+
+The consonant and vowel inventories from consonants.json and vowels.json
+are inserted into a character trie (in NFD, so dotted vowels, ṅ and the
+syllabic nasals m̩/n̩ are plain character paths). The trie is compiled
+into a single prefix-factored regular expression whose optional branches
+are greedy, which gives greedy longest-match segmentation: "gbá" is
+gb + á, not g + b + á. Tone marks following a phoneme stay attached to it.
+
+A whole word of any length is segmented in one left-to-right pass.
+Characters outside the inventory come back as segments of their own.
+
+Usage:
+    from phoneme_segmenter import get_segmenter
+
+    segmenter = get_segmenter()
+    segmenter.segment('ịkpọ́')                # ('ị', 'kp', 'ọ́')
+    segmenter.segment_many(['mmiri', 'nwa'])
+
+    python3 phoneme_segmenter.py < words.txt  # one segmented word per line
+"""
+
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+from lexicon import DEFAULT_LANGUAGE_DATA_DIR, load_json
+
+
+# Combining marks (tone marks and others) absorbed by the preceding phoneme
+COMBINING_MARKS = '[\u0300-\u036f]*'
+
+# Terminal marker in trie nodes
+END = ''
+
+# Per-instance cache size for segment()
+CACHE_SIZE = 1 << 16
+
+
+def build_trie(phonemes):
+    """Build a nested-dict character trie over the NFD forms of phonemes."""
+    trie = {}
+    for phoneme in phonemes:
+        node = trie
+        for char in unicodedata.normalize('NFD', phoneme):
+            node = node.setdefault(char, {})
+        node[END] = True
+    return trie
+
+
+def trie_to_pattern(node):
+    """
+    Compile a trie node into a regex fragment.
+
+    Children are tried in sorted order; a child that can also stop early is
+    wrapped in a greedy optional group, so the regex engine always takes the
+    longest path the input allows.
+    """
+    branches = []
+    for char in sorted(k for k in node if k != END):
+        child = node[char]
+        rest = trie_to_pattern(child)
+        if not rest:
+            branches.append(re.escape(char))
+        elif END in child:
+            branches.append(f"{re.escape(char)}(?:{rest})?")
+        else:
+            branches.append(f"{re.escape(char)}(?:{rest})")
+    if len(branches) == 1:
+        return branches[0]
+    return '|'.join(branches)
+
+
+class PhonemeSegmenter:
+    """Greedy longest-match phoneme segmenter compiled from an inventory."""
+
+    def __init__(self, consonants, vowels):
+        self.consonants = list(consonants)
+        self.vowels = list(vowels)
+        self.trie = build_trie(self.consonants + self.vowels)
+        self.pattern = re.compile(
+            f"(?:{trie_to_pattern(self.trie)}|.){COMBINING_MARKS}",
+            re.IGNORECASE | re.DOTALL
+        )
+        self._cache = {}
+        self._composed = {}
+
+    @classmethod
+    def from_language_data(cls, language_data_dir=None):
+        """Build a segmenter from consonants.json and vowels.json."""
+        language_data_dir = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR)
+        consonants_data = load_json(language_data_dir / 'consonants.json')
+        vowels_data = load_json(language_data_dir / 'vowels.json')
+
+        consonants = [c['letter'] for c in consonants_data['consonants']]
+        vowels = [
+            v['letter']
+            for group in vowels_data['vowelGroups'].values()
+            for v in group['vowels']
+        ]
+        return cls(consonants, vowels)
+
+    def segment(self, word):
+        """
+        Segment a word into a tuple of NFC phoneme strings.
+
+        Input may be in any normalization form. Results are cached per word,
+        since bulk input repeats the same tokens many times.
+        """
+        cached = self._cache.get(word)
+        if cached is not None:
+            return cached
+
+        decomposed = unicodedata.normalize('NFD', word)
+        if decomposed.isascii():
+            segments = tuple(self.pattern.findall(decomposed))
+        else:
+            # The set of distinct segments is small, so memoize their NFC forms
+            composed = self._composed
+            segments = []
+            for segment in self.pattern.findall(decomposed):
+                nfc = composed.get(segment)
+                if nfc is None:
+                    nfc = composed[segment] = unicodedata.normalize('NFC', segment)
+                segments.append(nfc)
+            segments = tuple(segments)
+
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+        self._cache[word] = segments
+        return segments
+
+    def segment_many(self, words):
+        """Segment a batch of words, returning a list of phoneme tuples."""
+        segment = self.segment
+        return [segment(word) for word in words]
+
+    def iter_segments(self, words):
+        """Lazily segment an iterable of words (e.g. a token stream)."""
+        segment = self.segment
+        for word in words:
+            yield segment(word)
+
+
+_shared = {}
+
+
+def get_segmenter(language_data_dir=None):
+    """Return a process-wide shared segmenter for a language-data directory."""
+    key = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR).resolve()
+    if key not in _shared:
+        _shared[key] = PhonemeSegmenter.from_language_data(key)
+    return _shared[key]
+
+
+def main():
+    """Segment whitespace-separated words from stdin, one line of output per word."""
+    segmenter = get_segmenter()
+    out = sys.stdout
+    for line in sys.stdin:
+        for phonemes in segmenter.iter_segments(line.split()):
+            out.write(' '.join(phonemes))
+            out.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
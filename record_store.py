@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Compact, array-backed record store for the lexicon collections.
+
+Loading syllables.json the usual way gives one dict per entry, with its
+own hash table, key references and phonemes list. Across many worker
+processes that per-entry overhead dominates memory. A RecordStore keeps a
+collection column by column instead:
+
+- every distinct string (ids, forms, joined lists) is stored once, in a
+  sorted string table kept as a single UTF-8 buffer plus offsets, and
+  str columns hold table indexes in an array('H') (or array('I') once
+  the table outgrows 16 bits),
+- low-cardinality fields (tone, vowelGroup, type, prefix, ...) become
+  enum columns: array('B') codes into a per-field value list,
+- bool fields are array('B') 0/1.
+
+Rows are read through Record, a two-slot view implementing the read-only
+Mapping interface, so record['plain_name'], record.get(...), dict(record)
+and record == entry all work as with the original dicts. Strings and lists
+(phonemes) are rebuilt on access; records are looked up by id by bisecting
+the sorted table rather than through a dict. Values use the same types as
+snapshots (see snapshot.py): str, bool and lists of str.
+
+Usage:
+    from record_store import get_record_store
+
+    syllables = get_record_store('syllables')
+    syllables.get('syl_ma_001')['plain_name']        # 'má'
+    syllables.find('tone', 'low')                    # Records, in order
+
+    python3 record_store.py                          # memory per collection
+"""
+
+import sys
+import tracemalloc
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from pathlib import Path
+
+from lexicon import COLLECTION_FILES, DEFAULT_LANGUAGE_DATA_DIR, load_json
+from snapshot import LIST_SEPARATOR, TYPE_BOOL, TYPE_STR_LIST, value_type
+
+
+# Fields with at most this many distinct values are stored as enum codes
+ENUM_LIMIT = 32
+
+# Missing-value markers of the column types
+MISSING_CODE = 0xFF
+MISSING_STRING = {'H': 0xFFFF, 'I': 0xFFFFFFFF}
+
+# Column kinds
+KIND_STRING = 'string'
+KIND_ENUM = 'enum'
+KIND_BOOL = 'bool'
+
+
+class Record(Mapping):
+    """Read-only mapping view of one row of a RecordStore."""
+
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, field):
+        value = self.store.value(self.row, field)
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def __iter__(self):
+        value = self.store.value
+        return (field for field in self.store.fields if value(self.row, field) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def to_dict(self):
+        """Return the row as a plain dict (the original JSON entry)."""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"Record({self.to_dict()!r})"
+
+
+class RecordStore:
+    """Columnar storage of one collection's flat JSON entries."""
+
+    def __init__(self, entries):
+        self.fields = []
+        self.field_types = {}
+        string_ids = {}
+        columns = {}
+        count = 0
+
+        # First pass: every str/list value as a string id, bools as 0/1
+        for entry in entries:
+            for field, value in entry.items():
+                vtype = value_type(value)
+                if field not in self.field_types:
+                    self.field_types[field] = vtype
+                    self.fields.append(field)
+                    columns[field] = array('I', [MISSING_STRING['I']]) * count
+                elif self.field_types[field] != vtype:
+                    raise ValueError(f"Field '{field}' mixes value types")
+            for field in self.fields:
+                value = entry.get(field)
+                if value is None:
+                    code = MISSING_STRING['I']
+                elif self.field_types[field] == TYPE_BOOL:
+                    code = int(value)
+                else:
+                    if self.field_types[field] == TYPE_STR_LIST:
+                        value = LIST_SEPARATOR.join(value)
+                    code = string_ids.setdefault(value, len(string_ids))
+                columns[field].append(code)
+            count += 1
+        self.count = count
+
+        # The string table: sorted, so string ids compare like the strings
+        # and can be found by bisection, and kept as one UTF-8 buffer
+        strings = sorted(string_ids)
+        remap = array('I', bytes(4 * len(strings)))
+        for new_id, text in enumerate(strings):
+            remap[string_ids[text]] = new_id
+        del string_ids
+        encoded = [text.encode('utf-8') for text in strings]
+        self.string_data = b''.join(encoded)
+        self.string_offsets = array('I', [0])
+        for data in encoded:
+            self.string_offsets.append(self.string_offsets[-1] + len(data))
+        del encoded
+
+        # Second pass: narrow each column to its smallest representation
+        self.kinds = {}
+        self.columns = {}
+        self.enum_values = {}
+        string_code = 'H' if len(strings) < MISSING_STRING['H'] else 'I'
+        for field in self.fields:
+            column = columns.pop(field)
+            if self.field_types[field] == TYPE_BOOL:
+                self.kinds[field] = KIND_BOOL
+                self.columns[field] = array('B', (MISSING_CODE if v == MISSING_STRING['I'] else v for v in column))
+                continue
+
+            column = array('I', (v if v == MISSING_STRING['I'] else remap[v] for v in column))
+            distinct = sorted(set(column) - {MISSING_STRING['I']})
+            if len(distinct) <= ENUM_LIMIT and self.field_types[field] != TYPE_STR_LIST and field != 'id':
+                codes = {sid: code for code, sid in enumerate(distinct)}
+                self.kinds[field] = KIND_ENUM
+                self.enum_values[field] = [strings[sid] for sid in distinct]
+                self.columns[field] = array('B', (codes.get(v, MISSING_CODE) for v in column))
+            else:
+                self.kinds[field] = KIND_STRING
+                missing = MISSING_STRING[string_code]
+                self.columns[field] = array(string_code, (
+                    missing if v == MISSING_STRING['I'] else v for v in column
+                ))
+        self.string_code = string_code
+
+        # Rows in id order, searched with bisect instead of a per-row dict
+        # (ids are never enum columns, however few rows there are)
+        self._id_order = None
+        if 'id' in self.kinds:
+            ids = self.columns['id']
+            self._id_order = array('I', sorted(range(count), key=ids.__getitem__))
+
+    @classmethod
+    def from_file(cls, json_file):
+        """Build a store from a JSON array file."""
+        return cls(load_json(json_file))
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.count
+        if not 0 <= row < self.count:
+            raise IndexError('record store row out of range')
+        return Record(self, row)
+
+    def __iter__(self):
+        for row in range(self.count):
+            yield Record(self, row)
+
+    def string(self, sid):
+        """Return the string table entry sid."""
+        return self.string_data[self.string_offsets[sid]:self.string_offsets[sid + 1]].decode('utf-8')
+
+    def string_id(self, text):
+        """Return the string table id of text, or None if no field holds it."""
+        sid = bisect_left(range(len(self.string_offsets) - 1), text, key=self.string)
+        if sid < len(self.string_offsets) - 1 and self.string(sid) == text:
+            return sid
+        return None
+
+    def value(self, row, field):
+        """Return one field of one row, or None if the row doesn't have it."""
+        kind = self.kinds.get(field)
+        if kind is None:
+            return None
+        code = self.columns[field][row]
+        if kind == KIND_ENUM:
+            return None if code == MISSING_CODE else self.enum_values[field][code]
+        if kind == KIND_BOOL:
+            return None if code == MISSING_CODE else bool(code)
+        if code == MISSING_STRING[self.string_code]:
+            return None
+        text = self.string(code)
+        if self.field_types[field] == TYPE_STR_LIST:
+            return text.split(LIST_SEPARATOR) if text else []
+        return text
+
+    def get(self, entry_id, default=None):
+        """Look up a record by id (binary search over the id order)."""
+        sid = None if self._id_order is None else self.string_id(entry_id)
+        if sid is None:
+            return default
+        ids = self.columns['id']
+        position = bisect_left(self._id_order, sid, key=ids.__getitem__)
+        if position < self.count and ids[self._id_order[position]] == sid:
+            return Record(self, self._id_order[position])
+        return default
+
+    def find(self, field, value):
+        """Return the records whose field equals value, in store order."""
+        kind = self.kinds.get(field)
+        if kind == KIND_ENUM:
+            values = self.enum_values[field]
+            code = values.index(value) if value in values else None
+        elif kind == KIND_STRING and self.field_types[field] != TYPE_STR_LIST:
+            code = self.string_id(value)
+        else:
+            raise KeyError(f"Field '{field}' cannot be searched")
+        if code is None:
+            return []
+        return [Record(self, row) for row, c in enumerate(self.columns[field]) if c == code]
+
+    def nbytes(self):
+        """Approximate bytes held by the columns and string table."""
+        total = sum(column.itemsize * len(column) for column in self.columns.values())
+        return total + len(self.string_data) + self.string_offsets.itemsize * len(self.string_offsets)
+
+
+_shared = {}
+
+
+def get_record_store(collection, language_data_dir=None):
+    """Return a process-wide shared store for a collection of a language-data directory."""
+    key = (collection, Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR).resolve())
+    if key not in _shared:
+        _shared[key] = RecordStore.from_file(key[1] / COLLECTION_FILES[collection])
+    return _shared[key]
+
+
+def traced_size(build):
+    """Return (result, bytes still allocated) of calling build under tracemalloc."""
+    tracemalloc.start()
+    try:
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def main():
+    """Compare the memory of dict entries and record stores per collection."""
+    print("=" * 70)
+    print("Record Store Memory")
+    print("=" * 70)
+    for collection, rel_path in COLLECTION_FILES.items():
+        json_file = DEFAULT_LANGUAGE_DATA_DIR / rel_path
+        entries, dict_bytes = traced_size(lambda: load_json(json_file))
+        del entries
+        store, store_bytes = traced_size(lambda: RecordStore.from_file(json_file))
+        print(f"  {collection}: {len(store)} entries, dicts {dict_bytes / 1024:.0f} KiB, "
+              f"store {store_bytes / 1024:.0f} KiB ({dict_bytes / max(store_bytes, 1):.1f}x smaller)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
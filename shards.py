@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Sharded copies of the generated collections, for partial loading.
+
+With --shards, generate_verb_roots.py also splits each collection into
+shards keyed by the root's leading consonant and vowel group:
+
+    generated/shards/manifest.json
+    generated/shards/infinitives/gb-A.json
+    generated/shards/dialectal_roots/l-E.json
+    ...
+
+The manifest records, per collection, the hash of the source JSON file the
+shards were cut from and, per shard, its key, file, entry count, SHA-256
+and size in bytes. A consumer that only needs gb- or A-group roots reads
+the manifest and parses just those shards; the monolithic files stay the
+source of truth.
+
+Usage:
+    from shards import ShardSet
+
+    shards = ShardSet()
+    shards.load('infinitives', consonants=['gb'], vowel_groups=['A'])
+    shards.lexicon(vowel_groups=['E']).lookup('infinitives', 'base_root', 'bé')
+
+    python3 shards.py                              # summarize the manifest
+    python3 shards.py infinitives gb A             # count the entries of matching shards
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from entries import from_json_entries, load_collection
+from file_hashes import file_hash
+from lexicon import COLLECTION_FILES, DEFAULT_LANGUAGE_DATA_DIR, Lexicon
+from phoneme_segmenter import get_segmenter
+
+
+SHARD_MANIFEST_VERSION = 1
+
+DEFAULT_SHARD_DIR = Path(__file__).parent / 'generated' / 'shards'
+
+# Collection name -> field holding the root whose leading consonant keys the shard
+SHARD_ROOT_FIELDS = {
+    'syllables': 'plain_name',
+    'infinitives': 'base_root',
+    'dialectal_roots': 'base_form',
+    'dialectal_infinitives': 'base_root',
+}
+
+
+def shard_file_stem(consonant, vowel_group):
+    """
+    Return the file stem of a shard ('gb-A').
+
+    Letters outside ASCII (ṅ, m̩) are spelled as code points, so names are
+    the same on every file system whatever its Unicode normalization.
+    """
+    letters = ''.join(c if c.isascii() and c.isalnum() else f"_{ord(c):04x}" for c in consonant)
+    return f"{letters}-{vowel_group}"
+
+
+class ShardKeys:
+    """Computes the (leading consonant, vowel group) shard key of entries."""
+
+    def __init__(self, language_data_dir=None):
+        self.segmenter = get_segmenter(language_data_dir)
+
+    def key(self, collection, entry):
+        """Return the shard key of an entry of a collection."""
+        root = entry[SHARD_ROOT_FIELDS[collection]]
+        return self.segmenter.segment(root)[0], entry['vowelGroup']
+
+
+def load_manifest(shard_dir=None):
+    """Return the shard manifest, or an empty one if there is none (or it is stale)."""
+    manifest_file = Path(shard_dir or DEFAULT_SHARD_DIR) / 'manifest.json'
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {'version': SHARD_MANIFEST_VERSION, 'collections': {}}
+    if manifest.get('version') != SHARD_MANIFEST_VERSION:
+        return {'version': SHARD_MANIFEST_VERSION, 'collections': {}}
+    return manifest
+
+
+def save_manifest(manifest, shard_dir=None):
+    """Write the shard manifest."""
+    shard_dir = Path(shard_dir or DEFAULT_SHARD_DIR)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    with open(shard_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+class ShardSet:
+    """
+    Reads only the shards a query needs.
+
+    Parsed shards are kept, so repeated loads of the same keys don't touch
+    the disk again.
+    """
+
+    def __init__(self, shard_dir=None, language_data_dir=None):
+        self.shard_dir = Path(shard_dir or DEFAULT_SHARD_DIR)
+        self.language_data_dir = Path(language_data_dir or DEFAULT_LANGUAGE_DATA_DIR)
+        self.manifest = load_manifest(self.shard_dir)
+        self._loaded = {}
+
+    @property
+    def collections(self):
+        """Names of the sharded collections."""
+        return list(self.manifest['collections'])
+
+    def shards(self, collection, consonants=None, vowel_groups=None):
+        """
+        Return the manifest records of the shards matching a query.
+
+        consonants and vowel_groups are iterables of keys; None matches all.
+        Raises KeyError if the collection has not been sharded.
+        """
+        if collection not in self.manifest['collections']:
+            raise KeyError(f"Collection '{collection}' has no shards (run generate_verb_roots.py --shards)")
+        consonants = None if consonants is None else set(consonants)
+        vowel_groups = None if vowel_groups is None else set(vowel_groups)
+        return [
+            shard for shard in self.manifest['collections'][collection]['shards']
+            if (consonants is None or shard['consonant'] in consonants)
+            and (vowel_groups is None or shard['vowelGroup'] in vowel_groups)
+        ]
+
+    def is_current(self, collection):
+        """Return True if a collection's shards were cut from its current JSON file."""
+        record = self.manifest['collections'].get(collection)
+        if record is None:
+            return False
+        return record['source_sha256'] == file_hash(self.language_data_dir / COLLECTION_FILES[collection])
+
+    def _read(self, collection, shard, verify):
+        """Parse one shard file, optionally checking its recorded hash."""
+        path = self.shard_dir / shard['file']
+        if verify:
+            data = path.read_bytes()
+            if hashlib.sha256(data).hexdigest() != shard['sha256']:
+                raise ValueError(f"{path}: contents do not match the shard manifest")
+            return from_json_entries(collection, json.loads(data))
+        return load_collection(collection, path)
+
+    def load(self, collection, consonants=None, vowel_groups=None, verify=False):
+        """Return the entries of every shard matching a query, in manifest order."""
+        entries = []
+        for shard in self.shards(collection, consonants, vowel_groups):
+            if shard['file'] not in self._loaded:
+                self._loaded[shard['file']] = self._read(collection, shard, verify)
+            entries.extend(self._loaded[shard['file']])
+        return entries
+
+    def lexicon(self, consonants=None, vowel_groups=None, collections=None):
+        """Return a Lexicon indexed over the matching shards of each collection."""
+        names = collections or self.collections
+        return Lexicon(self.language_data_dir, collections={
+            name: self.load(name, consonants, vowel_groups) for name in names
+        })
+
+
+def main():
+    """Summarize the shard manifest, or count the entries matching a query."""
+    shard_set = ShardSet()
+    if not shard_set.collections:
+        print("No shards found; run: python3 generate_verb_roots.py --shards")
+        return 1
+
+    if len(sys.argv) > 1:
+        collection = sys.argv[1]
+        consonants = [sys.argv[2]] if len(sys.argv) > 2 else None
+        vowel_groups = [sys.argv[3]] if len(sys.argv) > 3 else None
+        try:
+            shards = shard_set.shards(collection, consonants, vowel_groups)
+        except KeyError as e:
+            print(e.args[0])
+            return 1
+        entries = shard_set.load(collection, consonants, vowel_groups)
+        print(f"{collection}: {len(entries)} entries from {len(shards)} shards "
+              f"({sum(s['bytes'] for s in shards)} bytes)")
+        return 0
+
+    print("=" * 70)
+    print("Generated Shards")
+    print("=" * 70)
+    for name, record in shard_set.manifest['collections'].items():
+        status = "current" if shard_set.is_current(name) else "stale"
+        print(f"  {name}: {record['count']} entries in {len(record['shards'])} shards, "
+              f"{record['bytes']} bytes ({status})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Compiled binary snapshots of generated lexicon collections.
+
+A snapshot stores a JSON array of flat entries (syllables.json,
+generated-infinitives.json, ...) as a string table plus fixed-width record
+arrays, and is opened through mmap so that only the pages a query touches
+are read. Records are decoded into dicts on access.
+
+Layout (all integers little-endian uint32):
+
+    header    magic, version, record_count, field_count, string_count,
+              index_count, fields_offset, strings_offset, records_offset,
+              indexes_offset
+    fields    field_count x (name string, value type)
+    strings   (string_count + 1) offsets into the UTF-8 blob, then the blob
+    records   record_count x field_count values
+    indexes   index_count x (field string, pair_count, pairs_offset), each
+              followed by pair_count x (key string, record number) pairs
+              sorted by key
+
+A value is a string table index (str fields), 0/1 (bool fields) or the
+index of the list joined with LIST_SEPARATOR (list-of-str fields);
+MISSING marks an entry without that field.
+
+Besides field indexes, a snapshot can carry derived indexes whose keys are
+computed from each entry (e.g. 'folded', the diacritic-free form used for
+search). Their pairs are sorted by key and then by a rank the key function
+returns, so find() yields the best candidates first.
+
+Usage:
+    python3 snapshot.py generated/syllables.snap syl_ma_001
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+
+MAGIC = b'IGBOSNAP'
+VERSION = 1
+
+HEADER = struct.Struct('<8s9I')
+U32 = struct.Struct('<I')
+PAIR = struct.Struct('<II')
+INDEX_HEADER = struct.Struct('<3I')
+
+MISSING = 0xFFFFFFFF
+LIST_SEPARATOR = '\x1f'
+
+TYPE_STR = 0
+TYPE_BOOL = 1
+TYPE_STR_LIST = 2
+
+# Fields that get a sorted lookup index by default
+DEFAULT_INDEX_FIELDS = ('id',)
+
+
+def value_type(value):
+    """Return the snapshot type code for a JSON value."""
+    if isinstance(value, bool):
+        return TYPE_BOOL
+    if isinstance(value, str):
+        return TYPE_STR
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return TYPE_STR_LIST
+    raise ValueError(f"Unsupported snapshot value: {value!r}")
+
+
+class SnapshotBuilder:
+    """
+    Accumulate entries one at a time and compile them into a snapshot.
+
+    Values are kept as uint32 columns plus an interned string table rather
+    than as the entries themselves, so a builder can sit at the end of a
+    streaming generator pipeline. Field order follows first appearance, so
+    decoded records keep the key order of the source JSON.
+
+    derived_indexes maps an index name to a function returning (key, rank)
+    for an entry, or None to leave the entry out of that index.
+    """
+
+    def __init__(self, index_fields=DEFAULT_INDEX_FIELDS, derived_indexes=None):
+        self.index_fields = index_fields
+        self.derived_indexes = derived_indexes or {}
+        self.derived_pairs = {name: [] for name in self.derived_indexes}
+        self.fields = []
+        self.field_types = {}
+        self.columns = {}
+        self.strings = []
+        self.string_ids = {}
+        self.count = 0
+
+    def intern(self, text):
+        """Return the string table index of text, adding it if needed."""
+        sid = self.string_ids.get(text)
+        if sid is None:
+            sid = self.string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return sid
+
+    def add(self, entry):
+        """Append one flat JSON entry."""
+        for field, value in entry.items():
+            vtype = value_type(value)
+            if field not in self.field_types:
+                self.field_types[field] = vtype
+                self.fields.append(field)
+                self.columns[field] = array('I', [MISSING]) * self.count
+            elif self.field_types[field] != vtype:
+                raise ValueError(f"Field '{field}' mixes value types")
+
+        for field in self.fields:
+            if field not in entry:
+                value = MISSING
+            elif self.field_types[field] == TYPE_BOOL:
+                value = int(entry[field])
+            elif self.field_types[field] == TYPE_STR_LIST:
+                value = self.intern(LIST_SEPARATOR.join(entry[field]))
+            else:
+                value = self.intern(entry[field])
+            self.columns[field].append(value)
+
+        for name, key_function in self.derived_indexes.items():
+            keyed = key_function(entry)
+            if keyed is not None:
+                key, rank = keyed
+                self.derived_pairs[name].append((key, rank, self.count))
+        self.count += 1
+
+    def to_bytes(self):
+        """Serialize the accumulated entries in snapshot layout."""
+        indexes = []
+        for field in self.index_fields:
+            if self.field_types.get(field) != TYPE_STR:
+                continue
+            pairs = sorted(
+                (self.strings[sid], number)
+                for number, sid in enumerate(self.columns[field]) if sid != MISSING
+            )
+            indexes.append((self.intern(field), [(self.string_ids[key], number) for key, number in pairs]))
+        for name, pairs in self.derived_pairs.items():
+            pairs = sorted(pairs)
+            indexes.append((self.intern(name), [(self.intern(key), number) for key, _, number in pairs]))
+
+        field_table = b''.join(
+            U32.pack(self.intern(f)) + U32.pack(self.field_types[f]) for f in self.fields
+        )
+
+        blob = bytearray()
+        string_offsets = array('I')
+        for text in self.strings:
+            string_offsets.append(len(blob))
+            blob += text.encode('utf-8')
+        string_offsets.append(len(blob))
+
+        columns = [self.columns[f] for f in self.fields]
+        records = array('I')
+        for number in range(self.count):
+            records.extend(column[number] for column in columns)
+
+        if sys.byteorder == 'big':
+            string_offsets.byteswap()
+            records.byteswap()
+
+        fields_offset = HEADER.size
+        strings_offset = fields_offset + len(field_table)
+        records_offset = strings_offset + U32.size * len(string_offsets) + len(blob)
+        indexes_offset = records_offset + U32.size * len(records)
+
+        index_table = bytearray()
+        pairs_offset = indexes_offset + INDEX_HEADER.size * len(indexes)
+        pair_data = bytearray()
+        for field_sid, pairs in indexes:
+            index_table += INDEX_HEADER.pack(field_sid, len(pairs), pairs_offset + len(pair_data))
+            for key_sid, number in pairs:
+                pair_data += PAIR.pack(key_sid, number)
+
+        header = HEADER.pack(
+            MAGIC, VERSION, self.count, len(self.fields), len(self.strings), len(indexes),
+            fields_offset, strings_offset, records_offset, indexes_offset
+        )
+
+        return b''.join((
+            header, field_table, string_offsets.tobytes(), blob,
+            records.tobytes(), index_table, pair_data
+        ))
+
+    def write(self, output_file):
+        """
+        Write the snapshot to a temporary path and move it into place.
+
+        An identical existing snapshot is left untouched so its mtime only
+        moves on change.
+
+        Returns: True if the file was written
+        """
+        data = self.to_bytes()
+
+        output_file = Path(output_file)
+        if output_file.exists() and output_file.read_bytes() == data:
+            return False
+
+        tmp_file = output_file.with_name(output_file.name + '.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, output_file)
+        return True
+
+
+def write_snapshot(entries, output_file, index_fields=DEFAULT_INDEX_FIELDS, derived_indexes=None):
+    """
+    Compile an iterable of flat JSON entries into a snapshot file.
+
+    Returns: True if the file was written
+    """
+    builder = SnapshotBuilder(index_fields, derived_indexes)
+    for entry in entries:
+        builder.add(entry)
+    return builder.write(output_file)
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+
+    Supports len(), indexing and iteration (records decoded as dicts),
+    plus get(key) / find(field, key) lookups through the sorted indexes.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mmap)
+
+        (magic, version, self.record_count, self.field_count, self.string_count,
+         index_count, fields_offset, self._strings_offset, self._records_offset,
+         indexes_offset) = HEADER.unpack_from(self._buf, 0)
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a lexicon snapshot")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: unsupported snapshot version {version}")
+
+        self._blob_offset = self._strings_offset + U32.size * (self.string_count + 1)
+        self._record_size = U32.size * self.field_count
+
+        self.fields = []
+        for i in range(self.field_count):
+            name_sid, vtype = PAIR.unpack_from(self._buf, fields_offset + i * PAIR.size)
+            self.fields.append((self.string(name_sid), vtype))
+
+        self._indexes = {}
+        for i in range(index_count):
+            field_sid, count, offset = INDEX_HEADER.unpack_from(
+                self._buf, indexes_offset + i * INDEX_HEADER.size
+            )
+            self._indexes[self.string(field_sid)] = (count, offset)
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.record_count
+
+    @property
+    def index_fields(self):
+        """Fields that have a sorted lookup index."""
+        return list(self._indexes)
+
+    def string(self, sid):
+        """Decode one string from the string table."""
+        start, end = struct.unpack_from('<2I', self._buf, self._strings_offset + sid * U32.size)
+        return str(self._buf[self._blob_offset + start:self._blob_offset + end], 'utf-8')
+
+    def __getitem__(self, number):
+        if number < 0:
+            number += self.record_count
+        if not 0 <= number < self.record_count:
+            raise IndexError('snapshot record out of range')
+
+        offset = self._records_offset + number * self._record_size
+        values = struct.unpack_from(f'<{self.field_count}I', self._buf, offset)
+
+        record = {}
+        for (field, vtype), value in zip(self.fields, values):
+            if value == MISSING:
+                continue
+            if vtype == TYPE_BOOL:
+                record[field] = bool(value)
+            elif vtype == TYPE_STR_LIST:
+                text = self.string(value)
+                record[field] = text.split(LIST_SEPARATOR) if text else []
+            else:
+                record[field] = self.string(value)
+        return record
+
+    def __iter__(self):
+        for number in range(self.record_count):
+            yield self[number]
+
+    def _index_key(self, offset, position):
+        return self.string(PAIR.unpack_from(self._buf, offset + position * PAIR.size)[0])
+
+    def find(self, field, key):
+        """
+        Return all records whose indexed field equals key (binary search).
+
+        Records come back in index order, i.e. by rank for derived indexes.
+        """
+        if field not in self._indexes:
+            raise KeyError(f"No snapshot index for field '{field}'")
+        count, offset = self._indexes[field]
+
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._index_key(offset, mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        matches = []
+        while lo < count:
+            key_sid, number = PAIR.unpack_from(self._buf, offset + lo * PAIR.size)
+            if self.string(key_sid) != key:
+                break
+            matches.append(self[number])
+            lo += 1
+        return matches
+
+    def get(self, entry_id, default=None):
+        """Look up a record by id."""
+        matches = self.find('id', entry_id)
+        return matches[0] if matches else default
+
+
+def main():
+    """Print a snapshot summary, or the records matching an id."""
+    if len(sys.argv) < 2:
+        print("Usage: python3 snapshot.py <file.snap> [id ...]")
+        return 1
+
+    import json
+
+    with Snapshot(sys.argv[1]) as snap:
+        if len(sys.argv) == 2:
+            print(f"{snap.path.name}: {len(snap)} records, {snap.string_count} strings")
+            print(f"  fields: {', '.join(name for name, _ in snap.fields)}")
+            print(f"  indexes: {', '.join(snap.index_fields)}")
+            return 0
+
+        for entry_id in sys.argv[2:]:
+            record = snap.get(entry_id)
+            if record is None:
+                print(f"{entry_id}: not found")
+            else:
+                print(json.dumps(record, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
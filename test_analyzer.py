@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script for the morphological analyzer.
+Verifies that generated surface forms analyze back to their components.
+"""
+
+import sys
+import unicodedata
+
+from analyzer import get_analyzer
+from lexicon import get_lexicon
+
+
+def analyses_of_type(analyses, kind):
+    return [a for a in analyses if a['type'] == kind]
+
+
+def test_roots_and_infinitives():
+    """Test that every syllable and infinitive analyzes back to its root."""
+    print("Testing roots and infinitives...")
+
+    analyzer = get_analyzer()
+    lexicon = get_lexicon()
+
+    for syllable in lexicon.syllables:
+        roots = analyses_of_type(analyzer.analyze(syllable['plain_name']), 'root')
+        assert [a['root'] for a in roots] == [syllable['id']], f"{syllable['plain_name']}: {roots}"
+    print(f"  ✓ {len(lexicon.syllables)} syllables analyzed as roots")
+
+    for infinitive in lexicon.infinitives:
+        found = analyses_of_type(analyzer.analyze(infinitive['infinitive_form']), 'infinitive')
+        assert [a['entry'] for a in found] == [infinitive['id']], f"{infinitive['infinitive_form']}: {found}"
+    print(f"  ✓ {len(lexicon.infinitives)} infinitives analyzed")
+
+    analyses = analyzer.analyze('ịbà')
+    affixed = analyses_of_type(analyses, 'affixed')
+    assert affixed and affixed[0]['prefix'] == 'ị' and affixed[0]['root'] == 'syl_ba_003', \
+        f"ịbà should be ị + syl_ba_003: {analyses}"
+    assert affixed[0]['vowelGroup'] == 'A', "ịbà should be in the A group"
+    print("  ✓ ịbà → ị + bà (syl_ba_003, A)")
+
+    print()
+
+
+def test_affixed_and_combined_forms():
+    """Test affix combinations, dialectal pairs and unknown tokens."""
+    print("Testing affixed and combined forms...")
+
+    analyzer = get_analyzer()
+
+    [analysis] = analyzer.analyze('méro')
+    assert analysis['root'] == 'syl_me_001' and analysis['suffixes'] == ['ro'], f"Unexpected: {analysis}"
+    assert analyzer.analyze('mérọ') == [], "Disharmonic forms should not analyze"
+    print("  ✓ Suffix harmony respected")
+
+    entry = get_lexicon().dialectal_infinitives[0]
+    found = analyses_of_type(analyzer.analyze(entry['infinitive_form']), 'dialectal_infinitive')
+    assert [a['entry'] for a in found] == [entry['id']], f"{entry['infinitive_form']}: {found}"
+    print(f"  ✓ {entry['infinitive_form']} analyzed as a dialectal infinitive")
+
+    [three_way] = analyses_of_type(analyzer.analyze('ịfá / ịhá / ịshá'), 'dialectal_infinitive')
+    assert three_way['root_form'] == 'fá', f"Unexpected: {three_way}"
+    assert three_way['dialectal_roots'] == ['syl_ha_001', 'syl_sha_001'], "Every member should be indexed"
+    assert analyses_of_type(analyzer.analyze('fa / ha / sha'), 'dialectal_root'), "Three-way roots should analyze"
+    print("  ✓ Three-way dialectal sets analyzed with every member")
+
+    split = analyzer.analyze('ịbà / ịlà')
+    assert {a['variant'] for a in split} == {0, 1}, "Unlisted pairs should be analyzed side by side"
+    print("  ✓ Unlisted combined tokens analyzed per side")
+
+    decomposed = unicodedata.normalize('NFD', 'ỊBÀ')
+    assert analyzer.analyze(decomposed) == analyzer.analyze('ịbà'), "Lookups should ignore case and normalization"
+    assert analyzer.analyze('xyz') == [], "Unknown tokens should have no analyses"
+    print("  ✓ Case and normalization ignored; unknown tokens empty")
+
+    print()
+
+
+def test_batch_and_tagging():
+    """Test analyze_many and tag on running text."""
+    print("Testing batch mode...")
+
+    analyzer = get_analyzer()
+    tokens = ['na', 'àmá', 'amárọ']
+    assert analyzer.analyze_many(tokens) == [analyzer.analyze(t) for t in tokens], "analyze_many mismatch"
+
+    tagged = list(analyzer.tag('na àmá amárọ ịbá / ịva'))
+    assert [token for token, _ in tagged] == ['na', 'àmá', 'amárọ', 'ịbá / ịva'], f"Unexpected tokens: {tagged}"
+    assert all(analyses for _, analyses in tagged), "Every token should have an analysis"
+    assert analyses_of_type(tagged[1][1], 'auxiliary'), "àmá should be the auxiliary"
+    tagged = list(analyzer.tag('na ịfa / ịha / ịsha'))
+    assert [token for token, _ in tagged] == ['na', 'ịfa / ịha / ịsha'], f"Unexpected tokens: {tagged}"
+    assert analyses_of_type(tagged[1][1], 'dialectal_infinitive'), "A three-way form should be one token"
+    print("  ✓ Text tagged, including combined forms and free morphemes")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Analyzer")
+    print("=" * 70)
+    print()
+
+    try:
+        test_roots_and_infinitives()
+        test_affixed_and_combined_forms()
+        test_batch_and_tagging()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
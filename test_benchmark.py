@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the benchmark harness.
+Verifies the synthetic scale-ups and the measurement record.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import measure, scale_consonants
+from generate_verb_roots import load_consonants
+from lexicon import get_lexicon
+
+
+def test_scale_consonants():
+    """Test that scaled inventories keep their alternation patterns per copy."""
+    print("Testing consonant scale-up...")
+
+    consonants_file = Path(__file__).parent / 'language-data' / 'consonants.json'
+    with open(consonants_file, 'r', encoding='utf-8') as f:
+        consonants_data = json.load(f)
+
+    scaled = scale_consonants(consonants_data, 3)
+    letters = [c['letter'] for c in scaled['consonants']]
+    assert len(letters) == 3 * len(consonants_data['consonants']), "Expected three copies"
+    assert len(set(letters)) == len(letters), "Cloned letters should be unique"
+    print(f"  ✓ {len(letters)} distinct consonants")
+
+    l2 = next(c for c in scaled['consonants'] if c['letter'] == 'l2')
+    alternates = {a for alt in l2.get('alternation_sets', []) for a in alt['alternates_with']}
+    assert 'r2' in alternates and 'r' not in alternates, f"Copies should alternate among themselves: {alternates}"
+    print("  ✓ Alternation sets stay within each copy")
+
+    print()
+
+
+def test_generator_accepts_scaled_inventory():
+    """Test that the generator reads the scaled consonants.json."""
+    print("Testing generator on scaled data...")
+
+    factor = 2
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        consonants_file = Path(__file__).parent / 'language-data' / 'consonants.json'
+        with open(consonants_file, 'r', encoding='utf-8') as f:
+            scaled = scale_consonants(json.load(f), factor)
+        with open(Path(tmp_dir) / 'consonants.json', 'w', encoding='utf-8') as f:
+            json.dump(scaled, f, ensure_ascii=False)
+
+        consonants, alternations = load_consonants(Path(tmp_dir))
+        _, real_alternations = load_consonants(consonants_file.parent)
+    assert len(consonants) == 60, f"Expected 60 consonants, got {len(consonants)}"
+    assert len(alternations) == factor * len(real_alternations), "Each copy should keep its variant sets"
+    print(f"  ✓ {len(consonants)} consonants, {len(alternations)} variant sets")
+
+    print()
+
+
+def test_measure():
+    """Test the per-stage measurement record."""
+    print("Testing measurement...")
+
+    result = measure('load_json', Path(__file__).parent, repeat=2, measure_memory=True)
+    assert result['runs'] == 2 and result['best_seconds'] <= result['median_seconds'], result
+    assert result['peak_bytes'] > 0, "tracemalloc should record a peak"
+    assert result['result'] == sum(len(entries) for entries in get_lexicon().collections.values())
+    print(f"  ✓ load_json: {result['best_seconds'] * 1000:.1f} ms, {result['peak_bytes']} bytes peak")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Benchmark Harness")
+    print("=" * 70)
+    print()
+
+    try:
+        test_scale_consonants()
+        test_generator_accepts_scaled_inventory()
+        test_measure()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for per-dialect lexicon views.
+Verifies consonant preferences, projected entries and cache invalidation.
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from dialect_views import consonant_mapping, list_dialects, load_dialect_view
+import lexicon
+from lexicon import get_lexicon
+
+
+LANGUAGE_DATA_DIR = Path(__file__).parent / 'language-data'
+
+
+def test_consonant_preferences():
+    """Test the per-dialect consonant mappings from consonants.json."""
+    print("Testing consonant preferences...")
+
+    consonants = get_lexicon().consonants()
+    assert {'Onitsha', 'Owerri'} <= set(list_dialects(consonants)), "Onitsha and Owerri should be listed"
+
+    owerri = consonant_mapping(consonants, 'Owerri')
+    assert owerri['l'] == 'r' and owerri['r'] == 'r', "Owerri should prefer r in L/R"
+    assert owerri['b'] == 'v', "b should follow its first set (B/V) in Owerri"
+    print("  ✓ Owerri: l→r, b→v")
+
+    onitsha = consonant_mapping(consonants, 'Onitsha')
+    assert onitsha['r'] == 'l' and onitsha['v'] == 'g', "Onitsha should prefer l and g"
+    assert onitsha['w'] == 'w', "Onitsha prefers w in W/GH, so w should be kept"
+    print("  ✓ Onitsha: r→l, v→g, w kept")
+
+    print()
+
+
+def test_projection():
+    """Test projected entries in a fresh view."""
+    print("Testing projection...")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        view = load_dialect_view('owerri', cache_dir=cache_dir)
+        assert view.dialect == 'Owerri', "Dialect names should be case-insensitive"
+        assert not view.from_cache, "First load should build the view"
+
+        syllable = view.get('syl_ba_001')
+        assert syllable['plain_name'] == 'vá' and syllable['standard_form'] == 'bá', f"Unexpected: {syllable}"
+        assert syllable['phonemes'] == ['v', 'á'], f"Phonemes not projected: {syllable['phonemes']}"
+        assert view.get('syl_ma_001')['plain_name'] == 'má', "Consonants without alternations are kept"
+        print("  ✓ syl_ba_001 is vá in Owerri; má unchanged")
+
+        assert view.get('ịlà_infinitive')['infinitive_form'] == 'ịrà', "Infinitives should be projected"
+        print("  ✓ ịlà → ịrà")
+
+        three_way = view.lookup('dialectal_roots', 'combined_form', 'sa / sha')[0]
+        assert three_way['dialect_form'] == 'sha', f"Owerri should pick sha for S/SH: {three_way}"
+        print("  ✓ Variant sets get the dialect's member")
+
+        ids = [e['id'] for e in view.lookup('syllables', 'plain_name', 'rà')]
+        assert ids == ['syl_la_003', 'syl_ra_003'], f"Projected index mismatch: {ids}"
+        print("  ✓ View is indexed like the lexicon")
+
+    try:
+        load_dialect_view('Atlantis', cache_dir=tempfile.gettempdir())
+        raise AssertionError("Unknown dialects should raise ValueError")
+    except ValueError:
+        pass
+    print("  ✓ Unknown dialects rejected")
+
+    print()
+
+
+def test_cache_invalidation():
+    """Test that cached views are reused until consonants.json changes."""
+    print("Testing view cache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / 'language-data'
+        shutil.copytree(LANGUAGE_DATA_DIR, data_dir)
+        cache_dir = Path(tmp) / 'cache'
+
+        assert not load_dialect_view('Owerri', data_dir, cache_dir).from_cache, "First load should build"
+        lexicon._shared.pop(data_dir.resolve(), None)
+        assert load_dialect_view('Owerri', data_dir, cache_dir).from_cache, "Second load should hit the cache"
+        assert data_dir.resolve() not in lexicon._shared, "A cached load should not build the standard lexicon"
+        assert not load_dialect_view('Owerri', data_dir, cache_dir, rebuild=True).from_cache, "rebuild should bypass the cache"
+        print("  ✓ Cached view reused")
+
+        consonants_file = data_dir / 'consonants.json'
+        consonants_file.write_text(consonants_file.read_text(encoding='utf-8') + '\n', encoding='utf-8')
+        assert not load_dialect_view('Owerri', data_dir, cache_dir).from_cache, \
+            "Changing consonants.json should invalidate the view"
+        print("  ✓ consonants.json change invalidates the view")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Dialect Views")
+    print("=" * 70)
+    print()
+
+    try:
+        test_consonant_preferences()
+        test_projection()
+        test_cache_invalidation()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
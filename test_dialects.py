@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for the dialect-equivalence index.
+Verifies the union-find classes and alternation-aware lexicon lookups.
+"""
+
+import sys
+
+from dialects import DialectEquivalence, UnionFind, get_equivalence
+from generate_verb_roots import load_consonants
+from lexicon import DEFAULT_LANGUAGE_DATA_DIR, get_lexicon
+from tone_engine import CACHE_SIZE
+
+
+def test_union_find():
+    """Test merging and grouping of disjoint sets."""
+    print("Testing union-find...")
+
+    union_find = UnionFind('abcde')
+    union_find.union('a', 'b')
+    union_find.union('c', 'd')
+    union_find.union('b', 'd')
+
+    assert union_find.find('a') == union_find.find('c'), "a and c should be merged through b-d"
+    assert union_find.find('e') == 'e', "e should stay a singleton"
+    assert sorted(map(sorted, union_find.groups().values())) == [['a', 'b', 'c', 'd'], ['e']]
+    print("  ✓ Transitive merges grouped correctly")
+
+    print()
+
+
+def test_equivalence_classes():
+    """Test the classes built from consonants.json."""
+    print("Testing equivalence classes...")
+
+    equivalence = get_equivalence()
+
+    assert equivalence.equivalents('r') == ['l', 'r'], f"Unexpected L/R class: {equivalence.equivalents('r')}"
+    assert set(equivalence.equivalents('v')) >= {'b', 'v', 'g'}, "B/V and G/V should share a class"
+    assert equivalence.equivalents('m') == ['m'], "m has no alternations"
+    assert equivalence.key('rà') == equivalence.key('là') == 'là', "rà and là should share a key"
+    assert equivalence.key('ịsha') == equivalence.key('ịsa'), "sh should map to s"
+    assert equivalence.key('ma') != equivalence.key('na'), "Unrelated consonants should not merge"
+    print("  ✓ Documented alternations merged, others kept apart")
+
+    lexicon = get_lexicon()
+    closure = DialectEquivalence(lexicon.consonants(), sum(lexicon.vowel_groups(), []), documented_only=False)
+    largest = max(len(members) for members in closure.classes)
+    assert largest > max(len(members) for members in equivalence.classes), \
+        "Merging all sets should produce a larger class"
+    print(f"  ✓ Merging every alternation set chains {largest} consonants into one class")
+
+    # The generated variant sets close each major pattern separately; only
+    # the undocumented F/H/SH and N/L/Y sets fall outside a single class
+    _, alternations = load_consonants(DEFAULT_LANGUAGE_DATA_DIR)
+    split = [
+        (pattern, members) for pattern, members in alternations
+        if len({equivalence.canonical[member] for member in members}) > 1
+    ]
+    assert split == [('F/H/SH', ['f', 'h', 'sh']), ('N/L/Y', ['l', 'n', 'y'])], \
+        f"Unexpected disagreement with the generated variant sets: {split}"
+    forms = [s['plain_name'] for s in lexicon.lookup_dialect('syllables', 'ha')]
+    assert forms == ['ha', 'ya'], f"F/H/SH should not be merged into the key, got {forms}"
+    print("  ✓ Generated variant sets agree except the undocumented F/H/SH and N/L/Y")
+
+    print()
+
+
+def test_dialect_lookup():
+    """Test that variants are found through the dialect_key index."""
+    print("Testing dialect lookups...")
+
+    lexicon = get_lexicon()
+
+    forms = [s['plain_name'] for s in lexicon.lookup_dialect('syllables', 'ra')]
+    assert forms == ['la', 'ra'], f"Expected la and ra, got {forms}"
+    forms = [s['plain_name'] for s in lexicon.lookup_dialect('syllables', 'vá')]
+    assert 'bá' in forms and 'vá' in forms, f"Expected bá among the variants of vá, got {forms}"
+    print("  ✓ Syllable variants found with one probe")
+
+    forms = [i['infinitive_form'] for i in lexicon.lookup_dialect('infinitives', 'ịrà')]
+    assert forms == ['ịlà', 'ịrà'], f"Expected ịlà and ịrà, got {forms}"
+    print("  ✓ Infinitive variants found with one probe")
+
+    for syllable in lexicon.syllables:
+        assert syllable in lexicon.lookup_dialect('syllables', syllable['plain_name']), \
+            f"{syllable['id']} should be found under its own key"
+    print("  ✓ Every syllable is found under its own key")
+
+    equivalence = DialectEquivalence.from_language_data()
+    for number in range(CACHE_SIZE + 10):
+        equivalence.key(f"ra{number}")
+    assert len(equivalence._keys) <= CACHE_SIZE, "The key cache should stay bounded"
+    assert equivalence.key('ra') == equivalence.key('la'), "Keys should not change after the cache is cleared"
+    print("  ✓ Key cache bounded")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Dialect Equivalence")
+    print("=" * 70)
+    print()
+
+    try:
+        test_union_find()
+        test_equivalence_classes()
+        test_dialect_lookup()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
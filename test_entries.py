@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the typed collection entries.
+Verifies the JSON round trip, mapping access, interning and memory use.
+"""
+
+import json
+import sys
+
+from entries import ENTRY_CLASSES, Syllable, load_collection, to_json
+from lexicon import COLLECTION_FILES, DEFAULT_LANGUAGE_DATA_DIR, load_json
+from record_store import traced_size
+
+
+def test_round_trip():
+    """Test that every collection converts to entries and back unchanged."""
+    print("Testing JSON round trip...")
+
+    for collection, rel_path in COLLECTION_FILES.items():
+        json_file = DEFAULT_LANGUAGE_DATA_DIR / rel_path
+        data = load_json(json_file)
+        entries = load_collection(collection, json_file)
+        assert all(type(e) is ENTRY_CLASSES[collection] for e in entries), f"{collection}: wrong entry class"
+        assert [e.to_json() for e in entries] == data, f"{collection}: round trip changed entries"
+        assert all(list(e.to_json()) == list(d) for e, d in zip(entries, data)), f"{collection}: field order changed"
+        assert json.dumps(entries, ensure_ascii=False, default=to_json) == json.dumps(data, ensure_ascii=False)
+        print(f"  ✓ {collection}: {len(entries)} entries")
+
+    entry = Syllable.from_json({'id': 'syl_x_001', 'tone': 'high', 'gloss': 'go'})
+    assert entry['gloss'] == 'go' and list(entry) == ['id', 'tone', 'gloss'], "Unknown fields should be kept"
+    assert 'plain_name' not in entry and entry.get('plain_name') is None, "Unset fields should be missing"
+    print("  ✓ Unknown fields kept, unset fields missing")
+
+    entry = Syllable.from_json({'gloss': 'go', 'tone': 'high', 'id': 'syl_x_001'})
+    assert list(entry.to_json()) == ['id', 'tone', 'gloss'], "Known fields come back in FIELDS order"
+    print("  ✓ Hand-edited key order normalized to FIELDS order")
+
+    print()
+
+
+def test_mapping_access():
+    """Test that entries read like the dicts they replace."""
+    print("Testing mapping access...")
+
+    syllables = load_collection('syllables', DEFAULT_LANGUAGE_DATA_DIR / 'syllables.json')
+    ma = next(s for s in syllables if s.id == 'syl_ma_001')
+    assert ma['plain_name'] == ma.plain_name == 'má'
+    assert ma == ma.to_json() and ma.to_json() == ma, "Entries should compare equal to their dicts"
+    assert dict(ma, tone='low')['tone'] == 'low', "dict(entry, ...) should copy the fields"
+    assert not hasattr(ma, '__dict__'), "Entries should not have a per-instance __dict__"
+    print("  ✓ Item, attribute and dict access")
+
+    low = [s for s in syllables if s.tone == 'low']
+    assert all(s.tone is low[0].tone for s in low), "tone should be interned"
+    assert all(s.vowelGroup is sys.intern(s.vowelGroup) for s in syllables), "vowelGroup should be interned"
+    print("  ✓ Tone and vowel group strings shared")
+
+    print()
+
+
+def test_memory():
+    """Test that typed entries take less memory than dicts."""
+    print("Testing memory...")
+
+    json_file = DEFAULT_LANGUAGE_DATA_DIR / COLLECTION_FILES['dialectal_roots']
+    _, dict_bytes = traced_size(lambda: load_json(json_file))
+    _, entry_bytes = traced_size(lambda: load_collection('dialectal_roots', json_file))
+    assert entry_bytes < dict_bytes * 0.8, f"Entries {entry_bytes} bytes vs dicts {dict_bytes} bytes"
+    print(f"  ✓ {dict_bytes} bytes as dicts, {entry_bytes} bytes as entries")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Entries")
+    print("=" * 70)
+    print()
+
+    try:
+        test_round_trip()
+        test_mapping_access()
+        test_memory()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,19 +5,26 @@ Verifies that the generation follows the correct rules.
 """
 
 import json
+import shutil
+import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
+from entries import Syllable
+from generate_verb_roots import (
+    GENERATION_INPUTS, IdLedger, count_polysyllabic_roots, generate_polysyllabic_roots, merge_and_assign_ids,
+    stream_array_to_json
+)
+from lexicon import get_lexicon
+
 
 def test_tone_variants():
     """Test that tone variants are properly generated."""
     print("Testing tone variants...")
     
-    verbs_dir = Path(__file__).parent / 'language-data' / 'verbs'
-    prime_roots_dir = verbs_dir / 'prime-roots'
-    
-    with open(Path(__file__).parent / 'language-data' / 'syllables.json', 'r', encoding='utf-8') as f:
-        roots = json.load(f)
+    lexicon = get_lexicon()
+    roots = lexicon.syllables
     
     # Check structure of entries
     sample = roots[0]
@@ -27,7 +34,7 @@ def test_tone_variants():
     print(f"  ✓ All required fields present: {required_fields}")
     
     # Check 'ma' has all three tones
-    ma_roots = [r for r in roots if r['syllable_group'] == 'ma']
+    ma_roots = lexicon.lookup('syllables', 'syllable_group', 'ma')
     assert len(ma_roots) == 3, f"Expected 3 tone variants for 'ma', got {len(ma_roots)}"
     
     tones = {r['tone'] for r in ma_roots}
@@ -67,32 +74,13 @@ def test_problem_statement_examples():
     """Test examples from the problem statement."""
     print("Testing problem statement examples...")
     
-    verbs_dir = Path(__file__).parent / 'language-data' / 'verbs'
-    prime_roots_dir = verbs_dir / 'prime-roots'
-    
-    # Read JSON files
-    with open(Path(__file__).parent / 'language-data' / 'syllables.json', 'r', encoding='utf-8') as f:
-        roots = json.load(f)
-    
-    with open(verbs_dir / 'generated-infinitives.json', 'r', encoding='utf-8') as f:
-        infinitives = json.load(f)
-    
-    with open(verbs_dir / 'generated-dialectal-roots.json', 'r', encoding='utf-8') as f:
-        dialectal_roots = json.load(f)
+    lexicon = get_lexicon()
     
-    with open(verbs_dir / 'generated-dialectal-infinitives.json', 'r', encoding='utf-8') as f:
-        dialectal_infinitives = json.load(f)
-    
-    # Create lookup dictionaries - note: may have multiple entries per plain_name
-    roots_by_name = {}
-    for r in roots:
-        if r['plain_name'] not in roots_by_name:
-            roots_by_name[r['plain_name']] = []
-        roots_by_name[r['plain_name']].append(r)
-    
-    infinitives_by_form = {i['infinitive_form']: i for i in infinitives}
-    dialectal_by_form = {d['combined_form']: d for d in dialectal_roots}
-    dialectal_inf_by_form = {d['infinitive_form']: d for d in dialectal_infinitives}
+    # Indexed lookups - note: may have multiple entries per plain_name
+    roots_by_name = lexicon.indexes['syllables']['plain_name']
+    infinitives_by_form = lexicon.indexes['infinitives']['infinitive_form']
+    dialectal_by_form = lexicon.indexes['dialectal_roots']['combined_form']
+    dialectal_inf_by_form = lexicon.indexes['dialectal_infinitives']['infinitive_form']
     
     # Test 1: ma (A-group) → ịma
     assert 'ma' in roots_by_name, "Root 'ma' not found"
@@ -123,12 +111,12 @@ def test_vowel_harmony():
     """Test that vowel harmony rules are correctly applied."""
     print("Testing vowel harmony...")
     
-    verbs_dir = Path(__file__).parent / 'language-data' / 'verbs'
+    lexicon = get_lexicon()
     
-    with open(verbs_dir / 'generated-infinitives.json', 'r', encoding='utf-8') as f:
-        infinitives = json.load(f)
+    def infinitive(form):
+        return lexicon.lookup('infinitives', 'infinitive_form', form)[0]
     
-    infinitives_by_form = {i['infinitive_form']: i for i in infinitives}
+    infinitives_by_form = lexicon.indexes['infinitives']['infinitive_form']
     
     # A-group vowels should have ị prefix
     a_group_tests = [
@@ -141,8 +129,8 @@ def test_vowel_harmony():
     
     for root, expected_inf in a_group_tests:
         assert expected_inf in infinitives_by_form, f"A-group infinitive '{expected_inf}' not found"
-        assert infinitives_by_form[expected_inf]['vowelGroup'] == 'A', f"{expected_inf} should be A-group"
-        assert infinitives_by_form[expected_inf]['prefix'] == 'ị', f"{expected_inf} should have ị prefix"
+        assert infinitive(expected_inf)['vowelGroup'] == 'A', f"{expected_inf} should be A-group"
+        assert infinitive(expected_inf)['prefix'] == 'ị', f"{expected_inf} should have ị prefix"
     print("  ✓ A-group vowels (a, ẹ, ị, ọ, ụ) use ị prefix")
     
     # E-group vowels should have i prefix
@@ -155,8 +143,8 @@ def test_vowel_harmony():
     
     for root, expected_inf in e_group_tests:
         assert expected_inf in infinitives_by_form, f"E-group infinitive '{expected_inf}' not found"
-        assert infinitives_by_form[expected_inf]['vowelGroup'] == 'E', f"{expected_inf} should be E-group"
-        assert infinitives_by_form[expected_inf]['prefix'] == 'i', f"{expected_inf} should have i prefix"
+        assert infinitive(expected_inf)['vowelGroup'] == 'E', f"{expected_inf} should be E-group"
+        assert infinitive(expected_inf)['prefix'] == 'i', f"{expected_inf} should have i prefix"
     print("  ✓ E-group vowels (e, i, o, u) use i prefix")
     
     print()
@@ -166,21 +154,11 @@ def test_counts():
     """Test that the expected number of entries exist."""
     print("Testing counts...")
     
-    verbs_dir = Path(__file__).parent / 'language-data' / 'verbs'
-    prime_roots_dir = verbs_dir / 'prime-roots'
-    
-    # Read JSON files
-    with open(Path(__file__).parent / 'language-data' / 'syllables.json', 'r', encoding='utf-8') as f:
-        roots = json.load(f)
-    
-    with open(verbs_dir / 'generated-infinitives.json', 'r', encoding='utf-8') as f:
-        infinitives = json.load(f)
-    
-    with open(verbs_dir / 'generated-dialectal-roots.json', 'r', encoding='utf-8') as f:
-        dialectal_roots = json.load(f)
-    
-    with open(verbs_dir / 'generated-dialectal-infinitives.json', 'r', encoding='utf-8') as f:
-        dialectal_infinitives = json.load(f)
+    lexicon = get_lexicon()
+    roots = lexicon.syllables
+    infinitives = lexicon.infinitives
+    dialectal_roots = lexicon.dialectal_roots
+    dialectal_infinitives = lexicon.dialectal_infinitives
     
     # Check counts - now with tone variants: 270 syllables × 3 tones = 810
     assert len(roots) == 810, f"Expected 810 roots (270 syllables × 3 tones), got {len(roots)}"
@@ -190,11 +168,11 @@ def test_counts():
     assert len(infinitives) == 810, f"Expected 810 infinitives, got {len(infinitives)}"
     print(f"  ✓ {len(infinitives)} base infinitives")
     
-    # Dialectal variations should also be tripled (63 syllable pairs × 3 tones = 189)
-    assert len(dialectal_roots) == 189, f"Expected 189 dialectal roots, got {len(dialectal_roots)}"
+    # One variant set per major pattern, vowel and tone (12 patterns × 9 vowels × 3 tones = 324)
+    assert len(dialectal_roots) == 324, f"Expected 324 dialectal roots, got {len(dialectal_roots)}"
     print(f"  ✓ {len(dialectal_roots)} dialectal verb root variations")
     
-    assert len(dialectal_infinitives) == 189, f"Expected 189 dialectal infinitives, got {len(dialectal_infinitives)}"
+    assert len(dialectal_infinitives) == 324, f"Expected 324 dialectal infinitives, got {len(dialectal_infinitives)}"
     print(f"  ✓ {len(dialectal_infinitives)} dialectal infinitive variations")
     
     # Check for no duplicate IDs
@@ -219,12 +197,8 @@ def test_dialectal_patterns():
     """Test that major dialectal patterns are represented."""
     print("Testing dialectal patterns...")
     
-    verbs_dir = Path(__file__).parent / 'language-data' / 'verbs'
-    
-    with open(verbs_dir / 'generated-dialectal-roots.json', 'r', encoding='utf-8') as f:
-        dialectal_roots = json.load(f)
-    
-    dialectal_by_form = {d['combined_form']: d for d in dialectal_roots}
+    lexicon = get_lexicon()
+    dialectal_by_form = lexicon.indexes['dialectal_roots']['combined_form']
     
     # Check for major patterns
     patterns = {
@@ -235,6 +209,11 @@ def test_dialectal_patterns():
         'J/Z': ['ja / za', 'jo / zo'],
         'S/T': ['sa / ta', 'so / to'],
         'H/Y': ['ha / ya', 'ho / yo'],
+        'F/H/SH': ['fa / ha / sha', 'fó / hó / shó'],
+        'S/SH': ['sa / sha', 'sè / shè'],
+        'N/L/Y': ['la / na / ya', 'lu / nu / yu'],
+        'B/W': ['ba / wa', 'bí / wí'],
+        'W/GH': ['gha / wa', 'ghọ / wọ'],
     }
     
     for pattern_name, examples in patterns.items():
@@ -242,6 +221,18 @@ def test_dialectal_patterns():
             assert example in dialectal_by_form, f"Pattern {pattern_name} example '{example}' not found"
         print(f"  ✓ {pattern_name} pattern represented")
     
+    # Every member of a set carries the same tone, and sets are not repeated
+    for entry in lexicon.dialectal_roots:
+        tones = {lexicon.lookup('syllables', 'plain_name', form)[0]['tone'] for form in entry['variant_forms']}
+        assert tones == {entry['tone']}, f"{entry['combined_form']} mixes tones: {tones}"
+    keys = [tuple(sorted(entry['variant_forms'])) for entry in lexicon.dialectal_roots]
+    assert len(keys) == len(set(keys)), "Duplicate dialectal variant sets found"
+    print("  ✓ Variant sets are same-tone and unique")
+    
+    three_way = lexicon.indexes['dialectal_infinitives']['infinitive_form']['ịfa / ịha / ịsha'][0]
+    assert three_way['variant_roots'] == ['fa', 'ha', 'sha'], f"Unexpected three-way infinitive: {three_way}"
+    print("  ✓ Three-way dialectal infinitives generated (ịfa / ịha / ịsha)")
+    
     print()
 
 
@@ -249,11 +240,11 @@ def test_phonemes():
     """Test that phonemes are correctly extracted for all roots."""
     print("Testing phonemes extraction...")
     
-    verbs_dir = Path(__file__).parent / 'language-data' / 'verbs'
-    prime_roots_dir = verbs_dir / 'prime-roots'
+    lexicon = get_lexicon()
+    roots = lexicon.syllables
     
-    with open(Path(__file__).parent / 'language-data' / 'syllables.json', 'r', encoding='utf-8') as f:
-        roots = json.load(f)
+    def roots_with_tone(syllable_group, tone):
+        return [r for r in lexicon.lookup('syllables', 'syllable_group', syllable_group) if r['tone'] == tone]
     
     # Test specific examples with different consonant types (mid tone)
     test_cases = {
@@ -267,7 +258,7 @@ def test_phonemes():
     }
     
     for syllable_group, expected_phonemes in test_cases.items():
-        roots_for_syllable = [r for r in roots if r['syllable_group'] == syllable_group and r['tone'] == 'mid']
+        roots_for_syllable = roots_with_tone(syllable_group, 'mid')
         if roots_for_syllable:
             root = roots_for_syllable[0]
             assert root['phonemes'] == expected_phonemes, \
@@ -288,7 +279,7 @@ def test_phonemes():
     ]
     
     for syllable_group, tone, expected_phonemes in tone_test_cases:
-        roots_for_syllable = [r for r in roots if r['syllable_group'] == syllable_group and r['tone'] == tone]
+        roots_for_syllable = roots_with_tone(syllable_group, tone)
         if roots_for_syllable:
             root = roots_for_syllable[0]
             assert root['phonemes'] == expected_phonemes, \
@@ -324,6 +315,148 @@ def test_phonemes():
     print()
 
 
+def test_polysyllabic_roots():
+    """Test lazy polysyllabic enumeration and its pruning."""
+    print("Testing polysyllabic roots...")
+    
+    syllables = get_lexicon().syllables
+    nasals = {'m̩', 'n̩'}
+    
+    roots = list(generate_polysyllabic_roots(syllables, 2, nasals, leading=['ku', 'm̩a']))
+    assert len(roots) == count_polysyllabic_roots(syllables, 2, nasals, leading=['ku', 'm̩a']), \
+        "count_polysyllabic_roots disagrees with the generator"
+    assert len({r['id'] for r in roots}) == len(roots), "Duplicate polysyllabic ids"
+    assert all(r['vowelGroup'] == 'E' for r in roots if r['syllable_group'].startswith('ku')), \
+        "ku- roots should stay in the E group"
+    assert not any(r['syllable_group'] == 'kuwa' for r in roots), "kuwa is disharmonic"
+    print(f"  ✓ {len(roots)} harmonic 2-syllable roots for ku- and m̩a-")
+    
+    assert any(r['syllable_group'].startswith('m̩a') for r in roots), "Syllabic nasals may open a root"
+    assert not any('m̩' in r['syllable_group'][1:] or 'n̩' in r['syllable_group'] for r in roots), \
+        "Syllabic nasals should not open a non-initial syllable"
+    print("  ✓ No syllabic nasal onsets after the first syllable")
+    
+    kuwa = [r for r in generate_polysyllabic_roots(syllables, 2, nasals, ['ku'], harmony=False)
+            if r['syllable_group'] == 'kuwa']
+    assert [r['plain_name'] for r in kuwa[:3]] == ['kúwá', 'kúwa', 'kúwà'], f"Unexpected tones: {kuwa[:3]}"
+    assert kuwa[0]['syllable_ids'] == ['syl_ku_001', 'syl_wa_001'], "Roots should reference their syllables"
+    assert len(kuwa) == 9, "Each 2-syllable root has 3^2 tone patterns"
+    print("  ✓ kuwa generated with 9 tone patterns when harmony is off")
+    
+    first = next(generate_polysyllabic_roots(syllables, 3, nasals))
+    assert first['plain_name'] == 'bábábá', f"Unexpected first 3-syllable root: {first}"
+    assert count_polysyllabic_roots(syllables, 3, nasals) > 10 ** 8, "Expected over 100M 3-syllable roots"
+    print("  ✓ 3-syllable inventory enumerated lazily")
+    
+    print()
+
+
+def test_stable_ids():
+    """Test that merging keeps ids stable through the ledger."""
+    print("Testing stable syllable ids...")
+    
+    syllables = get_lexicon().syllables
+    ba = [Syllable.from_json(s.to_json()) for s in syllables if s['syllable_group'] == 'ba']
+    fresh = [Syllable.from_json(dict(s.to_json(), id=None)) for s in ba]
+    
+    ledger = IdLedger()
+    merged = merge_and_assign_ids(ba, fresh, ledger)
+    assert [r['id'] for r in merged] == ['syl_ba_001', 'syl_ba_002', 'syl_ba_003'], "Existing ids should be kept"
+    assert merged == ba, "Generated roots should not replace existing ones"
+    print("  ✓ Existing ids kept, duplicate tone variants skipped")
+    
+    # A hand-added homophone of the mid tone gets the next number without
+    # shifting the ids after it
+    homophone = Syllable.from_json(dict(ba[1].to_json(), id=None))
+    merged = merge_and_assign_ids(ba + [homophone], [], ledger)
+    assert [r['id'] for r in merged] == ['syl_ba_001', 'syl_ba_002', 'syl_ba_004', 'syl_ba_003'], \
+        f"Unexpected ids: {[r['id'] for r in merged]}"
+    print("  ✓ New homophone numbered syl_ba_004, other ids unchanged")
+    
+    # Regenerating from scratch gives every tone variant its recorded id
+    regenerated = merge_and_assign_ids([], [Syllable.from_json(dict(s.to_json(), id=None)) for s in ba], ledger)
+    assert [r['id'] for r in regenerated] == ['syl_ba_001', 'syl_ba_002', 'syl_ba_003']
+    assert merge_and_assign_ids([], fresh[2:], IdLedger())[0]['id'] == 'syl_ba_001', \
+        "Without a ledger, numbering starts at 001"
+    print("  ✓ Regeneration reuses ledger ids")
+    
+    print()
+
+
+def test_streamed_json():
+    """Test that streamed JSON arrays match json.dump byte for byte."""
+    print("Testing streamed JSON output...")
+    
+    syllables = get_lexicon().syllables[:20]
+    cases = {
+        'empty': [],
+        'one': [{'id': 'a'}],
+        'nested': [
+            {'id': 'ịmá', 'phonemes': ['m', 'á'], 'none': None, 'empty': [], 'map': {}, 'deep': {'x': [1, {'y': 2.5}]}},
+            {'id': 'line\nbreak', 'flag': True, 'quote': '"\\'},
+        ],
+        'syllables': [s.to_json() for s in syllables],
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, entries in cases.items():
+            expected_file = Path(tmp_dir) / f'{name}-expected.json'
+            with open(expected_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+            
+            output_file = Path(tmp_dir) / f'{name}.json'
+            source = syllables if name == 'syllables' else entries
+            assert stream_array_to_json(iter(source), output_file) == (True, len(entries))
+            assert output_file.read_bytes() == expected_file.read_bytes(), f"{name}: bytes differ from json.dump"
+            with open(output_file, 'r', encoding='utf-8') as f:
+                assert json.load(f) == entries, f"{name}: round trip changed the entries"
+            assert stream_array_to_json(iter(source), output_file) == (False, len(entries)), \
+                f"{name}: an unchanged array should not be rewritten"
+    print(f"  ✓ {len(cases)} arrays byte-identical to json.dump and round-trip")
+    print("  ✓ Unchanged arrays left in place")
+    
+    print()
+
+
+def test_build_manifest():
+    """Test that the build manifest skips, rebuilds and forces stages."""
+    print("Testing the build manifest...")
+    
+    def generate(root, *args):
+        process = subprocess.run(
+            [sys.executable, 'generate_verb_roots.py', *args],
+            cwd=root, capture_output=True, text=True, encoding='utf-8'
+        )
+        assert process.returncode == 0, f"Generator failed: {process.stdout}{process.stderr}"
+        return process.stdout
+    
+    up_to_date = "All outputs are up to date"
+    repo_root = Path(__file__).parent
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        shutil.copytree(repo_root / 'language-data', root / 'language-data')
+        for rel_path in GENERATION_INPUTS:
+            if rel_path.endswith('.py'):
+                shutil.copy(repo_root / rel_path, root)
+        
+        assert up_to_date not in generate(root), "A fresh tree has no manifest and should build"
+        assert up_to_date in generate(root), "A second run with unchanged inputs should skip every stage"
+        print("  ✓ Unchanged inputs skip every stage")
+        
+        with open(root / 'entries.py', 'a', encoding='utf-8') as f:
+            f.write('\n# edited\n')
+        output = generate(root)
+        assert up_to_date not in output and "syllables: rebuild" in output, "Editing an input should rebuild"
+        assert up_to_date in generate(root), "The rebuild should record the new input hashes"
+        print("  ✓ Editing an input module rebuilds")
+        
+        output = generate(root, '--force')
+        assert all(f"{stage}: rebuild" in output for stage in ('syllables', 'infinitives')), \
+            "--force should rerun every stage"
+        print("  ✓ --force reruns every stage")
+    
+    print()
+
+
 def main():
     """Run all tests."""
     print("=" * 70)
@@ -338,6 +471,10 @@ def main():
         test_counts()
         test_dialectal_patterns()
         test_phonemes()
+        test_polysyllabic_roots()
+        test_stable_ids()
+        test_streamed_json()
+        test_build_manifest()
         
         print("=" * 70)
         print("All tests passed! ✓")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script for the dictionary PDF ingestion.
+Verifies entry parsing, tone conversion, prime-root output and the page cache.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import ingest_blench_dictionary
+from ingest_blench_dictionary import (
+    build_prime_roots, load_page_cache, parse_page_range, parse_page_text, parser_version, save_page_cache,
+    williamson_tones
+)
+from lexicon import get_lexicon
+
+
+# Page text laid out as pypdf extracts it (see the module docstring)
+SAMPLE_PAGE = """Igbo Dictionary: Kay Williamson. Draft of Edition II
+88
+gàrị   n.   dried and grated cassava; gari
+-gba 1.   v.   move:
+ -gba àghalị   riot; be disorderly
+ -gbabà   run into, in; (fig.) trust in; confide:
+-gba 2.   v.   kick
+-wè   v.
+take; receive
+-kwerùbe   v.   shake thoroughly
+-mā   v.   know (downstepped)
+"""
+
+
+def test_parse():
+    """Test that entry lines are parsed and everything else is skipped."""
+    print("Testing page parsing...")
+
+    records = parse_page_text(SAMPLE_PAGE)
+    assert [r['headword'] for r in records] == ['gàrị', 'gba', 'gba', 'wè', 'kwerùbe', 'mā'], \
+        "Only entry lines should be parsed; sub-entries, headers and page numbers skipped"
+    gari, gba, gba_2 = records[:3]
+    assert (gari['pos'], gari['verb'], gari['homonym']) == ('n', False, None)
+    assert (gba['pos'], gba['verb'], gba['homonym'], gba['gloss']) == ('v', True, 1, 'move'), \
+        "Trailing ':' should be dropped from the gloss"
+    assert gba_2['homonym'] == 2 and gba_2['gloss'] == 'kick'
+    print("  ✓ Headword, homonym number, part of speech and gloss")
+
+    assert records[3]['gloss'] == 'take; receive', "A gloss on the next line belongs to the entry"
+    assert parse_page_text('-li   v.\n-ta   v.   chew')[0]['gloss'] == '', "The next entry is not a gloss"
+    print("  ✓ Glosses continued on the next line")
+
+    print()
+
+
+def test_tones():
+    """Test that Williamson's tone marking is converted."""
+    print("Testing tone conversion...")
+
+    assert williamson_tones('-gba') == ['high'], "Unmarked vowels are high"
+    assert williamson_tones('wè') == ['low']
+    assert williamson_tones('mā') == ['mid'], "Downstep (macron) is mid"
+    assert williamson_tones('kwerùbe') == ['high', 'low', 'high']
+    assert williamson_tones('\u1ecb\u0300kp\u1ecd') == ['low', 'high'], "Dots below are not tones"
+    print("  ✓ Unmarked high, grave low, macron mid")
+
+    print()
+
+
+def test_prime_roots():
+    """Test that monosyllabic verbs become prime-root entries."""
+    print("Testing prime roots...")
+
+    lexicon = get_lexicon()
+    prime_roots, skipped = build_prime_roots([(121, parse_page_text(SAMPLE_PAGE))], lexicon)
+    assert [r['id'] for r in prime_roots] == ['gba_001', 'gba_002', 'we_001', 'ma_001']
+    assert skipped == 1, "kwerùbe is not monosyllabic"
+    gba = prime_roots[0]
+    assert (gba['plain_name'], gba['syllable_id'], gba['vowelGroup']) == ('gba', 'syl_gba_001', 'A')
+    assert (gba['gloss'], gba['source_page'], gba['homonym']) == ('move', 121, 1)
+    assert lexicon.get(prime_roots[2]['syllable_id'])['plain_name'] == 'wè'
+    assert lexicon.get(prime_roots[3]['syllable_id'])['tone'] == 'mid'
+    print("  ✓ Homophones numbered, syllables resolved with their tones")
+
+    print()
+
+
+def test_page_cache():
+    """Test the page cache round trip and page selection."""
+    print("Testing page cache...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = Path(tmp_dir) / 'cache' / 'page-cache.json'
+        assert load_page_cache(cache_file) == {}, "A missing cache is empty"
+        pages = {'ab12': parse_page_text(SAMPLE_PAGE), 'cd34': []}
+        save_page_cache(pages, cache_file)
+        assert load_page_cache(cache_file) == pages
+        cache_file.write_text(cache_file.read_text(encoding='utf-8').replace('"parser": "', '"parser": "x'),
+                              encoding='utf-8')
+        assert load_page_cache(cache_file) == {}, "A cache from another parser version is dropped"
+    print("  ✓ Pages cached by hash, dropped when the parser changes")
+
+    sources = ingest_blench_dictionary.PARSER_SOURCES
+    assert any(source.name == 'tone_engine.py' for source in sources), "The tone marks are part of the parser"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        script, tones = Path(tmp_dir) / 'script.py', Path(tmp_dir) / 'tones.py'
+        script.write_text('a', encoding='utf-8')
+        tones.write_text('b', encoding='utf-8')
+        ingest_blench_dictionary.PARSER_SOURCES = (script, tones)
+        try:
+            before = parser_version()
+            tones.write_text('c', encoding='utf-8')
+            assert parser_version() != before, "Changing the tone engine should change the parser version"
+        finally:
+            ingest_blench_dictionary.PARSER_SOURCES = sources
+    print("  ✓ Parser version covers tone_engine.py")
+
+    assert parse_page_range('1-3,9', 10) == [0, 1, 2, 8]
+    assert parse_page_range('5', 10) == [4]
+    try:
+        parse_page_range('9-11', 10)
+        assert False, "Pages past the end should be rejected"
+    except ValueError:
+        pass
+    print("  ✓ Page ranges")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Dictionary Ingestion")
+    print("=" * 70)
+    print()
+
+    try:
+        test_parse()
+        test_tones()
+        test_prime_roots()
+        test_page_cache()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
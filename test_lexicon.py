@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared Lexicon loader.
+Verifies that the hash indexes agree with the underlying data files.
+"""
+
+import sys
+
+from lexicon import Lexicon, get_lexicon
+
+
+def test_shared_instance():
+    """Test that get_lexicon parses the data once per directory."""
+    print("Testing shared instance...")
+
+    assert get_lexicon() is get_lexicon(), "get_lexicon should return a shared instance"
+    print("  ✓ get_lexicon returns one shared Lexicon")
+
+    print()
+
+
+def test_id_index():
+    """Test lookups by id across collections."""
+    print("Testing id index...")
+
+    lexicon = get_lexicon()
+
+    assert lexicon.get('syl_ma_001')['plain_name'] == 'má', "syl_ma_001 should be 'má'"
+    assert lexicon.get('ịma_infinitive')['base_root'] == 'ma', "ịma_infinitive should come from 'ma'"
+    assert lexicon.get('la_ra_dialectal')['combined_form'] == 'la / ra', "la_ra_dialectal not indexed"
+    assert lexicon.get('missing_id') is None, "Unknown ids should return None"
+    print("  ✓ Syllables, infinitives and dialectal entries resolved by id")
+
+    print()
+
+
+def test_field_indexes():
+    """Test that every field index matches a linear scan."""
+    print("Testing field indexes...")
+
+    lexicon = get_lexicon()
+    roots = lexicon.syllables
+
+    assert len(lexicon.lookup('syllables', 'syllable_group', 'ma')) == 3, "Expected 3 entries for 'ma'"
+    assert [r['id'] for r in lexicon.lookup('syllables', 'plain_name', 'gbà')] == ['syl_gba_003']
+
+    for tone in ['high', 'mid', 'low']:
+        expected = [r for r in roots if r['tone'] == tone]
+        assert lexicon.lookup('syllables', 'tone', tone) == expected, f"Tone index mismatch for {tone}"
+    print("  ✓ Tone index matches linear scan")
+
+    for group in ['A', 'E']:
+        expected = [r for r in roots if r['vowelGroup'] == group]
+        assert lexicon.lookup('syllables', 'vowelGroup', group) == expected, f"vowelGroup index mismatch for {group}"
+    print("  ✓ vowelGroup index matches linear scan")
+
+    gb_roots = lexicon.lookup('syllables', 'consonant', 'gb')
+    assert len(gb_roots) == 27, f"Expected 27 'gb' syllables, got {len(gb_roots)}"
+    assert all(r['syllable_group'].startswith('gb') for r in gb_roots), "Consonant index mixed up 'g' and 'gb'"
+    print("  ✓ Consonant index distinguishes digraphs")
+
+    infinitives = lexicon.lookup('infinitives', 'base_root', 'má')
+    assert [i['infinitive_form'] for i in infinitives] == ['ịmá'], f"Unexpected infinitives for 'má': {infinitives}"
+    assert lexicon.lookup('syllables', 'plain_name', 'xyz') == [], "Missing keys should return an empty list"
+    print("  ✓ base_root index resolves infinitives")
+
+    print()
+
+
+def test_folded_search():
+    """Test tone- and diacritic-insensitive search."""
+    print("Testing folded search...")
+
+    lexicon = get_lexicon()
+
+    forms = [s['plain_name'] for s in lexicon.search('syllables', 'ba')]
+    assert forms == ['bá', 'ba', 'bà'], f"Unexpected matches for 'ba': {forms}"
+    forms = [i['infinitive_form'] for i in lexicon.search('infinitives', 'ibe')]
+    assert forms == ['ibé', 'ibe', 'ibè', 'ịbẹ́', 'ịbẹ', 'ịbẹ̀'], f"Unexpected matches for 'ibe': {forms}"
+    print("  ✓ Unmarked input finds every tone and dot variant, ranked")
+
+    forms = [i['infinitive_form'] for i in lexicon.search('infinitives', 'ịbẹ̀')]
+    assert forms[:3] == ['ịbẹ̀', 'ịbẹ́', 'ịbẹ'], f"Marked input should rank its own dots first: {forms}"
+    assert lexicon.search('syllables', 'BÀ')[0]['plain_name'] == 'bà', "Search should ignore case"
+    assert lexicon.search('syllables', 'xyz') == [], "Unknown forms should return an empty list"
+    print("  ✓ Marks in the query rank exact matches first")
+
+    print()
+
+
+def test_missing_directory():
+    """Test that a directory without generated data yields empty collections."""
+    print("Testing missing data...")
+
+    lexicon = Lexicon('/nonexistent-language-data')
+    assert all(len(entries) == 0 for entries in lexicon.collections.values())
+    assert lexicon.lookup('syllables', 'tone', 'high') == []
+    print("  ✓ Missing files produce empty collections")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Lexicon")
+    print("=" * 70)
+    print()
+
+    try:
+        test_shared_instance()
+        test_id_index()
+        test_field_indexes()
+        test_folded_search()
+        test_missing_directory()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for the lexicon lookup service.
+Verifies the LRU response cache and the line protocol over a Unix socket.
+"""
+
+import asyncio
+import sys
+import tempfile
+import unicodedata
+from pathlib import Path
+
+from lexicon_loadtest import percentile
+from lexicon_server import LexiconClient, LexiconService, RequestError, ResponseCache, start_server
+
+
+async def with_client(check, **service_args):
+    """Run check(client, service) against a server on a temporary socket."""
+    service = LexiconService(**service_args)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket_path = Path(tmp_dir) / 'lexicon.sock'
+        server = await start_server(service, socket_path)
+        client = await LexiconClient.connect(socket_path=socket_path)
+        try:
+            await check(client, service)
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+
+def test_response_cache():
+    """Test LRU eviction and hit counting."""
+    print("Testing response cache...")
+
+    cache = ResponseCache(2)
+    cache.put('a', '1')
+    cache.put('b', '2')
+    assert cache.get('a') == '1', "Cached value missing"
+    cache.put('c', '3')
+    assert cache.get('b') is None, "Least recently used entry should be evicted"
+    assert cache.get('a') == '1' and cache.get('c') == '3', "Recent entries should survive"
+    assert cache.stats() == {'size': 2, 'maxsize': 2, 'hits': 3, 'misses': 1}, cache.stats()
+    print("  ✓ Bounded LRU eviction")
+
+    print()
+
+
+def test_lookups():
+    """Test each lookup operation through the socket."""
+    print("Testing lookups...")
+
+    async def check(client, service):
+        entry = await client.request('get', key='syl_ma_001')
+        assert entry['plain_name'] == 'má', f"Unexpected entry: {entry}"
+        assert await client.request('get', key='missing') is None, "Unknown ids should give null"
+
+        syllables = await client.request('syllable', form=unicodedata.normalize('NFD', 'gbà'))
+        assert [s['id'] for s in syllables] == ['syl_gba_003'], "NFD forms should be normalized"
+        infinitives = await client.request('infinitive', form='ịmá')
+        assert [i['base_root'] for i in infinitives] == ['má'], f"Unexpected infinitives: {infinitives}"
+
+        variants = await client.request('dialect', word='ra')
+        assert {s['plain_name'] for s in variants} == {'la', 'ra'}, f"Unexpected variants: {variants}"
+        matches = await client.request('search', collection='infinitives', text='ibe')
+        assert matches[0]['infinitive_form'] == 'ibé', f"Unexpected search order: {matches}"
+        analyses = await client.request('analyze', token='ịbà')
+        assert {a['type'] for a in analyses} == {'infinitive', 'affixed'}, f"Unexpected analyses: {analyses}"
+        print("  ✓ get, syllable, infinitive, dialect, search and analyze")
+
+        await client.request('get', key='syl_ma_001')
+        stats = await client.request('stats')
+        assert stats['cache']['hits'] == 1, f"Repeated request should hit the cache: {stats}"
+        print("  ✓ Repeated requests served from the cache")
+
+        await client.send({'op': 'get', 'key': 'syl_ma_001', 'padding': 'x' * 10000})
+        await client.request('syllable', form='gbà')
+        stats = await client.request('stats')
+        assert stats['cache']['hits'] == 3, f"Extra fields and NFD forms should share the cache key: {stats}"
+        size = stats['cache']['size']
+        assert await client.request('get', key='x' * 10000) is None
+        stats = await client.request('stats')
+        assert stats['cache']['size'] == size, "Overlong arguments should not be cached"
+        print("  ✓ Cache keyed by normalized arguments, overlong ones not cached")
+
+    asyncio.run(with_client(check))
+
+    print()
+
+
+def test_batch_and_errors():
+    """Test batches and error responses."""
+    print("Testing batches and errors...")
+
+    async def check(client, service):
+        responses = await client.batch([
+            {'op': 'get', 'key': 'syl_ma_001'},
+            {'op': 'unknown'},
+            {'op': 'lookup', 'collection': 'syllables', 'field': 'ndebe', 'value': ''},
+            {'op': 'syllable'},
+        ])
+        assert [r['ok'] for r in responses] == [True, False, False, False], responses
+        assert responses[0]['result']['id'] == 'syl_ma_001', "Batch result missing"
+        print("  ✓ Batch answered in order, with per-request errors")
+
+        [nested] = await client.batch([{'op': 'batch', 'requests': [{'op': 'get', 'key': 'syl_ma_001'}]}])
+        assert not nested['ok'] and 'nested' in nested['error'], f"Nested batches should be rejected: {nested}"
+        print("  ✓ Nested batches rejected")
+
+        try:
+            await client.request('lookup', collection='nowhere', field='id', value='x')
+            raise AssertionError("Unknown collections should be reported")
+        except RequestError:
+            pass
+
+        client.writer.write(b'not json\n')
+        response = await client.reader.readline()
+        assert b'Invalid JSON' in response, f"Unexpected response: {response}"
+        client.writer.write(b'[' * 100000 + b'\n')
+        response = await client.reader.readline()
+        assert b'Invalid JSON' in response, "Deeply nested JSON should get an error response"
+        assert await client.request('get', key='syl_ma_001'), "Connection should survive bad input"
+        print("  ✓ Errors reported without closing the connection")
+
+    asyncio.run(with_client(check, cache_size=1, max_concurrency=2))
+
+    print()
+
+
+def test_percentile():
+    """Test the load test's nearest-rank percentiles."""
+    print("Testing percentiles...")
+
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 50 and percentile(values, 0.99) == 99
+    assert percentile(values, 1.0) == 100 and percentile([], 0.5) == 0.0
+    print("  ✓ Nearest-rank p50/p99")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Lexicon Server")
+    print("=" * 70)
+    print()
+
+    try:
+        test_response_cache()
+        test_lookups()
+        test_batch_and_errors()
+        test_percentile()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
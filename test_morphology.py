@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the verb-form transducer.
+Verifies harmony during composition and lazy paradigm enumeration.
+"""
+
+import io
+import json
+import sys
+from contextlib import redirect_stdout
+from itertools import islice
+from pathlib import Path
+
+from morphology import get_transducer, harmonize, main as morphology_main
+
+
+def test_harmonize():
+    """Test vowel-group realization of affixes."""
+    print("Testing harmony...")
+
+    assert harmonize('rọ', 'E') == 'ro', "rọ should become ro after an E-group root"
+    assert harmonize('rọ', 'A') == 'rọ', "rọ should stay rọ after an A-group root"
+    assert harmonize('ị', 'E') == 'i', "ị should become i"
+    assert harmonize('e', 'A') == 'a', "e should become a"
+    assert harmonize('rọ́', 'E') == 'ró', "Tone should survive harmony"
+    print("  ✓ Affixes realized in the root's vowel group")
+
+    print()
+
+
+def test_realize_verb_form():
+    """Test realizing the verb-form files in the repository."""
+    print("Testing verb-form realization...")
+
+    transducer = get_transducer()
+    verb_form_file = Path(__file__).parent / 'language-data' / 'verbs' / 'verb-forms' / 'ma-aorist.json'
+    with open(verb_form_file, 'r', encoding='utf-8') as f:
+        verb_form = json.load(f)
+
+    surface = transducer.realize(verb_form)
+    assert surface == 'na àmá amárọ', f"Unexpected surface form: {surface}"
+    print(f"  ✓ {verb_form['id']} → {surface}")
+
+    print()
+
+
+def test_arcs_are_harmonic():
+    """Test that compiled arcs only contain forms of the root's vowel group."""
+    print("Testing compiled arcs...")
+
+    transducer = get_transducer()
+    prefixes = {group: [output for _, output in arcs] for group, arcs in transducer.arcs['prefix'].items()}
+
+    assert prefixes['A'] == ['a', 'ị', 'ọ'], f"Unexpected A-group prefixes: {prefixes['A']}"
+    assert prefixes['E'] == ['e', 'i', 'o'], f"Unexpected E-group prefixes: {prefixes['E']}"
+    print("  ✓ Prefix arcs collapse into one harmonic set per group")
+
+    for form in transducer.forms(roots=['syl_me_001', 'syl_ma_001'], tenses=['simplePresent']):
+        verb = form['surface'].split()[-1]
+        if form['vowelGroup'] == 'E':
+            assert not set(verb) & set('aẹịọụ'), f"Disharmonic form generated: {form['surface']}"
+    print("  ✓ No disharmonic forms generated")
+
+    print()
+
+
+def test_lazy_enumeration():
+    """Test that forms() streams and agrees with paradigm_size()."""
+    print("Testing enumeration...")
+
+    transducer = get_transducer()
+    forms = transducer.forms()
+    first = list(islice(forms, 3))
+    assert [f['surface'] for f in first] == ['bá', 'bárọ', 'abá'], f"Unexpected first forms: {first}"
+    print("  ✓ forms() is a lazy generator")
+
+    roots = ['syl_ma_001', 'syl_me_002']
+    tenses = ['simplePresent', 'simpleFuture']
+    forms = list(transducer.forms(roots, tenses))
+    assert len(forms) == transducer.paradigm_size(roots, tenses), "paradigm_size disagrees with forms()"
+    assert len({f['id'] for f in forms}) == len(forms), "Form ids should be unique"
+    print(f"  ✓ {len(forms)} forms with unique ids; full paradigm has {transducer.paradigm_size()} forms")
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        status = morphology_main(['--root', 'zz_999', '--count'])
+    assert status == 1 and output.getvalue() == "Unknown root 'zz_999'\n", \
+        f"Unknown roots should be reported, got {status}: {output.getvalue()!r}"
+    print("  ✓ Unknown --root reported with exit status 1")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Verb-Form Transducer")
+    print("=" * 70)
+    print()
+
+    try:
+        test_harmonize()
+        test_realize_verb_form()
+        test_arcs_are_harmonic()
+        test_lazy_enumeration()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test script for Ndebe transliteration.
+Verifies the glyph mapping, longest-match translation and streaming.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unicodedata
+from pathlib import Path
+
+from lexicon import DEFAULT_LANGUAGE_DATA_DIR, get_lexicon
+from ndebe import (
+    MAPPING_FILE, PUA_END, PUA_START, NdebeDecoder, Transliterator, code_point_notation, get_decoder,
+    get_transliterator, inverse_table, load_mapping, syllable_boundary, update_mapping
+)
+
+
+def test_mapping():
+    """Test that every syllable has a glyph and entries carry their fields."""
+    print("Testing glyph mapping...")
+
+    glyphs = load_mapping(DEFAULT_LANGUAGE_DATA_DIR / MAPPING_FILE)
+    assert len(set(glyphs.values())) == len(glyphs), "Glyphs must be distinct"
+    assert all(PUA_START <= ord(g) <= PUA_END for g in glyphs.values()), "Glyphs must be in the Private Use Area"
+    syllables = get_lexicon().syllables
+    assert {s['syllable_group'] for s in syllables} <= set(glyphs), "Syllable group without a glyph"
+    print(f"  ✓ {len(glyphs)} distinct Private Use Area glyphs")
+
+    ndebe = get_transliterator()
+    for entry in syllables:
+        assert (entry['ndebe'], entry['unicode']) == ndebe.entry_fields(entry['plain_name']), \
+            f"{entry['id']}: stale ndebe fields"
+    ma = next(s for s in syllables if s['id'] == 'syl_ma_003')
+    assert ma['ndebe'] == glyphs['ma'] + '\u0300', "Low tone should follow the glyph as a grave"
+    assert ma['unicode'] == f"U+{ord(glyphs['ma']):04X} U+0300"
+    print("  ✓ syllables.json ndebe and unicode fields match the mapping")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        for name in ('vowels.json', 'consonants.json', MAPPING_FILE):
+            shutil.copy(DEFAULT_LANGUAGE_DATA_DIR / name, tmp_dir / name)
+        assert update_mapping(tmp_dir, ['ba', 'zza']) == 1, "Only the new group should be added"
+        updated = load_mapping(tmp_dir / MAPPING_FILE)
+        assert all(updated[unit] == glyph for unit, glyph in glyphs.items()), "Existing glyphs must not move"
+        assert ord(updated['zza']) == max(map(ord, glyphs.values())) + 1
+        assert json.loads((tmp_dir / MAPPING_FILE).read_text(encoding='utf-8'))['glyphs']['zza'].startswith('U+')
+    print("  ✓ New syllable groups get the next free code point")
+
+    print()
+
+
+def test_transliteration():
+    """Test longest-match translation of words and running text."""
+    print("Testing transliteration...")
+
+    glyphs = load_mapping(DEFAULT_LANGUAGE_DATA_DIR / MAPPING_FILE)
+    ndebe = get_transliterator()
+
+    assert ndebe.transliterate('gba') == glyphs['gba'], "gba should be one glyph, not g + ba"
+    assert ndebe.transliterate('ịbá') == glyphs['ị'] + glyphs['ba'] + '\u0301'
+    assert ndebe.transliterate('Ị́BẸ̀') == glyphs['ị'] + '\u0301' + glyphs['bẹ'] + '\u0300', \
+        "Case and precomposed tone marks should not matter"
+    print("  ✓ Digraph syllables, dotted vowels and tone marks")
+
+    assert ndebe.transliterate('ọ́ bụ́ 42,\nbà') == \
+        f"{glyphs['ọ']}\u0301 {glyphs['bụ']}\u0301 42,\n{glyphs['ba']}\u0300", "Other characters should pass through"
+    assert code_point_notation(ndebe.transliterate('mà')) == f"U+{ord(glyphs['ma']):04X} U+0300"
+    print("  ✓ Whitespace, digits and punctuation kept")
+
+    nasal = unicodedata.normalize('NFC', 'm\u0329')
+    assert ndebe.transliterate('m\u0300ma') == glyphs[nasal] + '\u0300' + glyphs['ma'], "m-grave is a syllabic nasal"
+    assert ndebe.transliterate('\u0144ne') == ndebe.transliterate('n\u0329\u0301ne'), "n-acute is a syllabic nasal"
+    assert ndebe.transliterate('nkịta').startswith(glyphs[unicodedata.normalize('NFC', 'n\u0329')])
+    assert ndebe.transliterate('nwa') == glyphs['nwa'] and ndebe.transliterate('ama') == glyphs['a'] + glyphs['ma'], \
+        "Onsets and the consonants nw, ny are not syllabic"
+    print("  ✓ Syllabic nasals as written in running text")
+
+    small = Transliterator({'a': '\ue000', 'ba': '\ue001', 'b': '\ue002'})
+    assert small.transliterate('bab') == '\ue001\ue002', "Longest key should win, then the rest"
+    print("  ✓ Longest match over a custom table")
+
+    print()
+
+
+def test_stream():
+    """Test that chunked transliteration matches whole-text transliteration."""
+    print("Testing streaming...")
+
+    ndebe = get_transliterator()
+    words = [i['infinitive_form'] for i in get_lexicon().infinitives[:200]]
+    text = '\n'.join(' '.join(words[i:i + 9]) for i in range(0, len(words), 9))
+    expected = ndebe.transliterate(text)
+
+    for size in (1, 5, 64):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert ''.join(ndebe.stream(chunks)) == expected, f"Chunks of {size} characters differ"
+    print("  ✓ Words split across chunks of 1, 5 and 64 characters")
+
+    # A dot below arriving in the next chunk still belongs to its vowel
+    assert ''.join(ndebe.stream(['gb', 'e', '\u0323\u0301'])) == ndebe.transliterate('gbẹ́')
+    print("  ✓ Combining marks split from their letters")
+
+    # Runs without whitespace are cut after a vowel and all of its marks
+    assert syllable_boundary('ịbágbẹ́kp') == len('ịbágbẹ́')
+    assert syllable_boundary('ịbágbẹ') == len('ịbá'), "A dot below may still follow the last vowel"
+    print("  ✓ Long runs cut at syllable boundaries")
+
+    print()
+
+
+def test_decode():
+    """Test that decoding inverts transliteration, whole and in chunks."""
+    print("Testing decoding...")
+
+    ndebe = get_transliterator()
+    decoder = get_decoder()
+    for entry in get_lexicon().syllables:
+        assert decoder.decode(entry['ndebe'], final=True) == entry['plain_name'], f"{entry['id']}: wrong decoding"
+    words = [i['infinitive_form'] for i in get_lexicon().infinitives]
+    text = '\n'.join(' '.join(words[i:i + 9]) for i in range(0, len(words), 9)) + ' 42, m\u0329\u0300ma!'
+    encoded = ndebe.transliterate(text)
+    expected = unicodedata.normalize('NFC', text.lower())
+    assert decoder.decode(encoded, final=True) == expected, "Decoding should give back the Latin text"
+    print(f"  ✓ {len(words)} infinitives, syllabic nasals and punctuation round trip")
+
+    data = encoded.encode('utf-8')
+    for size in (1, 2, 7, 4096):
+        chunks = [encoded[i:i + size] for i in range(0, len(encoded), size)]
+        assert ''.join(decoder.stream(chunks)) == expected, f"Text chunks of {size} differ"
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        assert ''.join(decoder.stream(chunks)) == expected, f"Byte chunks of {size} differ"
+    print("  ✓ Glyphs, tone marks and UTF-8 bytes split across chunks")
+
+    small = NdebeDecoder(inverse_table({'ba': '\ue001', 'm̩': '\ue002'}))
+    assert small.decode('\ue001', final=False) == '', "A trailing glyph should wait for its tone mark"
+    assert small.decode('\u0300\ue002\u0301', final=True) == 'b\u00e0\u1e3f\u0329'
+    assert small.decode('\ue001') == '' and small.decode('', final=True) == 'ba', "final should flush the glyph"
+    print("  ✓ Trailing glyphs held back until the next chunk")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Ndebe Transliteration")
+    print("=" * 70)
+    print()
+
+    try:
+        test_mapping()
+        test_transliteration()
+        test_stream()
+        test_decode()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
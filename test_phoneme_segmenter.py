@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for the trie-based phoneme segmenter.
+Verifies longest-match segmentation against the syllable inventory.
+"""
+
+import sys
+import unicodedata
+
+from lexicon import get_lexicon
+from phoneme_segmenter import PhonemeSegmenter, get_segmenter
+
+
+def test_syllable_inventory():
+    """Test that every syllable segments into its recorded phonemes."""
+    print("Testing syllable inventory...")
+
+    segmenter = get_segmenter()
+    syllables = get_lexicon().syllables
+
+    for syllable in syllables:
+        phonemes = list(segmenter.segment(syllable['plain_name']))
+        assert phonemes == syllable['phonemes'], \
+            f"{syllable['id']}: expected {syllable['phonemes']}, got {phonemes}"
+    print(f"  ✓ All {len(syllables)} syllables segment to their phonemes")
+
+    print()
+
+
+def test_longest_match():
+    """Test digraphs, syllabic nasals and multi-syllable words."""
+    print("Testing longest match...")
+
+    segmenter = get_segmenter()
+
+    assert segmenter.segment('gbá') == ('gb', 'á'), "gb should win over g + b"
+    assert segmenter.segment('ịkpọ́') == ('ị', 'kp', 'ọ́'), "Tone marks should stay on their vowel"
+    assert segmenter.segment('nwa') == ('nw', 'a'), "nw should be one phoneme"
+    assert segmenter.segment('shị') == ('sh', 'ị'), "sh should be one phoneme"
+    print("  ✓ Digraphs and toned vowels segmented")
+
+    assert segmenter.segment('m̩ma') == ('m̩', 'm', 'a'), "Syllabic nasal should be one phoneme"
+    assert segmenter.segment('ẹ́bá') == ('ẹ́', 'b', 'á'), "Dotted vowel with tone should be one phoneme"
+    print("  ✓ Syllabic nasals and dotted vowels segmented")
+
+    decomposed = unicodedata.normalize('NFD', 'ịkpọ́')
+    assert segmenter.segment(decomposed) == ('ị', 'kp', 'ọ́'), "NFD input should give NFC phonemes"
+    print("  ✓ Decomposed input normalized")
+
+    assert segmenter.segment('ma-ba') == ('m', 'a', '-', 'b', 'a'), "Unknown characters should pass through"
+    print("  ✓ Characters outside the inventory kept as their own segments")
+
+    print()
+
+
+def test_batch_api():
+    """Test that the batch and streaming APIs agree with segment()."""
+    print("Testing batch API...")
+
+    segmenter = PhonemeSegmenter(['b', 'gb', 'g', 'm'], ['a', 'ị'])
+    words = ['gbabịa', 'mma', 'gbabịa']
+
+    expected = [segmenter.segment(word) for word in words]
+    assert segmenter.segment_many(words) == expected, "segment_many should match segment"
+    assert list(segmenter.iter_segments(iter(words))) == expected, "iter_segments should match segment"
+    assert expected[0] == ('gb', 'a', 'b', 'ị', 'a'), f"Unexpected segmentation: {expected[0]}"
+    print("  ✓ segment_many and iter_segments match segment")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Phoneme Segmenter")
+    print("=" * 70)
+    print()
+
+    try:
+        test_syllable_inventory()
+        test_longest_match()
+        test_batch_api()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
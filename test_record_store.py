@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for the array-backed record store.
+Verifies that stored rows read back as the original JSON entries.
+"""
+
+import sys
+
+from lexicon import COLLECTION_FILES, DEFAULT_LANGUAGE_DATA_DIR, get_lexicon, load_json
+from record_store import KIND_ENUM, RecordStore, traced_size
+
+
+def test_round_trip():
+    """Test that every record equals its source entry."""
+    print("Testing round trip...")
+
+    for name, entries in get_lexicon().collections.items():
+        store = RecordStore(entries)
+        assert len(store) == len(entries), f"{name}: row count mismatch"
+        for entry, record in zip(entries, store):
+            assert record == entry, f"{name}: {record!r} != {entry!r}"
+            assert record.to_dict() == entry, f"{name}: to_dict differs"
+        print(f"  ✓ {name}: {len(store)} records match")
+
+    store = RecordStore([{'id': 'a', 'phonemes': [], 'flag': True}, {'id': 'b', 'extra': 'x'}])
+    assert store[0]['phonemes'] == [] and store[0]['flag'] is True
+    assert 'extra' not in store[0] and store[1].get('flag') is None, "Missing fields should stay missing"
+    assert store[-1]['extra'] == 'x'
+    print("  ✓ Empty lists, bools and missing fields")
+
+    print()
+
+
+def test_columns():
+    """Test the enum columns and lookups."""
+    print("Testing columns and lookups...")
+
+    entries = get_lexicon().collections['syllables']
+    store = RecordStore(entries)
+    for field in ('tone', 'vowelGroup'):
+        assert store.kinds[field] == KIND_ENUM, f"{field} should be an enum column"
+        assert store.columns[field].typecode == 'B', f"{field} should use one byte per row"
+    assert store.columns['id'].typecode == 'H', "Ids should use two-byte string indexes"
+    print("  ✓ tone and vowelGroup stored as byte codes")
+
+    assert store.get('syl_ma_001')['plain_name'] == 'má'
+    assert store.get('syl_zz_999') is None
+    assert all(store.get(e['id']) == e for e in entries[::37]), "Id lookup mismatch"
+    small = RecordStore([{'id': 'a', 'x': '1'}, {'id': 'b', 'x': '2'}])
+    assert small.get('a') == {'id': 'a', 'x': '1'} and small.get('c') is None, "Small stores should look up ids"
+    print("  ✓ Lookup by id")
+
+    low = store.find('tone', 'low')
+    assert [r['id'] for r in low] == [e['id'] for e in entries if e['tone'] == 'low']
+    assert store.find('plain_name', 'mà')[0]['id'] == 'syl_ma_003'
+    assert store.find('tone', 'rising') == []
+    print(f"  ✓ find: {len(low)} low-tone syllables")
+
+    print()
+
+
+def test_memory():
+    """Test that the store takes less memory than the dict entries."""
+    print("Testing memory...")
+
+    json_file = DEFAULT_LANGUAGE_DATA_DIR / COLLECTION_FILES['infinitives']
+    entries, dict_bytes = traced_size(lambda: load_json(json_file))
+    store, store_bytes = traced_size(lambda: RecordStore.from_file(json_file))
+    assert store.get(entries[0]['id']) == entries[0]
+    assert store_bytes * 2 < dict_bytes, f"Store {store_bytes} bytes vs dicts {dict_bytes} bytes"
+    print(f"  ✓ {dict_bytes} bytes as dicts, {store_bytes} bytes as a store")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Record Store")
+    print("=" * 70)
+    print()
+
+    try:
+        test_round_trip()
+        test_columns()
+        test_memory()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for sharded collections.
+Verifies that shards partition the collections and load independently.
+"""
+
+import hashlib
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from generate_verb_roots import update_shards
+from lexicon import DEFAULT_LANGUAGE_DATA_DIR, get_lexicon
+from shards import ShardSet, shard_file_stem
+
+
+_shard_dir = None
+
+
+def get_shard_set():
+    """Return a fresh ShardSet over shards cut (once) into a temporary directory."""
+    global _shard_dir
+    if _shard_dir is None:
+        _shard_dir = tempfile.TemporaryDirectory()
+        update_shards(DEFAULT_LANGUAGE_DATA_DIR, Path(_shard_dir.name))
+        print()
+    return ShardSet(_shard_dir.name)
+
+
+def test_partition():
+    """Test that each collection's shards hold exactly its entries."""
+    print("Testing shard partition...")
+
+    shard_set = get_shard_set()
+
+    lexicon = get_lexicon()
+    for name, entries in lexicon.collections.items():
+        sharded = shard_set.load(name)
+        assert sorted(e['id'] for e in sharded) == sorted(e['id'] for e in entries), f"{name}: entries differ"
+        record = shard_set.manifest['collections'][name]
+        assert record['count'] == len(entries), f"{name}: manifest count mismatch"
+        assert shard_set.is_current(name), f"{name}: shards should match the JSON file"
+        print(f"  ✓ {name}: {len(entries)} entries in {len(record['shards'])} shards")
+
+    for shard in shard_set.manifest['collections']['infinitives']['shards']:
+        data = (shard_set.shard_dir / shard['file']).read_bytes()
+        assert len(data) == shard['bytes'], f"{shard['file']}: size mismatch"
+        assert hashlib.sha256(data).hexdigest() == shard['sha256'], f"{shard['file']}: hash mismatch"
+    print("  ✓ Manifest sizes and hashes match the shard files")
+
+    print()
+
+
+def test_partial_loading():
+    """Test that a query only reads the shards it needs."""
+    print("Testing partial loading...")
+
+    shard_set = get_shard_set()
+
+    infinitives = shard_set.load('infinitives', consonants=['gb'], vowel_groups=['A'])
+    assert {i['base_root'][:2] for i in infinitives} == {'gb'}, "gb shard holds other roots"
+    assert {i['vowelGroup'] for i in infinitives} == {'A'}, "A shard holds other vowel groups"
+    assert len(infinitives) == 15, f"Expected 15 gb- A-group infinitives, got {len(infinitives)}"
+    assert list(shard_set._loaded) == ['infinitives/gb-A.json'], f"Read more than needed: {list(shard_set._loaded)}"
+    print("  ✓ gb- A-group infinitives read from one shard")
+
+    g_roots = shard_set.load('syllables', consonants=['g'])
+    assert not any(r['plain_name'].startswith('gb') for r in g_roots), "g shard should not hold gb roots"
+    assert len(shard_set.load('syllables', consonants=['m̩'])) == 27, "Syllabic nasal shard missing"
+    print("  ✓ Digraphs and syllabic nasals keyed as single consonants")
+
+    lexicon = shard_set.lexicon(vowel_groups=['E'], collections=['syllables', 'infinitives'])
+    assert [i['infinitive_form'] for i in lexicon.lookup('infinitives', 'base_root', 'bé')] == ['ibé']
+    assert lexicon.lookup('infinitives', 'base_root', 'bá') == [], "A-group entries should not be loaded"
+    print("  ✓ Lexicon built over a subset of shards")
+
+    assert shard_file_stem('ṅ', 'A') == '_1e45-A', "Non-ASCII letters should be spelled as code points"
+
+    print()
+
+
+def test_hand_edits():
+    """Test that shards are cut from the JSON files as they are, touching nothing else."""
+    print("Testing shards of edited files...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        language_data_dir = Path(tmp_dir) / 'language-data'
+        shutil.copytree(DEFAULT_LANGUAGE_DATA_DIR, language_data_dir)
+        syllables_file = language_data_dir / 'syllables.json'
+        syllables = json.loads(syllables_file.read_text(encoding='utf-8'))
+        syllables[0]['gloss'] = 'hand-edited'
+        syllables_file.write_text(json.dumps(syllables, ensure_ascii=False, indent=2), encoding='utf-8')
+        untouched = {
+            name: (language_data_dir / name).read_bytes()
+            for name in ('syllable-id-ledger.json', 'ndebe-mapping.json')
+        }
+
+        update_shards(language_data_dir, Path(tmp_dir) / 'shards')
+        shard_set = ShardSet(Path(tmp_dir) / 'shards')
+        [edited] = [s for s in shard_set.load('syllables') if s['id'] == syllables[0]['id']]
+        assert edited['gloss'] == 'hand-edited', "Shards should hold the entries of the JSON file"
+        assert all((language_data_dir / name).read_bytes() == data for name, data in untouched.items()), \
+            "Sharding should not rewrite the id ledger or the Ndebe mapping"
+    print("  ✓ Hand edits sharded; id ledger and Ndebe mapping untouched")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Shards")
+    print("=" * 70)
+    print()
+
+    try:
+        test_partition()
+        test_partial_loading()
+        test_hand_edits()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
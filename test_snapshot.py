@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test script for compiled lexicon snapshots.
+Verifies that snapshots round-trip the JSON collections exactly.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from lexicon import get_lexicon
+from snapshot import Snapshot, write_snapshot
+from tone_engine import fold_diacritics, fold_rank
+
+
+def test_round_trip():
+    """Test that every collection decodes back to its JSON entries."""
+    print("Testing snapshot round trip...")
+
+    lexicon = get_lexicon()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, entries in lexicon.collections.items():
+            snap_file = Path(tmp_dir) / f"{name}.snap"
+            write_snapshot(entries, snap_file)
+
+            with Snapshot(snap_file) as snap:
+                assert len(snap) == len(entries), f"{name}: record count mismatch"
+                assert list(snap) == entries, f"{name}: decoded records differ from JSON"
+                assert snap[-1] == entries[-1], f"{name}: negative indexing broken"
+            print(f"  ✓ {name} ({len(entries)} records)")
+
+    print()
+
+
+def test_id_lookup():
+    """Test binary-search lookups through the id index."""
+    print("Testing id lookup...")
+
+    entries = [
+        {'id': 'b', 'plain_name': 'bá', 'phonemes': ['b', 'á'], 'generated': True},
+        {'id': 'a', 'plain_name': 'a', 'phonemes': []},
+        {'id': 'c', 'plain_name': 'ch', 'generated': False},
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snap_file = Path(tmp_dir) / 'sample.snap'
+        write_snapshot(entries, snap_file)
+
+        with Snapshot(snap_file) as snap:
+            assert snap.get('b') == entries[0], "Lookup of 'b' failed"
+            assert snap.get('a') == entries[1], "Empty lists should round-trip"
+            assert snap.get('c') == entries[2], "Missing fields should stay missing"
+            assert snap.get('z') is None, "Unknown id should return None"
+            assert snap.find('id', 'a') == [entries[1]]
+    print("  ✓ Lookups by id, missing fields and empty lists")
+
+    print()
+
+
+def test_derived_index():
+    """Test that derived indexes return candidates in rank order."""
+    print("Testing derived index...")
+
+    entries = get_lexicon().syllables
+
+    def folded(entry):
+        return fold_diacritics(entry['plain_name']), fold_rank(entry['plain_name'])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snap_file = Path(tmp_dir) / 'syllables.snap'
+        write_snapshot(entries, snap_file, derived_indexes={'folded': folded})
+
+        with Snapshot(snap_file) as snap:
+            assert 'folded' in snap.index_fields, "Derived index missing"
+            forms = [r['plain_name'] for r in snap.find('folded', 'be')]
+            assert forms == ['bé', 'be', 'bè', 'bẹ́', 'bẹ', 'bẹ̀'], f"Unexpected order: {forms}"
+            assert list(snap) == entries, "Derived indexes should not change the records"
+    print("  ✓ Folded lookups ranked by tone pattern")
+
+    print()
+
+
+def test_rejects_other_files():
+    """Test that non-snapshot files are rejected."""
+    print("Testing invalid input...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bad_file = Path(tmp_dir) / 'bad.snap'
+        bad_file.write_bytes(b'[]' * 40)
+        try:
+            Snapshot(bad_file)
+        except ValueError:
+            print("  ✓ Non-snapshot file rejected")
+        else:
+            raise AssertionError("Expected ValueError for a non-snapshot file")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Lexicon Snapshots")
+    print("=" * 70)
+    print()
+
+    try:
+        test_round_trip()
+        test_id_lookup()
+        test_derived_index()
+        test_rejects_other_files()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the tone engine.
+Verifies tone marking and stripping independent of normalization form.
+"""
+
+import sys
+import unicodedata
+
+from lexicon import get_lexicon
+from tone_engine import (
+    TONE_TABLE, TONED_VOWELS, apply_tone, apply_tones, fold_diacritics, fold_rank,
+    main_vowel, strip_tone, strip_tones, tone_pattern
+)
+
+
+def nfd(text):
+    return unicodedata.normalize('NFD', text)
+
+
+def test_tables():
+    """Test that the table and its inverse agree in both normalization forms."""
+    print("Testing tone tables...")
+
+    assert TONE_TABLE[('ẹ', 'high')] == 'ẹ́', "ẹ high should be ẹ́"
+    assert TONE_TABLE[(nfd('ẹ'), 'high')] == 'ẹ́', "NFD key should give the same NFC result"
+    assert TONE_TABLE[('a', 'mid')] == 'a', "Mid tone should be unmarked"
+    print("  ✓ (vowel, tone) table keyed by NFC and NFD")
+
+    for (base, tone), toned in TONE_TABLE.items():
+        assert unicodedata.is_normalized('NFC', toned), f"{toned!r} is not NFC"
+        assert TONED_VOWELS[toned][1] == tone, f"Inverse tone mismatch for {toned!r}"
+        assert TONED_VOWELS[nfd(toned)] == TONED_VOWELS[toned], f"NFD inverse mismatch for {toned!r}"
+    print("  ✓ Inverse table round-trips every entry")
+
+    print()
+
+
+def test_syllable_inventory():
+    """Test that applying each syllable's tone reproduces its plain_name."""
+    print("Testing syllable inventory...")
+
+    syllables = get_lexicon().syllables
+    words = [s['syllable_group'] for s in syllables]
+    tones = [s['tone'] for s in syllables]
+
+    assert apply_tones(words, tones) == [s['plain_name'] for s in syllables], "apply_tones mismatch"
+    assert strip_tones(s['plain_name'] for s in syllables) == words, "strip_tones mismatch"
+    assert all(main_vowel(s['plain_name']) == s['main_vowel'] for s in syllables), "main_vowel mismatch"
+    print(f"  ✓ {len(syllables)} syllables toned and stripped")
+
+    print()
+
+
+def test_normalization_forms():
+    """Test that NFC and NFD input give identical results."""
+    print("Testing normalization forms...")
+
+    for word in ['ẹ́bà', 'ị̀kpọ́', 'ụ́mụ̀', 'gbá']:
+        assert apply_tone(nfd(word), ('low', 'high')) == apply_tone(word, ('low', 'high')), word
+        assert strip_tone(nfd(word)) == strip_tone(word), word
+        assert tone_pattern(nfd(word)) == tone_pattern(word), word
+    print("  ✓ Decomposed input gives the same NFC output")
+
+    assert apply_tone('ịkpọ', ('mid', 'high')) == 'ịkpọ́', "Pattern should tone successive vowels"
+    assert apply_tone('ẹ́bá', 'low') == 'ẹ̀bá', "Existing tone on the main vowel should be replaced"
+    assert tone_pattern('ẹ̄bà') == ('mid', 'low'), "Macron should read as mid"
+    assert strip_tone('ṅ́') == 'ṅ', "Dots should survive stripping"
+    assert apply_tone('m̩', 'high') == 'm̩', "Words without vowels are unchanged"
+    print("  ✓ Multi-vowel patterns, retoning and stripping")
+
+    assert fold_diacritics('Ị̀bẹ́') == 'ibe', "Folding should drop tones, dots and case"
+    assert fold_diacritics(nfd('ṅ́ma')) == 'nma', "Folding should accept NFD input"
+    assert fold_rank('ibé') < fold_rank('ibè') < fold_rank('ịbẹ́'), "Undotted forms should rank first"
+    print("  ✓ Diacritic folding and ranking")
+
+    try:
+        apply_tone('ma', 'rising')
+        raise AssertionError("Unknown tones should raise ValueError")
+    except ValueError:
+        pass
+    print("  ✓ Unknown tones rejected")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Tone Engine")
+    print("=" * 70)
+    print()
+
+    try:
+        test_tables()
+        test_syllable_inventory()
+        test_normalization_forms()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Test script for validate.py.
+Verifies per-file validation and cross-file reference checking on
+small temporary language-data trees.
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from validate import check_references, find_duplicate_ids, parse_json_with_offsets, validate_file
+
+
+def write_tree(root, files):
+    """Write {relative path: data} as JSON files under root."""
+    for rel_path, data in files.items():
+        file_path = root / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+
+def validate_tree(root):
+    """Run validate_file over every JSON file in sorted order."""
+    return [validate_file(f, root) for f in sorted(root.rglob('*.json'))]
+
+
+def collect_ids(results):
+    """Build the global id index the way validate.main does."""
+    all_ids = {}
+    for result in results:
+        for entry_id, index, offset in result['ids']:
+            all_ids.setdefault(entry_id, []).append((result['path'], index, offset))
+    return all_ids
+
+
+def test_reference_integrity():
+    """Test that references resolve across files and dangling ones are reported."""
+    print("Testing reference integrity...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        write_tree(root, {
+            'language-data/syllables.json': [
+                {'id': 'syl_ma_001', 'plain_name': 'má', 'tone': 'high', 'phonemes': ['m', 'á']},
+            ],
+            'language-data/verbs/prefixes/a.json': {'id': 'prefix_a', 'name': 'a', 'syllable_id': 'syl_ma_001'},
+            'language-data/verbs/suffixes/ro.json': {'id': 'suffix_rọ', 'name': 'rọ'},
+            'language-data/verbs/verb-forms/ma.json': {
+                'id': 'ma_form',
+                'primeRoot': 'syl_ma_001',
+                'prefix': 'prefix_a',
+                'suffixes': ['suffix_rọ', 'suffix_missing'],
+            },
+            'language-data/verbs/generated-infinitives.json': [
+                {'id': 'ịmá_infinitive', 'base_root': 'má', 'prefix': 'ị', 'syllable_id': 'syl_ma_001'},
+                {'id': 'ịmà_infinitive', 'base_root': 'mà', 'prefix': 'ị', 'syllable_id': 'syl_ma_003'},
+            ],
+        })
+
+        results = validate_tree(root)
+        checked, dangling = check_references(results, collect_ids(results))
+
+    assert checked == 9, f"Expected 9 references, got {checked}"
+    assert dict(dangling) == {
+        ('language-data/verbs/verb-forms/ma.json', 'suffixes'): ['suffix_missing'],
+        ('language-data/verbs/generated-infinitives.json', 'base_root'): ['mà'],
+        ('language-data/verbs/generated-infinitives.json', 'syllable_id'): ['syl_ma_003'],
+    }, f"Unexpected dangling references: {dict(dangling)}"
+    print("  ✓ IDs resolve across files")
+    print("  ✓ base_root resolves against syllable plain names")
+    print("  ✓ Generated prefix surface forms are not treated as references")
+    print("  ✓ Dangling references reported per file and field")
+
+    print()
+
+
+def test_duplicate_ids():
+    """Test duplicate detection with array indexes and byte offsets."""
+    print("Testing duplicate IDs...")
+
+    text = '[\n  {"id": "bá"},\n  {"id": "ba"},\n  {"id": "bá"}\n]'
+    data, offsets = parse_json_with_offsets(text)
+    assert data == [{'id': 'bá'}, {'id': 'ba'}, {'id': 'bá'}], "Offset parser changed the data"
+
+    # Offsets are UTF-8 byte positions, so 'á' counts as two bytes
+    encoded = text.encode('utf-8')
+    for offset in offsets:
+        assert encoded[offset:offset + 1] == b'{', f"Offset {offset} does not point at an element"
+    print(f"  ✓ Element byte offsets: {offsets}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        dup_file = root / 'language-data' / 'dups.json'
+        dup_file.parent.mkdir(parents=True)
+        dup_file.write_bytes(encoded)
+
+        result = validate_file(dup_file, root)
+
+    assert not result['valid'], "File with duplicate IDs should not be valid"
+    assert result['errors'] == [
+        f"language-data/dups.json: Duplicate ID 'bá' at "
+        f"language-data/dups.json[0] @ byte {offsets[0]}, language-data/dups.json[2] @ byte {offsets[2]}"
+    ], f"Unexpected errors: {result['errors']}"
+    print("  ✓ Within-file duplicates reported with index and byte offset")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        write_tree(root, {
+            'language-data/syllables.json': [
+                {'id': 'syl_ma_001', 'plain_name': 'má'},
+                {'id': 'syl_ma_001', 'plain_name': 'má'},
+                {'id': 'syl_ma_002', 'plain_name': 'ma'},
+            ],
+            'language-data/verbs/prefixes/a.json': {'id': 'prefix_a', 'syllable_id': 'syl_ma_002'},
+        })
+        results = validate_tree(root)
+        checked, dangling = check_references(results, collect_ids(results))
+
+    assert not results[0]['valid'] and results[0]['path'].endswith('syllables.json'), \
+        "syllables.json has a duplicate ID"
+    assert checked == 1 and not dangling, f"References into a file with duplicates should resolve: {dict(dangling)}"
+    print("  ✓ IDs of a file with duplicates still resolve references")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        crlf_file = root / 'language-data' / 'crlf.json'
+        crlf_file.parent.mkdir(parents=True)
+        crlf_encoded = text.replace('\n', '\r\n').encode('utf-8')
+        crlf_file.write_bytes(crlf_encoded)
+
+        result = validate_file(crlf_file, root)
+
+    crlf_offsets = [int(offset) for offset in re.findall(r'@ byte (\d+)', result['errors'][0])]
+    assert len(crlf_offsets) == 2 and all(crlf_encoded[offset:offset + 1] == b'{' for offset in crlf_offsets), \
+        f"CRLF offsets {crlf_offsets} do not point at elements"
+    print(f"  ✓ Byte offsets exact with CRLF line endings: {crlf_offsets}")
+
+    locations = [('x', 'a.json', 0), ('y', 'a.json', 1), ('x', 'b.json', None)]
+    assert find_duplicate_ids(locations) == {'x': [('x', 'a.json', 0), ('x', 'b.json', None)]}
+    print("  ✓ Duplicates grouped across files in one pass")
+
+    print()
+
+
+def test_invalid_json():
+    """Test that invalid JSON is reported without raising."""
+    print("Testing invalid JSON...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        bad_file = root / 'language-data' / 'bad.json'
+        bad_file.parent.mkdir(parents=True)
+        bad_file.write_text('{"id": ', encoding='utf-8')
+
+        result = validate_file(bad_file, root)
+
+    assert not result['valid'], "Invalid JSON should not count as valid"
+    assert result['errors'] and 'Invalid JSON' in result['errors'][0]
+    print("  ✓ Invalid JSON reported as an error")
+
+    print()
+
+
+def test_jobs():
+    """Test that --jobs does not change the output or the exit code."""
+    print("Testing --jobs...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        shutil.copy(Path(__file__).parent / 'validate.py', root)
+        files = {
+            f'language-data/verbs/suffixes/s{n}.json': {'id': f'suffix_{n}', 'name': f's{n}'}
+            for n in range(8)
+        }
+        files.update({
+            'language-data/verbs/verb-forms/form.json': {'id': 'form', 'suffixes': ['suffix_0', 'suffix_missing']},
+            'language-data/dups.json': [{'id': 'x'}, {'id': 'x'}],
+        })
+        write_tree(root, files)
+        (root / 'language-data' / 'bad.json').write_text('{"id": ', encoding='utf-8')
+
+        runs = {}
+        for jobs in ('1', '3'):
+            for strict in ([], ['--strict-refs']):
+                process = subprocess.run(
+                    [sys.executable, 'validate.py', '--jobs', jobs] + strict,
+                    cwd=root, capture_output=True, text=True, encoding='utf-8'
+                )
+                runs[jobs, bool(strict)] = (process.returncode, process.stdout)
+
+    for strict in (False, True):
+        serial, parallel = runs['1', strict], runs['3', strict]
+        assert serial[0] != 0, "Duplicate ids and invalid JSON should fail validation"
+        assert parallel == serial, f"--jobs 3 differs from --jobs 1 (strict refs: {strict})"
+    assert 'dups.json' in runs['1', False][1] and 'bad.json' in runs['1', False][1]
+    print("  ✓ Same output and exit code with 1 and 3 workers, errors included")
+
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("Testing Validation")
+    print("=" * 70)
+    print()
+
+    try:
+        test_reference_integrity()
+        test_duplicate_ids()
+        test_invalid_json()
+        test_jobs()
+
+        print("=" * 70)
+        print("All tests passed! ✓")
+        print("=" * 70)
+        return 0
+    except AssertionError as e:
+        print()
+        print("=" * 70)
+        print(f"Test failed: {e}")
+        print("=" * 70)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
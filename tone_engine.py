@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Precomputed tone marking for Igbo words.
+
+Tone is written as a combining mark on the vowel: acute for high, grave for
+low, and nothing for mid (a macron is also read as mid). Dotted vowels such
+as ẹ́ are more than one code point even in NFC, so marking and stripping are
+done on a per-word template instead of character lookups:
+
+- the word is decomposed (NFD) once and split at each vowel with its
+  combining marks;
+- each vowel slot keeps its base vowel in NFC and, when a tone is applied,
+  is replaced with the entry from TONE_TABLE;
+- the NFC pieces are joined back together.
+
+Templates and results are cached per word, so repeated input (the usual
+case for bulk generation) costs a dictionary probe. Input may arrive in any
+normalization form; output is always NFC.
+
+Usage:
+    from tone_engine import apply_tone, apply_tones, strip_tones
+
+    apply_tone('ba', 'high')                       # 'bá'
+    apply_tones(['ma', 'ịkpọ'], ['low', ('mid', 'high')])   # ['mà', 'ịkpọ́']
+    strip_tones(['ẹ́bá', 'ị̀kpọ́'])                   # ['ẹba', 'ịkpọ']
+    fold_diacritics('Ị̀bẹ́')                        # 'ibe'
+"""
+
+import re
+import sys
+import unicodedata
+
+
+TONES = ('high', 'mid', 'low')
+
+# Tone -> combining mark written on the vowel
+TONE_MARKS = {
+    'high': '\u0301',
+    'mid': '',
+    'low': '\u0300',
+}
+
+# Combining mark -> tone, for reading tones back (macron is an explicit mid)
+MARK_TONES = {
+    '\u0301': 'high',
+    '\u0304': 'mid',
+    '\u0300': 'low',
+}
+
+# Base vowels (NFC) that carry tone
+BASE_VOWELS = ('a', 'e', 'i', 'o', 'u', 'ẹ', 'ị', 'ọ', 'ụ')
+
+# A vowel letter followed by all of its combining marks, in NFD
+VOWEL_CLUSTER = re.compile('[aeiouAEIOU][\u0300-\u036f]*')
+
+# Deletes tone marks from an NFD string
+STRIP_MARKS = {ord(mark): None for mark in MARK_TONES}
+
+# Deletes every combining mark (tones, dot below, dot above, ...) from an NFD string
+FOLD_MARKS = {code: None for code in range(0x0300, 0x0370)}
+
+# Per-cache size limit; caches are cleared when full
+CACHE_SIZE = 1 << 16
+
+
+def nfc(text):
+    """Return text in NFC."""
+    return unicodedata.normalize('NFC', text)
+
+
+def nfd(text):
+    """Return text in NFD."""
+    return unicodedata.normalize('NFD', text)
+
+
+def build_tone_table(vowels=BASE_VOWELS):
+    """
+    Build the (vowel, tone) -> NFC string table.
+
+    Both the NFC and NFD spelling of each vowel (and its upper case) are
+    keys, so lookups don't depend on how the vowel was normalized.
+    """
+    table = {}
+    for vowel in vowels:
+        for base in (vowel, vowel.upper()):
+            for tone, mark in TONE_MARKS.items():
+                toned = nfc(nfd(base) + mark)
+                table[(nfc(base), tone)] = toned
+                table[(nfd(base), tone)] = toned
+    return table
+
+
+def build_inverse_table(table):
+    """
+    Build the toned vowel -> (base vowel, tone) table from a tone table.
+
+    Keys are given in both NFC and NFD; an explicit macron is read as mid.
+    """
+    inverse = {}
+    for (base, tone), toned in table.items():
+        base = nfc(base)
+        inverse[toned] = (base, tone)
+        inverse[nfd(toned)] = (base, tone)
+        if tone == 'mid':
+            macron = nfc(nfd(base) + '\u0304')
+            inverse[macron] = (base, 'mid')
+            inverse[nfd(macron)] = (base, 'mid')
+    return inverse
+
+
+TONE_TABLE = build_tone_table()
+TONED_VOWELS = build_inverse_table(TONE_TABLE)
+
+_templates = {}
+_applied = {}
+_stripped = {}
+_folded = {}
+
+
+def word_template(word):
+    """
+    Split a word into NFC pieces with its vowel slots marked.
+
+    Returns: (parts, slots) where parts is a list of NFC strings that join
+    back into the word, and slots is a tuple of (part index, base vowel)
+    pairs for each vowel in order.
+    """
+    template = _templates.get(word)
+    if template is not None:
+        return template
+
+    decomposed = nfd(word)
+    parts = []
+    slots = []
+    position = 0
+    for match in VOWEL_CLUSTER.finditer(decomposed):
+        if match.start() > position:
+            parts.append(nfc(decomposed[position:match.start()]))
+        cluster = match.group()
+        slots.append((len(parts), nfc(cluster.translate(STRIP_MARKS))))
+        parts.append(nfc(cluster))
+        position = match.end()
+    if position < len(decomposed):
+        parts.append(nfc(decomposed[position:]))
+
+    if len(_templates) >= CACHE_SIZE:
+        _templates.clear()
+    template = _templates[word] = (parts, tuple(slots))
+    return template
+
+
+def apply_tone(word, pattern):
+    """
+    Mark tones on the vowels of a word.
+
+    pattern is a tone name, applied to the main (first) vowel, or a sequence
+    of tone names applied to successive vowels; vowels past the end of the
+    pattern keep whatever tone they had. A word without vowels is returned
+    unchanged (in NFC).
+    """
+    if isinstance(pattern, str):
+        pattern = (pattern,)
+    else:
+        pattern = tuple(pattern)
+
+    key = (word, pattern)
+    result = _applied.get(key)
+    if result is not None:
+        return result
+
+    parts, slots = word_template(word)
+    parts = list(parts)
+    for (index, base), tone in zip(slots, pattern):
+        toned = TONE_TABLE.get((base, tone))
+        if toned is None:
+            if tone not in TONE_MARKS:
+                raise ValueError(f"Unknown tone '{tone}' (expected one of {', '.join(TONES)})")
+            # Vowel with extra diacritics outside the table
+            toned = nfc(nfd(base) + TONE_MARKS[tone])
+        parts[index] = toned
+    result = ''.join(parts)
+
+    if len(_applied) >= CACHE_SIZE:
+        _applied.clear()
+    _applied[key] = result
+    return result
+
+
+def apply_tones(words, patterns):
+    """Apply a tone pattern to each word (see apply_tone), returning a list."""
+    return [apply_tone(word, pattern) for word, pattern in zip(words, patterns)]
+
+
+def strip_tone(word):
+    """Remove tone marks from a word, keeping dots and other diacritics."""
+    result = _stripped.get(word)
+    if result is not None:
+        return result
+
+    if word.isascii():
+        result = word
+    else:
+        result = nfc(nfd(word).translate(STRIP_MARKS))
+
+    if len(_stripped) >= CACHE_SIZE:
+        _stripped.clear()
+    _stripped[word] = result
+    return result
+
+
+def strip_tones(words):
+    """Remove tone marks from each word, returning a list."""
+    return [strip_tone(word) for word in words]
+
+
+def fold_diacritics(word):
+    """
+    Return the search key of a word: lower case with every diacritic removed.
+
+    'ịbẹ́', 'ibe' and 'IBE' all fold to 'ibe'.
+    """
+    result = _folded.get(word)
+    if result is not None:
+        return result
+
+    if word.isascii():
+        result = word.lower()
+    else:
+        result = nfd(word).translate(FOLD_MARKS).lower()
+
+    if len(_folded) >= CACHE_SIZE:
+        _folded.clear()
+    _folded[word] = result
+    return result
+
+
+def fold_rank(word):
+    """
+    Return how a word ranks among the words sharing its folded key.
+
+    Words with fewer non-tone diacritics (dots) come first, then words by
+    tone pattern, each vowel ordered high, mid, low.
+    """
+    dots = len(nfd(word).translate(STRIP_MARKS)) - len(fold_diacritics(word))
+    return (dots, tuple(TONES.index(tone) for tone in tone_pattern(word)))
+
+
+def main_vowel(word):
+    """Return the main (first) vowel of a word without its tone, or None."""
+    slots = word_template(word)[1]
+    return slots[0][1] if slots else None
+
+
+def tone_pattern(word):
+    """Return the tone of each vowel in a word; unmarked vowels are mid."""
+    parts, slots = word_template(word)
+    return tuple(TONED_VOWELS.get(parts[index], (base, 'mid'))[1] for index, base in slots)
+
+
+def main():
+    """Print the tone pattern of each word read from stdin."""
+    for line in sys.stdin:
+        for word in line.split():
+            print(f"{strip_tone(word)}\t{'-'.join(tone_pattern(word))}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
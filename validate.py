@@ -5,12 +5,26 @@ Validation script for Igbo language data repository.
 This script validates:
 1. JSON syntax in all data files
 2. Required schema fields
-3. ID uniqueness within files
+3. ID uniqueness within and across files
 4. Reference integrity (IDs that reference other IDs)
+
+Each file is parsed once. Files can be validated in parallel with
+--jobs N; results are merged in sorted file order, so the report is the
+same for any number of jobs.
+
+Files are parsed here rather than through lexicon.Lexicon: a Lexicon
+cannot load the malformed files this script has to report (with byte
+offsets), and reference checks already resolve against hash sets built
+from the same single parse.
 """
 
+import argparse
 import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from collections import defaultdict
 
@@ -20,30 +34,126 @@ RED = '\033[91m'
 YELLOW = '\033[93m'
 RESET = '\033[0m'
 
-def validate_json_syntax(file_path):
-    """Validate that a file contains valid JSON."""
+# Files whose parsed contents the phoneme count check reuses
+PHONEME_FILES = ('consonants.json', 'vowels.json')
+
+# Whitespace allowed between JSON tokens
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def parse_json_with_offsets(text):
+    """
+    Parse JSON text, recording where each top-level array element starts.
+    
+    Array elements are decoded one at a time with raw_decode, which is
+    still a single pass over the text. For any other top-level value the
+    offsets are None.
+    
+    Returns: (data, byte_offsets)
+    """
+    idx = JSON_WHITESPACE.match(text, 0).end()
+    if not text.startswith('[', idx):
+        return json.loads(text), None
+    
+    decoder = json.JSONDecoder()
+    items = []
+    char_offsets = []
+    idx = JSON_WHITESPACE.match(text, idx + 1).end()
+    
+    if text.startswith(']', idx):
+        end = idx + 1
+    else:
+        while True:
+            item, end = decoder.raw_decode(text, idx)
+            items.append(item)
+            char_offsets.append(idx)
+            idx = JSON_WHITESPACE.match(text, end).end()
+            if text.startswith(',', idx):
+                idx = JSON_WHITESPACE.match(text, idx + 1).end()
+            elif text.startswith(']', idx):
+                end = idx + 1
+                break
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+    
+    end = JSON_WHITESPACE.match(text, end).end()
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    
+    # Convert character offsets to UTF-8 byte offsets incrementally
+    byte_offsets = []
+    char_pos = byte_pos = 0
+    for offset in char_offsets:
+        byte_pos += len(text[char_pos:offset].encode('utf-8'))
+        char_pos = offset
+        byte_offsets.append(byte_pos)
+    
+    return items, byte_offsets
+
+def load_json_file(file_path, with_offsets=False):
+    """
+    Parse a JSON file once.
+    
+    Returns: (data, error) where error is None if the file is valid JSON,
+    or (data, offsets, error) with the byte offset of each top-level array
+    element when with_offsets is True
+    """
+    data = offsets = None
+    error = None
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            json.load(f)
-        return True, None
+        # Read bytes so CRLF line endings are kept and byte offsets stay exact
+        with open(file_path, 'rb') as f:
+            data, offsets = parse_json_with_offsets(f.read().decode('utf-8'))
     except json.JSONDecodeError as e:
-        return False, str(e)
+        error = str(e)
     except Exception as e:
-        return False, f"Error reading file: {str(e)}"
+        error = f"Error reading file: {str(e)}"
+    
+    if with_offsets:
+        return data, offsets, error
+    return data, error
 
-def check_duplicate_ids(data, file_path):
-    """Check for duplicate IDs in a JSON file."""
-    ids = []
+def validate_json_syntax(file_path):
+    """Validate that a file contains valid JSON."""
+    _, error = load_json_file(file_path)
+    return error is None, error
+
+def id_locations(data, offsets=None):
+    """
+    Return (id, index, byte_offset) for every top-level ID in a file.
     
+    index and byte_offset are None for a file holding a single object.
+    """
     if isinstance(data, list):
-        ids = [item.get('id') for item in data if isinstance(item, dict) and 'id' in item]
-    elif isinstance(data, dict) and 'id' in data:
-        ids = [data['id']]
-    
-    duplicates = [id for id in ids if ids.count(id) > 1]
-    unique_duplicates = list(set(duplicates))
+        return [
+            (item['id'], index, offsets[index] if offsets else None)
+            for index, item in enumerate(data)
+            if isinstance(item, dict) and 'id' in item
+        ]
+    if isinstance(data, dict) and 'id' in data:
+        return [(data['id'], None, None)]
+    return []
+
+def find_duplicate_ids(locations):
+    """
+    Group (id, ...) location tuples by ID in one pass.
     
-    return unique_duplicates
+    Returns: {id: [location, ...]} for every ID that occurs more than once,
+    in order of first occurrence
+    """
+    by_id = {}
+    for location in locations:
+        by_id.setdefault(location[0], []).append(location)
+    return {entry_id: locs for entry_id, locs in by_id.items() if len(locs) > 1}
+
+def check_duplicate_ids(data, file_path):
+    """Check for duplicate IDs in a JSON file."""
+    return list(find_duplicate_ids(id_locations(data)))
+
+def format_location(path, index, byte_offset):
+    """Format where an ID occurs, e.g. 'syllables.json[3] @ byte 120'."""
+    if index is None:
+        return str(path)
+    return f"{path}[{index}] @ byte {byte_offset}"
 
 def validate_syllable_schema(item):
     """Validate syllable schema."""
@@ -97,7 +207,76 @@ def validate_suffix_schema(item):
     required = ['id', 'name']
     return all(field in item for field in required)
 
-def validate_phoneme_counts(repo_root):
+# Reference fields by data category: (path match, [(field, namespace)]).
+# A path match ending in '-' matches file name prefixes, anything else a
+# directory name. Namespace 'id' resolves against every top-level ID in the
+# tree, 'plain_name' against syllable plain names in syllables.json.
+REFERENCE_RULES = [
+    ('verb-forms', [
+        ('primeRoot', 'id'), ('auxiliary', 'id'), ('prefix', 'id'),
+        ('suffixes', 'id'), ('particles', 'id')
+    ]),
+    ('derived-roots', [('primeRootIds', 'id')]),
+    ('prefixes', [('syllable_id', 'id')]),
+    ('prime-roots', [('syllable_id', 'id')]),
+    ('generated-', [
+        ('syllable_id', 'id'), ('dialectal_syllable_id', 'id'), ('base_root', 'plain_name')
+    ]),
+]
+
+def reference_fields(json_file):
+    """Return the (field, namespace) pairs that hold references in a file."""
+    for match, fields in REFERENCE_RULES:
+        if match.endswith('-'):
+            if json_file.name.startswith(match):
+                return fields
+        elif match in json_file.parts:
+            return fields
+    return []
+
+def extract_references(data, fields):
+    """Yield (field, namespace, target) for every reference in a file's entries."""
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for field, namespace in fields:
+            value = item.get(field)
+            if isinstance(value, str):
+                yield field, namespace, value
+            elif isinstance(value, list):
+                for target in value:
+                    if isinstance(target, str):
+                        yield field, namespace, target
+
+def check_references(results, all_ids):
+    """
+    Resolve every collected reference against the global indexes.
+    
+    Runs in a single pass over the references with hash lookups, so it is
+    linear in the size of the tree.
+    
+    Returns: (checked_count, dangling) where dangling maps
+    (path, field) to the list of unresolved targets in file order
+    """
+    namespaces = {
+        'id': all_ids,
+        'plain_name': set()
+    }
+    for result in results:
+        namespaces['plain_name'].update(result['plain_names'])
+    
+    checked = 0
+    dangling = defaultdict(list)
+    for result in results:
+        for field, namespace, target in result['references']:
+            checked += 1
+            if target not in namespaces[namespace]:
+                dangling[(result['path'], field)].append(target)
+    
+    return checked, dangling
+
+def validate_phoneme_counts(repo_root, consonants_data=None, vowels_data=None):
     """
     Validate and report phoneme counts in the repository.
     
@@ -137,10 +316,11 @@ def validate_phoneme_counts(repo_root):
     
     # Load and count consonants
     consonants_file = repo_root / 'language-data' / 'consonants.json'
-    if consonants_file.exists():
+    if consonants_data is not None or consonants_file.exists():
         try:
-            with open(consonants_file, 'r', encoding='utf-8') as f:
-                consonants_data = json.load(f)
+            if consonants_data is None:
+                with open(consonants_file, 'r', encoding='utf-8') as f:
+                    consonants_data = json.load(f)
             
             if 'consonants' in consonants_data:
                 for c in consonants_data['consonants']:
@@ -168,10 +348,11 @@ def validate_phoneme_counts(repo_root):
     
     # Load and count vowels
     vowels_file = repo_root / 'language-data' / 'vowels.json'
-    if vowels_file.exists():
+    if vowels_data is not None or vowels_file.exists():
         try:
-            with open(vowels_file, 'r', encoding='utf-8') as f:
-                vowels_data = json.load(f)
+            if vowels_data is None:
+                with open(vowels_file, 'r', encoding='utf-8') as f:
+                    vowels_data = json.load(f)
             
             if 'vowelGroups' in vowels_data:
                 if 'A' in vowels_data['vowelGroups']:
@@ -188,8 +369,131 @@ def validate_phoneme_counts(repo_root):
     success = len(errors) == 0
     return success, counts, errors
 
-def main():
+def validate_file(json_file, repo_root):
+    """
+    Validate a single JSON file, parsing it exactly once.
+    
+    Runs in a worker process under --jobs, so it only returns plain data:
+        path:   file path relative to repo_root
+        valid:  True if the file passed (counts towards "Valid files")
+        line:   status line to print, or None
+        errors: error messages
+        ids:    (id, index, byte_offset) for each top-level ID in the file
+        plain_names: syllable plain names (syllables.json only)
+        references: (field, namespace, target) references to other entries
+        data:   parsed contents for PHONEME_FILES, otherwise None
+    """
+    rel_path = json_file.relative_to(repo_root)
+    result = {
+        'path': str(rel_path),
+        'valid': False,
+        'line': None,
+        'errors': [],
+        'ids': [],
+        'plain_names': [],
+        'references': [],
+        'data': None
+    }
+    errors = result['errors']
+    
+    # 1. Parse and validate JSON syntax
+    data, offsets, error = load_json_file(json_file, with_offsets=True)
+    
+    if error is not None:
+        errors.append(f"{rel_path}: Invalid JSON - {error}")
+        result['line'] = f"{RED}✗{RESET} {rel_path} - Invalid JSON"
+        return result
+    
+    if json_file.name in PHONEME_FILES:
+        result['data'] = data
+    
+    # 2. Collect IDs (with locations) for reference and cross-file checks,
+    # even if the file fails below, so references into it still resolve
+    locations = id_locations(data, offsets)
+    result['ids'] = locations
+    
+    if json_file.name == 'syllables.json' and isinstance(data, list):
+        result['plain_names'] = [
+            item['plain_name'] for item in data
+            if isinstance(item, dict) and 'plain_name' in item
+        ]
+    
+    result['references'] = list(extract_references(data, reference_fields(json_file)))
+    
+    # 3. Check for duplicate IDs
+    duplicates = find_duplicate_ids(locations)
+    if duplicates:
+        for entry_id, locs in duplicates.items():
+            where = ', '.join(format_location(rel_path, index, offset) for _, index, offset in locs)
+            errors.append(f"{rel_path}: Duplicate ID '{entry_id}' at {where}")
+        result['line'] = f"{RED}✗{RESET} {rel_path} - Duplicate IDs: {list(duplicates)}"
+        return result
+    
+    # 4. Schema validation (basic)
+    schema_valid = True
+    
+    # Validate vowels
+    if 'vowels.json' in str(json_file):
+        if not validate_vowels_schema(data):
+            schema_valid = False
+            errors.append(f"{rel_path}: Invalid vowels schema")
+    
+    # Validate consonants
+    if 'consonants.json' in str(json_file):
+        if not validate_consonants_schema(data):
+            schema_valid = False
+            errors.append(f"{rel_path}: Invalid consonants schema")
+    
+    # Validate syllables
+    if 'syllables.json' in str(json_file):
+        if isinstance(data, list):
+            for item in data:
+                if not validate_syllable_schema(item):
+                    schema_valid = False
+                    errors.append(f"{rel_path}: Invalid syllable schema for ID {item.get('id', 'unknown')}")
+    
+    # Validate prime roots (skip if it only contains comment)
+    if 'prime-roots' in str(json_file):
+        # Check if it's just a comment placeholder
+        if isinstance(data, dict) and '_comment' in data and len(data) == 1:
+            # This is just a placeholder comment, skip validation
+            result['line'] = f"{GREEN}✓{RESET} {rel_path} (placeholder)"
+            result['valid'] = True
+            return result
+        elif isinstance(data, dict):
+            if not validate_prime_root_schema(data):
+                schema_valid = False
+                missing_fields = [f for f in ['id', 'plain_name', 'syllable_id', 'gloss'] if f not in data]
+                errors.append(f"{rel_path}: Invalid prime root schema. Missing fields: {missing_fields}")
+    
+    # Validate derived roots
+    if 'derived-roots' in str(json_file):
+        if isinstance(data, dict):
+            if not validate_derived_root_schema(data):
+                schema_valid = False
+                missing_fields = [f for f in ['id', 'name', 'primeRootIds', 'gloss'] if f not in data]
+                errors.append(f"{rel_path}: Invalid derived root schema. Missing fields: {missing_fields}")
+    
+    if schema_valid:
+        result['line'] = f"{GREEN}✓{RESET} {rel_path}"
+        result['valid'] = True
+    
+    return result
+
+def main(argv=None):
     """Main validation function."""
+    parser = argparse.ArgumentParser(description="Validate the Igbo language data repository.")
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help="number of worker processes (0 = one per CPU, default: 1)"
+    )
+    parser.add_argument(
+        '--strict-refs', action='store_true',
+        help="treat dangling references as errors instead of warnings"
+    )
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     repo_root = Path(__file__).parent
     language_data = repo_root / 'language-data'
     
@@ -217,86 +521,57 @@ def main():
     
     # Track all IDs for reference checking
     all_ids = defaultdict(list)
+    parsed_phoneme_files = {}
     
-    # Validate each file
-    for json_file in sorted(json_files):
-        rel_path = json_file.relative_to(repo_root)
-        
-        # 1. Validate JSON syntax
-        is_valid, error = validate_json_syntax(json_file)
-        
-        if not is_valid:
-            errors.append(f"{rel_path}: Invalid JSON - {error}")
-            print(f"{RED}✗{RESET} {rel_path} - Invalid JSON")
-            continue
-        
-        # 2. Load and check data
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # 3. Check for duplicate IDs
-        duplicates = check_duplicate_ids(data, json_file)
-        if duplicates:
-            errors.append(f"{rel_path}: Duplicate IDs found: {duplicates}")
-            print(f"{RED}✗{RESET} {rel_path} - Duplicate IDs: {duplicates}")
-            continue
-        
-        # 4. Collect IDs for reference checking
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict) and 'id' in item:
-                    all_ids[item['id']].append(str(rel_path))
-        elif isinstance(data, dict) and 'id' in data:
-            all_ids[data['id']].append(str(rel_path))
-        
-        # 5. Schema validation (basic)
-        schema_valid = True
-        
-        # Validate vowels
-        if 'vowels.json' in str(json_file):
-            if not validate_vowels_schema(data):
-                schema_valid = False
-                errors.append(f"{rel_path}: Invalid vowels schema")
-        
-        # Validate consonants
-        if 'consonants.json' in str(json_file):
-            if not validate_consonants_schema(data):
-                schema_valid = False
-                errors.append(f"{rel_path}: Invalid consonants schema")
-        
-        # Validate syllables
-        if 'syllables.json' in str(json_file):
-            if isinstance(data, list):
-                for item in data:
-                    if not validate_syllable_schema(item):
-                        schema_valid = False
-                        errors.append(f"{rel_path}: Invalid syllable schema for ID {item.get('id', 'unknown')}")
-        
-        # Validate prime roots (skip if it only contains comment)
-        if 'prime-roots' in str(json_file):
-            # Check if it's just a comment placeholder
-            if isinstance(data, dict) and '_comment' in data and len(data) == 1:
-                # This is just a placeholder comment, skip validation
-                print(f"{GREEN}✓{RESET} {rel_path} (placeholder)")
-                success_count += 1
-                continue
-            elif isinstance(data, dict):
-                if not validate_prime_root_schema(data):
-                    schema_valid = False
-                    missing_fields = [f for f in ['id', 'plain_name', 'syllable_id', 'gloss'] if f not in data]
-                    errors.append(f"{rel_path}: Invalid prime root schema. Missing fields: {missing_fields}")
-        
-        # Validate derived roots
-        if 'derived-roots' in str(json_file):
-            if isinstance(data, dict):
-                if not validate_derived_root_schema(data):
-                    schema_valid = False
-                    missing_fields = [f for f in ['id', 'name', 'primeRootIds', 'gloss'] if f not in data]
-                    errors.append(f"{rel_path}: Invalid derived root schema. Missing fields: {missing_fields}")
-        
-        if schema_valid:
-            print(f"{GREEN}✓{RESET} {rel_path}")
+    # Validate files in parallel; map() keeps results in sorted file order
+    # so output and error lists are deterministic for any --jobs value
+    json_files = sorted(json_files)
+    if jobs > 1:
+        chunksize = max(1, len(json_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(validate_file, json_files, repeat(repo_root), chunksize=chunksize))
+    else:
+        results = [validate_file(json_file, repo_root) for json_file in json_files]
+    
+    for result in results:
+        if result['line']:
+            print(result['line'])
+        errors.extend(result['errors'])
+        if result['valid']:
             success_count += 1
+        for entry_id, index, offset in result['ids']:
+            all_ids[entry_id].append((result['path'], index, offset))
+        if result['data'] is not None:
+            parsed_phoneme_files[Path(result['path']).name] = result['data']
+    
+    # IDs must also be unique across files, since references resolve globally
+    for entry_id, locs in all_ids.items():
+        if len({path for path, _, _ in locs}) > 1:
+            where = ', '.join(format_location(*loc) for loc in locs)
+            errors.append(f"Duplicate ID '{entry_id}' across files: {where}")
+            print(f"{RED}✗{RESET} Duplicate ID '{entry_id}' across files: {where}")
+    
+    # Reference integrity
+    print()
+    print("=" * 60)
+    print("Reference Integrity")
+    print("=" * 60)
+    
+    checked, dangling = check_references(results, all_ids)
+    print(f"\nChecked {checked} references against {len(all_ids)} IDs")
+    
+    if not dangling:
+        print(f"  {GREEN}✓{RESET} All references resolve")
+    for (path, field), targets in sorted(dangling.items()):
+        distinct = list(dict.fromkeys(targets))
+        examples = ', '.join(distinct[:3]) + (', ...' if len(distinct) > 3 else '')
+        message = f"{path}: {len(targets)} dangling '{field}' reference(s) ({examples})"
+        if args.strict_refs:
+            print(f"  {RED}✗{RESET} {message}")
+            errors.append(message)
+        else:
+            print(f"  {YELLOW}⚠{RESET} {message}")
+            warnings.append(message)
     
     # Phoneme count validation
     print()
@@ -304,7 +579,11 @@ def main():
     print("Phoneme Count Validation")
     print("=" * 60)
     
-    count_success, counts, count_errors = validate_phoneme_counts(repo_root)
+    count_success, counts, count_errors = validate_phoneme_counts(
+        repo_root,
+        consonants_data=parsed_phoneme_files.get('consonants.json'),
+        vowels_data=parsed_phoneme_files.get('vowels.json')
+    )
     
     if count_success:
         print(f"\n{GREEN}Consonants:{RESET}")